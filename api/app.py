@@ -6,14 +6,15 @@ Serve estatísticas e dados das ofertas.
 import os
 from flask import Flask, jsonify, request
 from flask_cors import CORS
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import sys
 import json
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from database.models import Deal, db, init_database
+from database.models import (Deal, ReadOnlyDeal, ReadOnlyPriceDaily, read_db, archive_read_db, init_database,
+                             archive_summary, load_archived_deals, load_deal_stats, get_brazil_time)
 
 app = Flask(__name__, static_folder='../dashboard', static_url_path='')
 CORS(app)  # Enable CORS for frontend
@@ -22,6 +23,19 @@ CORS(app)  # Enable CORS for frontend
 init_database()
 
 
+@app.before_request
+def open_read_connection():
+    """Each request borrows a read-only connection from the pool."""
+    read_db.connect(reuse_if_open=True)
+
+
+@app.teardown_request
+def close_read_connection(exc):
+    """Returns the request's connection to the pool."""
+    if not read_db.is_closed():
+        read_db.close()
+
+
 @app.route('/')
 def index():
     """Serve the dashboard."""
@@ -32,33 +46,14 @@ def index():
 def get_stats():
     """Get statistics about deals."""
     try:
-        total_deals = Deal.select().count()
-        
-        # Calculate savings and average discount
-        deals = Deal.select()
-        total_savings = 0
-        total_discount = 0
-        count_with_discount = 0
-        
-        for deal in deals:
-            # Try to calculate savings from title or assume 20% average
-            # In a real scenario, you'd store old_price in the database
-            price = float(deal.price)  # Convert Decimal to float
-            estimated_old_price = price * 1.3  # Assume 30% discount average
-            savings = estimated_old_price - price
-            total_savings += savings
-            
-            discount = ((estimated_old_price - price) / estimated_old_price) * 100
-            total_discount += discount
-            count_with_discount += 1
-        
-        avg_discount = int(total_discount / count_with_discount) if count_with_discount > 0 else 0
+        # Summary row kept up to date by triggers on insert/update/delete
+        stats = load_deal_stats()
         
         return jsonify({
-            'total_deals': total_deals,
-            'sent_deals': total_deals,  # All deals in DB were sent
-            'total_savings': float(total_savings),
-            'avg_discount': avg_discount
+            'total_deals': stats['total_deals'],
+            'sent_deals': stats['total_deals'],  # All deals in DB were sent
+            'total_savings': stats['total_savings'],
+            'avg_discount': stats['avg_discount']
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -71,13 +66,13 @@ def get_deals():
     store = request.args.get('store')
     
     try:
-        query = Deal.select().order_by(Deal.sent_at.desc()).limit(50)
+        query = ReadOnlyDeal.select().order_by(ReadOnlyDeal.sent_at.desc()).limit(50)
         
         if category and category != 'Todas':
-            query = query.where(Deal.category == category)
+            query = query.where(ReadOnlyDeal.category == category)
             
         if store and store != 'Todas':
-            query = query.where(Deal.store == store)
+            query = query.where(ReadOnlyDeal.store == store)
             
         deals = query
         
@@ -86,7 +81,7 @@ def get_deals():
             try:
                 # Safe type conversion
                 price = float(deal.price) if deal.price else 0.0
-                old_price = price * 1.3
+                old_price = float(deal.old_price) if deal.old_price else None
                 
                 # Handle dates - convert to ISO format
                 if deal.sent_at:
@@ -111,6 +106,7 @@ def get_deals():
                     'title': str(deal.title),
                     'price': price,
                     'old_price': old_price,
+                    'discount_pct': deal.discount_pct,
                     'original_url': original_url,
                     'affiliate_url': affiliate_url,
                     'image_url': deal.image_url,
@@ -137,7 +133,7 @@ def get_categories():
     """Get list of distinct categories."""
     try:
         # Get distinct categories that are not null/empty
-        categories_query = Deal.select(Deal.category).distinct().order_by(Deal.category)
+        categories_query = ReadOnlyDeal.select(ReadOnlyDeal.category).distinct().order_by(ReadOnlyDeal.category)
         
         categories = []
         for c in categories_query:
@@ -150,6 +146,80 @@ def get_categories():
         return jsonify([])
 
 
+@app.route('/api/deals/<external_id>/history')
+def get_price_history(external_id):
+    """Get a product's daily price history (min/max/last per day) from the rollup."""
+    try:
+        days = int(request.args.get('days', 90))
+        # PriceDaily.day is a Brazil-local date
+        since = (get_brazil_time() - timedelta(days=days)).strftime('%Y-%m-%d')
+        query = (ReadOnlyPriceDaily
+                 .select()
+                 .where((ReadOnlyPriceDaily.external_id == external_id) & (ReadOnlyPriceDaily.day >= since))
+                 .order_by(ReadOnlyPriceDaily.day))
+        
+        history = [{
+            'day': row.day,
+            'min_price': row.min_cents / 100,
+            'max_price': row.max_cents / 100,
+            'last_price': row.last_cents / 100,
+            'observations': row.observations
+        } for row in query]
+        lowest_price = min((entry['min_price'] for entry in history), default=None)
+        
+        return jsonify({'external_id': external_id, 'days': days, 'lowest_price': lowest_price, 'history': history})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/archive')
+def get_archive():
+    """Get the number and date range of archived deals."""
+    try:
+        with archive_read_db.connection_context():
+            summary = archive_summary()
+        for key in ('oldest_sent_at', 'newest_sent_at'):
+            if summary[key]:
+                summary[key] = summary[key].isoformat()
+        return jsonify(summary)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/archive/deals')
+def get_archived_deals():
+    """Rehydrate archived deals sent in a date range (?from=YYYY-MM-DD&to=YYYY-MM-DD, 'to' excluded)."""
+    try:
+        if not request.args.get('from'):
+            return jsonify({'error': 'Missing from parameter'}), 400
+        try:
+            start = datetime.strptime(request.args['from'], '%Y-%m-%d')
+            end = datetime.strptime(request.args['to'], '%Y-%m-%d') if request.args.get('to') else None
+        except ValueError:
+            return jsonify({'error': 'Dates must be YYYY-MM-DD'}), 400
+        limit = min(int(request.args.get('limit', 500)), 5000)
+        
+        with archive_read_db.connection_context():
+            rows = load_archived_deals(start, end, limit=limit)
+        
+        deals_list = [{
+            'id': row['id'],
+            'external_id': row['external_id'],
+            'title': row['title'],
+            'price': float(row['price']) if row['price'] else 0.0,
+            'original_url': row['original_url'],
+            'affiliate_url': row['affiliate_url'] or row['original_url'],
+            'image_url': row['image_url'],
+            'category': row['category'],
+            'store': row['store'],
+            'sent_at': row['sent_at'].isoformat() if row['sent_at'] else None,
+            'archived_at': row['archived_at'].isoformat() if row['archived_at'] else None
+        } for row in rows]
+        return jsonify(deals_list)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/config')
 def get_config():
     """Get bot configuration status."""
@@ -159,7 +229,7 @@ def get_config():
         ai_configured = bool(os.getenv('GROQ_API_KEY')) and os.getenv('GROQ_API_KEY') != 'sua_chave_groq_aqui'
         
         # Get last deal time as last run
-        last_deal = Deal.select().order_by(Deal.sent_at.desc()).first()
+        last_deal = ReadOnlyDeal.select().order_by(ReadOnlyDeal.sent_at.desc()).first()
         last_run = last_deal.sent_at.isoformat() if last_deal else None
         
         return jsonify({
@@ -306,8 +376,15 @@ def update_urls():
         if not data or 'urls_to_monitor' not in data:
             return jsonify({'error': 'Invalid data format'}), 400
         
+        # Keep per-URL settings (max_pages...) that the dashboard does not edit
+        config = {}
+        if os.path.exists(urls_config_file):
+            with open(urls_config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        config.update(data)
+        
         with open(urls_config_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"URLs saved successfully!")
         return jsonify({'status': 'success', 'message': 'URLs updated successfully'})
@@ -317,6 +394,61 @@ def update_urls():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/urls/stats', methods=['GET'])
+def get_urls_stats():
+    """Get per-URL listing fingerprint stats (pages checked / skipped as unchanged)."""
+    try:
+        stats_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'listing_fingerprints.json')
+        
+        if not os.path.exists(stats_file):
+            return jsonify({})
+        
+        with open(stats_file, 'r', encoding='utf-8') as f:
+            fingerprints = json.load(f)
+        
+        stats = {}
+        for url, entry in fingerprints.items():
+            stats[url] = {
+                'checks': entry.get('checks', 0),
+                'skips': entry.get('skips', 0),
+                'last_checked_at': entry.get('last_checked_at'),
+                'changed_at': entry.get('changed_at')
+            }
+        return jsonify(stats)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/parser/selectors', methods=['GET'])
+def get_selector_stats():
+    """Get parser selector cascade diagnostics (which selector wins per site/layout)."""
+    try:
+        stats_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'selector_stats.json')
+
+        if not os.path.exists(stats_file):
+            return jsonify({})
+
+        with open(stats_file, 'r', encoding='utf-8') as f:
+            selector_stats = json.load(f)
+
+        # Keys are "site|cascade|layout"
+        diagnostics = {}
+        for key, entry in selector_stats.items():
+            site, cascade, layout = key.split('|', 2)
+            hits = entry.get('hits', {})
+            total = sum(hits.values()) + entry.get('misses', 0)
+            diagnostics.setdefault(site, {}).setdefault(cascade, {})[layout] = {
+                'winner': entry.get('winner'),
+                'hits': dict(sorted(hits.items(), key=lambda item: item[1], reverse=True)),
+                'misses': entry.get('misses', 0),
+                'hit_rate': round(sum(hits.values()) / total, 3) if total else None,
+                'winner_changed_at': entry.get('winner_changed_at'),
+                'last_hit_at': entry.get('last_hit_at'),
+                'last_miss_at': entry.get('last_miss_at')
+            }
+        return jsonify(diagnostics)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
@@ -0,0 +1,99 @@
+"""
+Compares HTML parser backends on saved listing pages.
+Each backend runs in its own process so peak RSS is not shared between them.
+
+Usage:
+    python benchmarks/parser_backends.py [pagina.html ...] [--url URL] [--repeat N] [--partial]
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.services.html_backend import BACKENDS, is_backend_available  # noqa: E402
+
+DEFAULT_PAGES = os.path.join(ROOT_DIR, 'fixtures', 'http_tier', 'ml_listing.html')
+DEFAULT_URL = 'https://lista.mercadolivre.com.br/ofertas'
+
+
+def run_backend(backend, pages, url, repeat, partial=False):
+    """Parses every page 'repeat' times with one backend and returns its measurements."""
+    from src.services.html_backend import parse_document
+    from src.services.parser import parse_mercadolivre, parse_shopee, slice_results_region
+
+    site = 'shopee' if 'shopee.com' in url else 'mercadolivre'
+    parse_cards = parse_shopee if site == 'shopee' else parse_mercadolivre
+    documents = []
+    for path in pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        documents.append((slice_results_region(html, site) or html) if partial else html)
+
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    deals = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in documents:
+            deals += len(parse_cards(parse_document(html, backend)))
+    elapsed = time.perf_counter() - started
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    runs = repeat * len(documents)
+    return {
+        'backend': backend,
+        'pages': runs,
+        'deals_per_page': deals / runs if runs else 0,
+        'ms_per_page': elapsed * 1000 / runs if runs else 0,
+        'python_peak_kb': python_peak // 1024,
+        'rss_growth_kb': rss_after_kb - rss_before_kb,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pages', nargs='*', help='Saved HTML pages (default: fixtures)')
+    parser.add_argument('--url', default=DEFAULT_URL, help='Source URL (selects the ML or Shopee parser)')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--partial', action='store_true', help='Parse only the results region')
+    parser.add_argument('--backend', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    pages = [p for pattern in (args.pages or [DEFAULT_PAGES]) for p in glob.glob(pattern)]
+    if not pages:
+        parser.error('no pages found')
+
+    # Child mode: measure one backend and print JSON
+    if args.backend:
+        print(json.dumps(run_backend(args.backend, pages, args.url, args.repeat, args.partial)))
+        return
+
+    print(f"{len(pages)} page(s) x {args.repeat} runs{' (partial parse)' if args.partial else ''}\n")
+    print(f"{'backend':<12} {'ms/page':>9} {'deals/page':>11} {'py peak KB':>11} {'RSS +KB':>9}")
+    for backend in BACKENDS:
+        if not is_backend_available(backend):
+            print(f"{backend:<12} (not installed)")
+            continue
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), *pages, '--url', args.url,
+             '--repeat', str(args.repeat), '--backend', backend] + (['--partial'] if args.partial else []),
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{backend:<12} {result['ms_per_page']:>9.2f} {result['deals_per_page']:>11.1f} "
+              f"{result['python_peak_kb']:>11} {result['rss_growth_kb']:>9}")
+
+
+if __name__ == "__main__":
+    main()
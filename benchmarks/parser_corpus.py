@@ -0,0 +1,180 @@
+"""
+Parser benchmark and regression runner over the versioned page corpus.
+Runs extract_deals_from_html offline on every saved page and reports parse
+time (ms/page, ms/card), allocations and field-level accuracy against the
+golden deals, as JSON.
+
+Usage:
+    python benchmarks/parser_corpus.py [--corpus v1] [--backend lxml] [--repeat 20] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'corpus')
+sys.path.insert(0, ROOT_DIR)
+
+from src.services.html_backend import get_default_backend  # noqa: E402
+from src.services.parser import extract_deals_from_html  # noqa: E402
+from src.services.selector_cascade import SelectorStats, set_selector_stats  # noqa: E402
+from src.utils.logger import logger  # noqa: E402
+
+FIELDS = ('title', 'new_price', 'old_price', 'original_url', 'image_url', 'category')
+PRICE_FIELDS = ('new_price', 'old_price')
+
+
+def load_corpus(version: str = 'v1'):
+    """Returns the corpus manifest with each page's HTML and golden deals loaded."""
+    corpus_dir = os.path.join(CORPUS_DIR, version)
+    with open(os.path.join(corpus_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    for page in manifest['pages']:
+        with open(os.path.join(corpus_dir, page['file']), 'r', encoding='utf-8') as f:
+            page['html'] = f.read()
+        with open(os.path.join(corpus_dir, page['golden']), 'r', encoding='utf-8') as f:
+            page['expected'] = json.load(f)
+    return manifest
+
+
+def _field_matches(field, actual, expected):
+    if field in PRICE_FIELDS:
+        return round(float(actual or 0), 2) == round(float(expected or 0), 2)
+    return (actual or None) == (expected or None)
+
+
+def score_deals(deals, expected):
+    """
+    Compares parsed deals with the golden ones (matched by original_url).
+
+    Returns:
+        Dict with per-field correct counts, expected/found counts and the
+        URLs that were missing or unexpected
+    """
+    by_url = {deal.get('original_url'): deal for deal in deals}
+    correct = {field: 0 for field in FIELDS}
+    missing = []
+    for golden in expected:
+        deal = by_url.get(golden['original_url'])
+        if deal is None:
+            missing.append(golden['original_url'])
+            continue
+        for field in FIELDS:
+            if _field_matches(field, deal.get(field), golden.get(field)):
+                correct[field] += 1
+
+    expected_urls = {golden['original_url'] for golden in expected}
+    return {
+        'expected': len(expected),
+        'found': len(deals),
+        'correct': correct,
+        'missing': missing,
+        'unexpected': [url for url in by_url if url not in expected_urls],
+    }
+
+
+def run_page(page, repeat, backend=None):
+    """Benchmarks one corpus page; the accuracy comes from the first run."""
+    deals = [deal.to_dict() for deal in extract_deals_from_html(page['html'], page['url'], backend=backend)]
+    score = score_deals(deals, page['expected'])
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        extract_deals_from_html(page['html'], page['url'], backend=backend)
+    ms_per_page = (time.perf_counter() - started) * 1000 / repeat
+
+    # Separate traced run: tracemalloc slows parsing down
+    tracemalloc.start()
+    extract_deals_from_html(page['html'], page['url'], backend=backend)
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocations = sum(stat.count for stat in snapshot.statistics('filename'))
+
+    return {
+        'id': page['id'],
+        'layout': page['layout'],
+        'html_kb': round(len(page['html']) / 1024, 1),
+        'cards': len(deals),
+        'ms_per_page': round(ms_per_page, 3),
+        'ms_per_card': round(ms_per_page / len(deals), 4) if deals else None,
+        'peak_alloc_kb': round(peak / 1024, 1),
+        'live_allocations': allocations,
+        'accuracy': {
+            field: round(score['correct'][field] / score['expected'], 4) if score['expected'] else None
+            for field in FIELDS
+        },
+        'missing': score['missing'],
+        'unexpected': score['unexpected'],
+        '_score': score,
+    }
+
+
+def run_corpus(version='v1', repeat=20, backend=None):
+    """Runs the whole corpus and returns the JSON-serializable report."""
+    manifest = load_corpus(version)
+
+    # Keep the corpus out of the production selector statistics
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        previous_stats = set_selector_stats(SelectorStats(os.path.join(tmp_dir, 'selector_stats.json')))
+        try:
+            pages = [run_page(page, repeat, backend) for page in manifest['pages']]
+        finally:
+            set_selector_stats(previous_stats)
+
+    expected = sum(page['_score']['expected'] for page in pages)
+    cards = sum(page['cards'] for page in pages)
+    total_ms = sum(page['ms_per_page'] for page in pages)
+    summary = {
+        'pages': len(pages),
+        'cards': cards,
+        'ms_per_page': round(total_ms / len(pages), 3) if pages else None,
+        'ms_per_card': round(total_ms / cards, 4) if cards else None,
+        'peak_alloc_kb': max((page['peak_alloc_kb'] for page in pages), default=0),
+        'accuracy': {
+            field: round(sum(page['_score']['correct'][field] for page in pages) / expected, 4) if expected else None
+            for field in FIELDS
+        },
+    }
+    for page in pages:
+        del page['_score']
+
+    return {
+        'corpus': version,
+        'corpus_version': manifest['version'],
+        'backend': backend or get_default_backend(),
+        'repeat': repeat,
+        'python': sys.version.split()[0],
+        'timestamp': time.time(),
+        'summary': summary,
+        'pages': pages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parser benchmark over the saved page corpus')
+    parser.add_argument('--corpus', default='v1', help='Corpus version directory under benchmarks/corpus')
+    parser.add_argument('--backend', help='Parser backend (default: config.json)')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+    args = parser.parse_args()
+
+    # Logging would dominate the timings (and mix with the JSON on stdout)
+    logger.remove()
+    report = run_corpus(args.corpus, args.repeat, args.backend)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Concurrent read/write benchmark for data/deals.db access modes.
+A writer thread inserts deals (like the bot) while reader threads run the
+dashboard queries (like api/app.py), first with a plain SQLite connection
+(rollback journal) and then with the WAL pragmas and the read-only pool.
+Reports writes/s, reads/s and "database is locked" errors per mode, as JSON.
+
+Usage:
+    python benchmarks/sqlite_concurrency.py [--seconds 5] [--readers 4] [--rows 20000] [--batch 1]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from peewee import OperationalError, SqliteDatabase  # noqa: E402
+from playhouse.pool import PooledSqliteDatabase  # noqa: E402
+
+from src.database.models import Deal, ReadOnlyDeal, get_brazil_time, open_database, open_read_pool  # noqa: E402
+
+
+def _row(index: int):
+    return {'external_id': f"MLB{index}", 'title': f"Produto de teste {index}", 'price': 100 + index % 500,
+            'original_url': f"https://produto.mercadolivre.com.br/MLB-{index}", 'category': 'Outros',
+            'store': 'Mercado Livre', 'sent_at': get_brazil_time()}
+
+
+def _dashboard_queries():
+    # /stats, /deals and /config as the API runs them
+    ReadOnlyDeal.select().count()
+    list(ReadOnlyDeal.select().order_by(ReadOnlyDeal.sent_at.desc()).limit(50))
+    sum(float(deal.price) for deal in ReadOnlyDeal.select(ReadOnlyDeal.price))
+
+
+def run_mode(mode: str, seconds: float, readers: int, rows: int, batch: int):
+    """Runs one access mode on a fresh database and returns its throughput."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'deals.db')
+        if mode == 'tuned':
+            writer_db = open_database(path)
+            reader_db = open_read_pool(path, max_connections=readers)
+        else:
+            writer_db = SqliteDatabase(path)
+            reader_db = SqliteDatabase(path)
+
+        previous = (Deal._meta.database, ReadOnlyDeal._meta.database)
+        Deal.bind(writer_db)
+        ReadOnlyDeal.bind(reader_db)
+        try:
+            writer_db.create_tables([Deal])
+            with writer_db.atomic():
+                for start in range(0, rows, 100):
+                    Deal.insert_many([_row(i) for i in range(start, min(rows, start + 100))]).execute()
+
+            stop = threading.Event()
+            counts = {'writes': 0, 'reads': 0, 'locked': 0}
+            lock = threading.Lock()
+
+            def count(key, amount=1):
+                with lock:
+                    counts[key] += amount
+
+            def writer():
+                index = rows
+                while not stop.is_set():
+                    try:
+                        with writer_db.atomic():
+                            Deal.insert_many([_row(i) for i in range(index, index + batch)]).execute()
+                        index += batch
+                        count('writes', batch)
+                    except OperationalError:
+                        count('locked')
+
+            def reader():
+                reader_db.connect(reuse_if_open=True)
+                try:
+                    while not stop.is_set():
+                        try:
+                            _dashboard_queries()
+                            count('reads')
+                        except OperationalError:
+                            count('locked')
+                finally:
+                    reader_db.close()
+
+            threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+            for thread in threads:
+                thread.start()
+            time.sleep(seconds)
+            stop.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            writer_db.close()
+            if isinstance(reader_db, PooledSqliteDatabase):
+                reader_db.close_all()
+            Deal.bind(previous[0])
+            ReadOnlyDeal.bind(previous[1])
+
+    return {
+        'mode': mode,
+        'writes_per_s': round(counts['writes'] / seconds, 1),
+        'dashboard_reads_per_s': round(counts['reads'] / seconds, 1),
+        'locked_errors': counts['locked'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent SQLite read/write benchmark')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=4, help='Dashboard reader threads')
+    parser.add_argument('--rows', type=int, default=20000, help='Deals in the table before the run')
+    parser.add_argument('--batch', type=int, default=1, help='Deals per write transaction')
+    args = parser.parse_args()
+
+    report = {
+        'seconds': args.seconds,
+        'readers': args.readers,
+        'rows': args.rows,
+        'batch': args.batch,
+        'results': [run_mode(mode, args.seconds, args.readers, args.rows, args.batch)
+                    for mode in ('default', 'tuned')],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,11 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from fake_useragent import UserAgent
+from ..services.resource_blocking import apply_blocking_profile
 from ..utils.logger import logger
 
 
-def setup_driver(headless: bool = True) -> webdriver.Chrome:
+def setup_driver(headless: bool = True, block_resources: bool = False, blocked_url_patterns: dict = None) -> webdriver.Chrome:
     """
     Setup Chrome WebDriver with maximum stealth configuration.
     
@@ -20,9 +21,12 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     2. Disabled automation flags
     3. Realistic user agent
     4. Various anti-detection measures
+    5. Optional blocking of images, fonts, media and analytics (CDP)
     
     Args:
         headless: Whether to run in headless mode (default: True)
+        block_resources: Block heavy/tracking requests via Network.setBlockedURLs
+        blocked_url_patterns: Extra patterns, {"default": [...], "<site>": [...]}
         
     Returns:
         Configured Chrome WebDriver instance
@@ -95,6 +99,10 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
         })
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # 11. Resource blocking profile (call apply_blocking_profile again per site)
+        if block_resources:
+            apply_blocking_profile(driver, '', blocked_url_patterns)
+        
         logger.info("Chrome WebDriver setup completed successfully")
         return driver
         
@@ -1,4 +1,8 @@
 """Database package initialization."""
-from .models import init_database, Deal, is_deal_processed, save_deal
+from .models import (init_database, Deal, is_deal_processed, save_deal, update_deal_price, load_deal_prices,
+                     load_processed_index, get_processed_index, filter_unprocessed, save_deals_bulk,
+                     record_price_observations, load_all_time_lows)
 
-__all__ = ['init_database', 'Deal', 'is_deal_processed', 'save_deal']
+__all__ = ['init_database', 'Deal', 'is_deal_processed', 'save_deal', 'update_deal_price', 'load_deal_prices',
+           'load_processed_index', 'get_processed_index', 'filter_unprocessed', 'save_deals_bulk',
+           'record_price_observations', 'load_all_time_lows']
@@ -0,0 +1,104 @@
+"""
+Versioned schema migrations.
+Each database keeps the applied versions in a schema_version table; on startup
+one query reads the current version and only newer steps run, in order.
+Steps must be idempotent: the bot and the API may start at the same time.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+
+from loguru import logger  # database/ is also imported as a top-level package by the API
+from peewee import Database, OperationalError
+
+SCHEMA_VERSION_TABLE = 'schema_version'
+BACKFILL_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema step; apply(database) runs once per database."""
+    version: int
+    description: str
+    apply: Callable[[Database], None]
+
+
+def current_version(database: Database) -> int:
+    """Highest applied version (0 for a database without schema_version)."""
+    try:
+        return database.execute_sql(f'SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}').fetchone()[0] or 0
+    except OperationalError:
+        return 0
+
+
+def migrate(database: Database, migrations: Sequence[Migration]) -> List[int]:
+    """
+    Applies the pending migrations in version order.
+
+    Args:
+        database: Database to migrate
+        migrations: Every step of the database, oldest first
+
+    Returns:
+        Versions applied by this call (empty when already up to date)
+    """
+    version = current_version(database)
+    pending = sorted((m for m in migrations if m.version > version), key=lambda m: m.version)
+    if not pending:
+        return []
+
+    database.execute_sql(
+        f'CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ('
+        'version INTEGER PRIMARY KEY, description TEXT NOT NULL, '
+        "applied_at TEXT NOT NULL DEFAULT (datetime('now')))"
+    )
+    applied = []
+    for migration in pending:
+        migration.apply(database)
+        with database.atomic():
+            database.execute_sql(
+                f'INSERT OR IGNORE INTO {SCHEMA_VERSION_TABLE} (version, description) VALUES (?, ?)',
+                (migration.version, migration.description)
+            )
+        logger.info(f"Applied migration {migration.version} to {database.database}: {migration.description}")
+        applied.append(migration.version)
+    return applied
+
+
+def add_column(database: Database, table: str, column: str, definition: str) -> bool:
+    """
+    Adds a column unless it already exists.
+
+    Returns:
+        True if the column was added
+    """
+    with database.atomic():
+        if any(col.name == column for col in database.get_columns(table)):
+            return False
+        database.execute_sql(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+        return True
+
+
+def backfill(database: Database, table: str, assignments: str, where: str, params: Sequence = (),
+             batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    Runs UPDATE table SET assignments WHERE where in short transactions.
+
+    The where clause must stop matching updated rows, otherwise the loop
+    never ends. Each batch commits on its own so the other process only
+    waits for one batch, never for the whole backfill.
+
+    Returns:
+        Number of updated rows
+    """
+    updated = 0
+    while True:
+        with database.atomic():
+            cursor = database.execute_sql(
+                f'UPDATE {table} SET {assignments} WHERE rowid IN '
+                f'(SELECT rowid FROM {table} WHERE {where} LIMIT {int(batch_size)})',
+                tuple(params)
+            )
+        if cursor.rowcount <= 0:
+            return updated
+        updated += cursor.rowcount
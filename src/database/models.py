@@ -1,12 +1,20 @@
 """
 Database models using Peewee ORM with SQLite.
-Handles deal storage and deduplication.
+Handles deal storage and deduplication. The bot writes through a WAL-mode
+connection; the dashboard API reads through a pool of read-only connections
+so its queries never block the bot's inserts.
 """
 
 from peewee import *
+from playhouse.pool import PooledSqliteDatabase
 from datetime import datetime, timezone, timedelta
+from typing import Dict, List
+from urllib.request import pathname2url
 import os
 
+from .id_index import ProcessedIdIndex
+from .migrations import Migration, add_column, backfill, migrate
+
 # Brazilian timezone (UTC-3)
 BRAZIL_TZ = timezone(timedelta(hours=-3))
 
@@ -19,9 +27,68 @@ base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 data_dir = os.path.join(base_dir, 'data')
 os.makedirs(data_dir, exist_ok=True)
 
-# Database connection
+# Wait this long for a lock before raising "database is locked"
+BUSY_TIMEOUT_SECONDS = 10
+
+# WAL: readers and the writer no longer block each other. synchronous=NORMAL
+# skips the fsync per commit (WAL stays consistent, only the last commits
+# can be lost on power failure).
+WRITE_PRAGMAS = (
+    ('auto_vacuum', 'incremental'),       # New files only (before WAL writes the header)
+    ('journal_mode', 'wal'),
+    ('synchronous', 'normal'),
+    ('cache_size', -16 * 1024),           # 16 MB page cache
+    ('mmap_size', 256 * 1024 * 1024),     # Reads served from the page cache mapping
+    ('temp_store', 'memory'),
+    ('busy_timeout', BUSY_TIMEOUT_SECONDS * 1000),
+)
+READ_PRAGMAS = (
+    ('cache_size', -8 * 1024),
+    ('mmap_size', 256 * 1024 * 1024),
+    ('busy_timeout', BUSY_TIMEOUT_SECONDS * 1000),
+)
+
+
+def open_database(path: str) -> SqliteDatabase:
+    """Read-write connection with the WAL pragmas (one per thread)."""
+    return SqliteDatabase(path, pragmas=WRITE_PRAGMAS, timeout=BUSY_TIMEOUT_SECONDS)
+
+
+def open_read_pool(path: str, max_connections: int = 8) -> PooledSqliteDatabase:
+    """
+    Pool of read-only connections to an existing database.
+    
+    Args:
+        path: Database file
+        max_connections: Connections kept open for reuse across threads
+        
+    Returns:
+        Pooled database; connect() takes a connection (waiting up to
+        BUSY_TIMEOUT_SECONDS when all are in use), close() returns it
+    """
+    return PooledSqliteDatabase(
+        f"file:{pathname2url(os.path.abspath(path))}?mode=ro",
+        uri=True,
+        pragmas=READ_PRAGMAS,
+        max_connections=max_connections,
+        stale_timeout=300,
+        timeout=BUSY_TIMEOUT_SECONDS,
+        check_same_thread=False
+    )
+
+
+# Database connections
 db_path = os.path.join(data_dir, 'deals.db')
-db = SqliteDatabase(db_path)
+db = open_database(db_path)
+read_db = open_read_pool(db_path)
+
+# Cold storage: deals older than the retention period (see retention.py)
+archive_db_path = os.path.join(data_dir, 'deals_archive.db')
+archive_db = open_database(archive_db_path)
+archive_read_db = open_read_pool(archive_db_path, max_connections=2)
+
+# Bound parameters per statement stay under SQLite's historical limit of 999
+MAX_SQL_VARIABLES = 900
 
 
 class BaseModel(Model):
@@ -39,6 +106,8 @@ class Deal(BaseModel):
         external_id: Unique identifier from the source platform (Shopee/ML)
         title: Deal title/product name
         price: Current price
+        old_price: Price before the discount (None if the card had none)
+        discount_pct: Discount over old_price in percent (None if unknown)
         original_url: Original product URL
         affiliate_url: Generated affiliate URL
         sent_at: Timestamp when deal was sent to Telegram
@@ -47,6 +116,8 @@ class Deal(BaseModel):
     external_id = CharField(unique=True, index=True)
     title = CharField()
     price = DecimalField(max_digits=10, decimal_places=2)
+    old_price = DecimalField(max_digits=10, decimal_places=2, null=True)
+    discount_pct = FloatField(null=True)
     original_url = TextField()
     affiliate_url = TextField(null=True)
     image_url = TextField(null=True)
@@ -60,9 +131,121 @@ class Deal(BaseModel):
             (('external_id',), True),  # Unique index for deduplication
             (('category',), False),    # Index for filtering
             (('store',), False),       # Index for filtering by store
+            (('sent_at',), False),     # Dashboard listing order and retention cutoff
+        )
+
+
+class ReadOnlyDeal(Deal):
+    """Deal bound to the read-only pool (dashboard queries)."""
+    class Meta:
+        database = read_db
+        table_name = 'deals'
+
+
+class ArchivedDeal(Deal):
+    """
+    Deal moved to data/deals_archive.db by the retention job.
+    The archive numbers its rows itself: hot ids are reused by SQLite once
+    deals.db is emptied, so rows are matched on external_id only.
+    """
+    id = AutoField(primary_key=True)
+    archived_at = DateTimeField(default=get_brazil_time)
+    
+    class Meta:
+        database = archive_db
+        table_name = 'deals'
+        indexes = (
+            (('external_id',), True),
+            (('sent_at',), False),     # Rehydration by date range
+        )
+
+
+class ReadOnlyArchivedDeal(ArchivedDeal):
+    """ArchivedDeal bound to the archive's read-only pool (dashboard queries)."""
+    class Meta:
+        database = archive_read_db
+        table_name = 'deals'
+
+
+class PriceObservation(BaseModel):
+    """
+    One price seen for a product in one cycle (append-only).
+    
+    Fields:
+        external_id: Product ID (same as Deal.external_id)
+        observed_at: Unix timestamp (seconds)
+        price_cents: Current price in cents
+        old_price_cents: Listed price before discount in cents (0 if none)
+    """
+    external_id = CharField()
+    observed_at = IntegerField()
+    price_cents = IntegerField()
+    old_price_cents = IntegerField(default=0)
+    
+    class Meta:
+        table_name = 'price_observations'
+        # Clustered by product: history of one product is a contiguous range
+        primary_key = CompositeKey('external_id', 'observed_at')
+        without_rowid = True
+
+
+class PriceDaily(BaseModel):
+    """
+    Daily rollup of price_observations, maintained on insert.
+    All-time lows and history charts read this table instead of the raw rows.
+    """
+    external_id = CharField()
+    day = CharField()  # YYYY-MM-DD (Brazil time)
+    min_cents = IntegerField()
+    max_cents = IntegerField()
+    last_cents = IntegerField()
+    observations = IntegerField(default=1)
+    
+    class Meta:
+        table_name = 'price_daily'
+        primary_key = CompositeKey('external_id', 'day')
+        without_rowid = True
+        indexes = (
+            (('day',), False),  # Range scans for retention/rollup queries
         )
 
 
+class ReadOnlyPriceDaily(PriceDaily):
+    """PriceDaily bound to the read-only pool (dashboard queries)."""
+    class Meta:
+        database = read_db
+        table_name = 'price_daily'
+
+
+class DealStats(BaseModel):
+    """
+    Running totals of the deals table in a single row (id 1).
+    Created and kept up to date by the triggers of migration 3, so the
+    dashboard reads its statistics without scanning deals.
+    
+    Fields:
+        deal_count: Rows in deals
+        deals_with_discount: Rows with a known discount_pct
+        savings_total: Sum of old_price - price over discounted rows
+        discount_pct_total: Sum of discount_pct (average = total / deals_with_discount)
+    """
+    id = IntegerField(primary_key=True)
+    deal_count = IntegerField(default=0)
+    deals_with_discount = IntegerField(default=0)
+    savings_total = FloatField(default=0)
+    discount_pct_total = FloatField(default=0)
+    
+    class Meta:
+        table_name = 'deal_stats'
+
+
+class ReadOnlyDealStats(DealStats):
+    """DealStats bound to the read-only pool (dashboard queries)."""
+    class Meta:
+        database = read_db
+        table_name = 'deal_stats'
+
+
 class Coupon(BaseModel):
     """
     Coupon model for tracking generated ML affiliate coupons.
@@ -101,33 +284,136 @@ class Coupon(BaseModel):
         )
 
 
+def _create_deal_tables(database):
+    if database.table_exists('deals'):
+        # Columns added after the first release (before create_tables indexes them)
+        add_column(database, 'deals', 'image_url', 'TEXT')
+        add_column(database, 'deals', 'category', "TEXT DEFAULT 'Outros'")
+        add_column(database, 'deals', 'store', "TEXT DEFAULT 'Outros'")
+    tables = [Deal, Coupon, PriceObservation, PriceDaily]
+    with database.bind_ctx(tables):
+        database.create_tables(tables, safe=True)
+
+
+def _create_archive_table(database):
+    with database.bind_ctx([ArchivedDeal]):
+        database.create_tables([ArchivedDeal], safe=True)
+
+
+def _backfill_store(database):
+    # Rows saved before store detection kept the 'Outros' default
+    for domain, store in (('mercadolivre.com', 'Mercado Livre'), ('shopee.com', 'Shopee')):
+        backfill(database, 'deals', 'store = ?', "(store IS NULL OR store = 'Outros') AND original_url LIKE ?",
+                 (store, f'%{domain}%'))
+
+
+def _add_discount_columns(database):
+    add_column(database, 'deals', 'old_price', 'DECIMAL(10, 2)')
+    add_column(database, 'deals', 'discount_pct', 'REAL')
+
+
+# Contribution of one deals row (NEW or OLD) to each deal_stats total
+_STATS_TERMS = {
+    'deal_count': '1',
+    'deals_with_discount': 'COALESCE({row}.discount_pct, 0) > 0',
+    'savings_total': 'CASE WHEN {row}.old_price > {row}.price THEN {row}.old_price - {row}.price ELSE 0 END',
+    'discount_pct_total': 'COALESCE({row}.discount_pct, 0)',
+}
+
+
+def _stats_update(*changes: str) -> str:
+    """UPDATE deal_stats adding (+NEW) and/or subtracting (-OLD) one row's terms."""
+    assignments = ', '.join(
+        f"{column} = {column}" + ''.join(f" {change[0]} ({term.format(row=change[1:])})" for change in changes)
+        for column, term in _STATS_TERMS.items()
+    )
+    return f'UPDATE deal_stats SET {assignments} WHERE id = 1;'
+
+
+def _create_deal_stats(database):
+    _add_discount_columns(database)
+    with database.atomic():
+        database.execute_sql(
+            'CREATE TABLE IF NOT EXISTS deal_stats (id INTEGER PRIMARY KEY CHECK (id = 1), '
+            'deal_count INTEGER NOT NULL DEFAULT 0, deals_with_discount INTEGER NOT NULL DEFAULT 0, '
+            'savings_total REAL NOT NULL DEFAULT 0, discount_pct_total REAL NOT NULL DEFAULT 0)'
+        )
+        database.execute_sql('CREATE TRIGGER IF NOT EXISTS deal_stats_insert AFTER INSERT ON deals BEGIN '
+                             f'{_stats_update("+NEW")} END')
+        database.execute_sql('CREATE TRIGGER IF NOT EXISTS deal_stats_delete AFTER DELETE ON deals BEGIN '
+                             f'{_stats_update("-OLD")} END')
+        database.execute_sql('CREATE TRIGGER IF NOT EXISTS deal_stats_update '
+                             'AFTER UPDATE OF price, old_price, discount_pct ON deals BEGIN '
+                             f'{_stats_update("-OLD", "+NEW")} END')
+        # Seeded in the same transaction as the triggers, so no insert is missed or counted twice
+        totals = ', '.join(f"COALESCE(SUM({term.format(row='deals')}), 0)" for term in _STATS_TERMS.values())
+        database.execute_sql(f'INSERT OR IGNORE INTO deal_stats SELECT 1, {totals} FROM deals')
+
+
+# Ordered schema steps of deals.db; append new steps, never edit applied ones
+MIGRATIONS = [
+    Migration(1, 'Create tables and legacy deal columns', _create_deal_tables),
+    Migration(2, 'Backfill deal store from original_url', _backfill_store),
+    Migration(3, 'Deal old_price/discount_pct columns and deal_stats summary row', _create_deal_stats),
+]
+
+ARCHIVE_MIGRATIONS = [
+    Migration(1, 'Create archived deals table', _create_archive_table),
+    Migration(2, 'Backfill archived deal store from original_url', _backfill_store),
+    Migration(3, 'Archived deal old_price/discount_pct columns', _add_discount_columns),
+]
+
+
 def init_database():
-    """Initialize database and create tables if they don't exist."""
+    """
+    Initialize the database and apply pending schema migrations.
+    An up-to-date database costs one query per file.
+    """
     db.connect()
-    db.create_tables([Deal, Coupon], safe=True)
-    
-    # Simple migrations
-    try:
-        db.execute_sql('ALTER TABLE deals ADD COLUMN image_url TEXT')
-    except Exception:
-        pass
-        
-    try:
-        db.execute_sql('ALTER TABLE deals ADD COLUMN category TEXT DEFAULT "Outros"')
-    except Exception:
-        pass
-
-    try:
-        db.execute_sql('ALTER TABLE deals ADD COLUMN store TEXT DEFAULT "Outros"')
-    except Exception:
-        pass
-        
+    migrate(db, MIGRATIONS)
+    migrate(archive_db, ARCHIVE_MIGRATIONS)
     return db
 
 
+def _deal_exists(external_id: str) -> bool:
+    # Archived deals still count as processed
+    return (Deal.select().where(Deal.external_id == external_id).exists()
+            or ArchivedDeal.select().where(ArchivedDeal.external_id == external_id).exists())
+
+
+def _iter_processed_ids():
+    for model in (Deal, ArchivedDeal):
+        for row in model.select(model.external_id).tuples().iterator():
+            yield row[0]
+
+
+_processed_index = ProcessedIdIndex(
+    load_ids=_iter_processed_ids,
+    confirm=_deal_exists,
+    count_ids=lambda: Deal.select().count() + ArchivedDeal.select().count()
+)
+
+
+def get_processed_index() -> ProcessedIdIndex:
+    """In-memory index of processed external_ids (loaded on first use or by load_processed_index)."""
+    return _processed_index
+
+
+def load_processed_index() -> ProcessedIdIndex:
+    """
+    Loads the processed-ID index from the deals table (bot startup).
+    
+    Returns:
+        The loaded index
+    """
+    _processed_index.load()
+    return _processed_index
+
+
 def is_deal_processed(external_id: str) -> bool:
     """
     Check if a deal has already been processed.
+    Answered from the in-memory index; SQL only confirms possible hits.
     
     Args:
         external_id: Unique identifier from the source platform
@@ -135,10 +421,113 @@ def is_deal_processed(external_id: str) -> bool:
     Returns:
         True if deal exists in database, False otherwise
     """
-    return Deal.select().where(Deal.external_id == external_id).exists()
+    return _processed_index.contains(external_id)
 
 
-def save_deal(external_id: str, title: str, price: float, original_url: str, affiliate_url: str = None, image_url: str = None, category: str = 'Outros', store: str = 'Outros'):
+def filter_unprocessed(external_ids: List[str]) -> List[str]:
+    """
+    Batch version of is_deal_processed for a whole page of deals.
+    IDs the index has never seen need no SQL; possible hits are confirmed
+    with chunked 'WHERE external_id IN (...)' queries.
+    
+    Args:
+        external_ids: Candidate external IDs
+        
+    Returns:
+        The IDs not in the database, in input order (duplicates removed)
+    """
+    unique = list(dict.fromkeys(external_ids))
+    possible_hits = [external_id for external_id in unique if _processed_index.might_contain(external_id)]
+    processed = set()
+    # Hot table first; only the remaining IDs are looked up in the archive
+    for model in (Deal, ArchivedDeal):
+        pending = [external_id for external_id in possible_hits if external_id not in processed]
+        for start in range(0, len(pending), MAX_SQL_VARIABLES):
+            chunk = pending[start:start + MAX_SQL_VARIABLES]
+            processed.update(row[0] for row in
+                             model.select(model.external_id).where(model.external_id.in_(chunk)).tuples())
+    return [external_id for external_id in unique if external_id not in processed]
+
+
+def record_price_observations(rows: List[Dict]) -> int:
+    """
+    Appends a cycle's price observations and updates the daily rollup,
+    in one transaction.
+    
+    Args:
+        rows: Dicts with external_id, price_cents, old_price_cents
+            (observed_at defaults to now)
+        
+    Returns:
+        Number of observations appended
+    """
+    if not rows:
+        return 0
+    observed_at = int(get_brazil_time().timestamp())
+    # One observation per product and second (a product listed twice on a page)
+    observations = list({(row['external_id'], row.get('observed_at', observed_at)):
+                         dict(row, observed_at=row.get('observed_at', observed_at)) for row in rows}.values())
+    
+    daily = {}
+    days = {}
+    for row in observations:
+        day = days.get(row['observed_at'])
+        if day is None:
+            day = days[row['observed_at']] = datetime.fromtimestamp(row['observed_at'], BRAZIL_TZ).strftime('%Y-%m-%d')
+        entry = daily.get((row['external_id'], day))
+        if entry is None:
+            daily[(row['external_id'], day)] = {'external_id': row['external_id'], 'day': day,
+                                         'min_cents': row['price_cents'], 'max_cents': row['price_cents'],
+                                         'last_cents': row['price_cents'], 'observations': 1}
+        else:
+            entry['min_cents'] = min(entry['min_cents'], row['price_cents'])
+            entry['max_cents'] = max(entry['max_cents'], row['price_cents'])
+            entry['last_cents'] = row['price_cents']
+            entry['observations'] += 1
+    daily_rows = list(daily.values())
+    
+    with db.atomic():
+        batch_size = MAX_SQL_VARIABLES // 4
+        for start in range(0, len(observations), batch_size):
+            PriceObservation.insert_many(observations[start:start + batch_size]).on_conflict_ignore().execute()
+        batch_size = MAX_SQL_VARIABLES // 6
+        for start in range(0, len(daily_rows), batch_size):
+            PriceDaily.insert_many(daily_rows[start:start + batch_size]).on_conflict(
+                conflict_target=[PriceDaily.external_id, PriceDaily.day],
+                update={
+                    PriceDaily.min_cents: fn.MIN(PriceDaily.min_cents, EXCLUDED.min_cents),
+                    PriceDaily.max_cents: fn.MAX(PriceDaily.max_cents, EXCLUDED.max_cents),
+                    PriceDaily.last_cents: EXCLUDED.last_cents,
+                    PriceDaily.observations: PriceDaily.observations + EXCLUDED.observations,
+                }
+            ).execute()
+    return len(observations)
+
+
+def load_all_time_lows(external_ids: List[str]) -> Dict[str, int]:
+    """
+    Lowest price ever observed for each product, from the daily rollup.
+    
+    Args:
+        external_ids: Products to look up
+        
+    Returns:
+        {external_id: lowest price in cents} for products with history
+    """
+    unique = list(dict.fromkeys(external_ids))
+    lows = {}
+    for start in range(0, len(unique), MAX_SQL_VARIABLES):
+        chunk = unique[start:start + MAX_SQL_VARIABLES]
+        query = (PriceDaily
+                 .select(PriceDaily.external_id, fn.MIN(PriceDaily.min_cents))
+                 .where(PriceDaily.external_id.in_(chunk))
+                 .group_by(PriceDaily.external_id))
+        lows.update(query.tuples())
+    return lows
+
+
+def save_deal(external_id: str, title: str, price: float, original_url: str, affiliate_url: str = None, image_url: str = None, category: str = 'Outros', store: str = 'Outros',
+              old_price: float = None, discount_pct: float = None):
     """
     Save a new deal to the database.
     
@@ -151,6 +540,8 @@ def save_deal(external_id: str, title: str, price: float, original_url: str, aff
         image_url: Product image URL (optional)
         category: Product category (optional)
         store: Store name (optional)
+        old_price: Price before the discount (optional)
+        discount_pct: Discount over old_price in percent (optional)
         
     Returns:
         Created Deal instance
@@ -163,11 +554,130 @@ def save_deal(external_id: str, title: str, price: float, original_url: str, aff
         affiliate_url=affiliate_url,
         image_url=image_url,
         category=category,
-        store=store
+        store=store,
+        old_price=old_price,
+        discount_pct=discount_pct
     )
+    _processed_index.add(external_id)
     return deal
 
 
+def save_deals_bulk(rows: List[Dict]) -> int:
+    """
+    Saves a page of deals in one transaction (INSERT ... ON CONFLICT IGNORE).
+    
+    Args:
+        rows: Dicts with the save_deal arguments (external_id, title, price,
+            original_url, affiliate_url, image_url, category, store,
+            old_price, discount_pct)
+        
+    Returns:
+        Number of inserted rows (already saved IDs are skipped)
+    """
+    if not rows:
+        return 0
+    sent_at = get_brazil_time()
+    rows = [dict(row, sent_at=row.get('sent_at', sent_at)) for row in rows]
+    # Rows with the same columns share a statement; chunks keep the parameter count bounded
+    batch_size = max(1, MAX_SQL_VARIABLES // len(rows[0]))
+    
+    inserted = 0
+    with db.atomic():
+        for start in range(0, len(rows), batch_size):
+            # rowcount skips ignored rows and the deal_stats trigger updates
+            query = Deal.insert_many(rows[start:start + batch_size]).on_conflict_ignore()
+            inserted += db.execute(query).rowcount
+    
+    for row in rows:
+        _processed_index.add(row['external_id'])
+    return inserted
+
+
+def update_deal_price(external_id: str, price: float, affiliate_url: str = None, old_price: float = None,
+                      discount_pct: float = None) -> int:
+    """
+    Records a re-post of an already saved deal at a new price.
+    
+    Args:
+        external_id: Unique identifier from the source platform
+        price: New current price
+        affiliate_url: Affiliate URL used in the re-post (optional)
+        old_price: Price before the discount on the re-posted card (optional)
+        discount_pct: Discount over old_price in percent (optional)
+        
+    Returns:
+        Number of updated rows
+    """
+    fields = {Deal.price: price, Deal.old_price: old_price, Deal.discount_pct: discount_pct,
+              Deal.sent_at: get_brazil_time()}
+    if affiliate_url:
+        fields[Deal.affiliate_url] = affiliate_url
+    return Deal.update(fields).where(Deal.external_id == external_id).execute()
+
+
+def load_deal_prices(since: datetime = None):
+    """
+    Loads the last posted price of saved deals in a single query.
+    
+    Args:
+        since: Only deals sent at or after this time (optional)
+        
+    Returns:
+        Iterator of (external_id, price) tuples
+    """
+    query = Deal.select(Deal.external_id, Deal.price)
+    if since is not None:
+        query = query.where(Deal.sent_at >= since)
+    return query.tuples().iterator()
+
+
+def load_archived_deals(start: datetime, end: datetime = None, limit: int = 500,
+                        read_only: bool = True) -> List[Dict]:
+    """
+    Reads archived deals back for a sent_at range (dashboard rehydration).
+
+    Args:
+        start: First sent_at included
+        end: First sent_at excluded (open range if None)
+        limit: Maximum number of rows
+        read_only: Use the archive's read-only pool (API) instead of the bot's connection
+
+    Returns:
+        Deal rows as dicts, newest first
+    """
+    model = ReadOnlyArchivedDeal if read_only else ArchivedDeal
+    query = model.select().where(model.sent_at >= start)
+    if end is not None:
+        query = query.where(model.sent_at < end)
+    return list(query.order_by(model.sent_at.desc()).limit(limit).dicts())
+
+
+def load_deal_stats(read_only: bool = True) -> Dict:
+    """
+    Dashboard statistics from the deal_stats summary row (O(1), no table scan).
+    
+    Returns:
+        Dict with total_deals, deals_with_discount, total_savings and avg_discount
+    """
+    model = ReadOnlyDealStats if read_only else DealStats
+    stats = model.get_or_none(model.id == 1) or model(id=1)
+    with_discount = stats.deals_with_discount
+    return {
+        'total_deals': stats.deal_count,
+        'deals_with_discount': with_discount,
+        'total_savings': round(stats.savings_total, 2),
+        'avg_discount': int(stats.discount_pct_total / with_discount) if with_discount else 0,
+    }
+
+
+def archive_summary(read_only: bool = True) -> Dict:
+    """Number of archived deals and their sent_at range."""
+    model = ReadOnlyArchivedDeal if read_only else ArchivedDeal
+    count, oldest, newest = model.select(fn.COUNT(model.id), fn.MIN(model.sent_at), fn.MAX(model.sent_at)).scalar(
+        as_tuple=True)
+    return {'archived_deals': count, 'oldest_sent_at': oldest, 'newest_sent_at': newest}
+
+
 def save_coupon(coupon_code: str, product_id: str, discount_percentage: float = None, 
                 discount_amount: float = None, expires_at = None, max_usage: int = None,
                 category: str = 'Outros'):
@@ -0,0 +1,92 @@
+"""
+Hot/cold retention for the deals table.
+Deals older than the retention period are copied to data/deals_archive.db,
+deleted from data/deals.db and the freed pages are returned with an
+incremental vacuum. Archived IDs still count as processed (see
+is_deal_processed) and archived ranges can be read back on demand
+(load_archived_deals).
+"""
+
+from datetime import timedelta
+from typing import List
+
+from .models import ArchivedDeal, Deal, archive_db, db, get_brazil_time, MAX_SQL_VARIABLES
+from ..utils.logger import logger
+
+ARCHIVE_BATCH_SIZE = 500
+# Pages returned to the filesystem per retention run
+VACUUM_PAGES = 20000
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def _copied_fields() -> List[str]:
+    # The archive has its own id (see ArchivedDeal)
+    return [field.name for field in Deal._meta.sorted_fields if field.name != 'id']
+
+
+def _enable_incremental_vacuum() -> None:
+    """Databases created before auto_vacuum=incremental need one full VACUUM to switch."""
+    if db.execute_sql('PRAGMA auto_vacuum').fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+        logger.info("Converting deals.db to incremental auto-vacuum (one-time full VACUUM)...")
+        db.execute_sql('PRAGMA auto_vacuum = INCREMENTAL')
+        db.execute_sql('VACUUM')
+
+
+def archive_old_deals(retention_days: int, vacuum_pages: int = VACUUM_PAGES) -> int:
+    """
+    Moves deals sent more than retention_days ago to the archive database.
+
+    Rows are copied first (conflicts on external_id are ignored) and only
+    the hot rows whose external_id is confirmed in the archive are deleted,
+    batch by batch, so an interrupted run leaves rows in both files and
+    never loses any.
+
+    Args:
+        retention_days: Deals older than this are archived (0 disables retention)
+        vacuum_pages: Free pages released by the incremental vacuum
+
+    Returns:
+        Number of archived deals
+    """
+    if retention_days <= 0:
+        return 0
+    cutoff = get_brazil_time() - timedelta(days=retention_days)
+    fields = [getattr(Deal, name) for name in _copied_fields()]
+    batch_size = max(1, MAX_SQL_VARIABLES // (len(fields) + 1))
+    archived = 0
+
+    while True:
+        rows = list(Deal.select(*fields)
+                    .where(Deal.sent_at < cutoff)
+                    .order_by(Deal.sent_at)
+                    .limit(ARCHIVE_BATCH_SIZE)
+                    .dicts())
+        if not rows:
+            break
+        with archive_db.atomic():
+            for start in range(0, len(rows), batch_size):
+                ArchivedDeal.insert_many(rows[start:start + batch_size]).on_conflict_ignore().execute()
+
+        external_ids = [row['external_id'] for row in rows]
+        confirmed = []
+        for start in range(0, len(external_ids), MAX_SQL_VARIABLES):
+            chunk = external_ids[start:start + MAX_SQL_VARIABLES]
+            confirmed.extend(external_id for (external_id,) in ArchivedDeal
+                             .select(ArchivedDeal.external_id)
+                             .where(ArchivedDeal.external_id.in_(chunk))
+                             .tuples())
+        with db.atomic():
+            for start in range(0, len(confirmed), MAX_SQL_VARIABLES):
+                Deal.delete().where(Deal.external_id.in_(confirmed[start:start + MAX_SQL_VARIABLES])).execute()
+        archived += len(confirmed)
+        if len(confirmed) < len(rows):
+            # Rows the archive did not take stay hot; retrying them would loop forever
+            logger.error(f"{len(rows) - len(confirmed)} old deals missing from the archive; kept in deals.db")
+            break
+
+    if archived:
+        _enable_incremental_vacuum()
+        db.execute_sql(f'PRAGMA incremental_vacuum({int(vacuum_pages)})')
+        logger.info(f"Archived {archived} deals older than {retention_days} days")
+    return archived
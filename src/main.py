@@ -7,19 +7,36 @@ import os
 import time
 import schedule
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
-from .database import init_database, is_deal_processed, save_deal
-from .database import init_database, is_deal_processed, save_deal
-from .services import validate_deal, send_deal, send_notification, send_deal_to_whatsapp
+from .database import (init_database, is_deal_processed, save_deal, update_deal_price, load_processed_index,
+                       filter_unprocessed, save_deals_bulk)
+from .database.retention import archive_old_deals
+from .services import send_deal, send_notification, send_deal_to_whatsapp
 import json
-from .utils.helpers import extract_product_id
 
-from .services.parser import extract_deals_from_html
+from .services.deal_diff import get_change_detector
+from .services.deal_record import DealRecord
+from .services.price_history import all_time_lows, record_observations
+from .services.html_backend import set_default_backend as set_parser_backend
 from .services.simple_affiliate import generate_simple_link as generate_link
 from .utils.logger import logger
 from .services.simple_scraper_selenium import fetch_html_selenium
+from .services.scraper_pool import ScraperPool
+from .services.browser_manager import get_browser_manager
+from .services.listing_fingerprint import get_fingerprint_store
+from .services.parse_pool import get_parse_pool
+from .services.selector_cascade import get_selector_stats
+from .services.url_scheduler import UrlScheduler
+from .utils.config_manager import get_scraper_config, load_monitored_urls
+
+# Longest sleep of the scheduler loop before checking for a dashboard force run
+FORCE_RUN_CHECK_SECONDS = 5
+# Old deals are moved to the archive database once a day
+RETENTION_INTERVAL_SECONDS = 24 * 3600
+# Learned selector winners are written to disk at most this often (and at shutdown)
+SELECTOR_STATS_SAVE_SECONDS = 300
 
 def fetch_raw_data(url: str) -> str:
     """
@@ -27,37 +44,47 @@ def fetch_raw_data(url: str) -> str:
     """
     return fetch_html_selenium(url)
 
-def process_deal(deal: Dict) -> bool:
+def is_deal_known(deal: DealRecord) -> bool:
+    """True if the deal's product was already posted at this price (used to stop pagination early)."""
+    if not deal.external_id:
+        return False
+    change_detector = get_change_detector()
+    if change_detector.is_tracked(deal):
+        return change_detector.is_unchanged(deal)
+    return is_deal_processed(deal.external_id)
+
+def process_deal(deal: DealRecord, pending_rows: Optional[List[Dict]] = None) -> Optional[bool]:
     """
     Process a single deal: deduplicate, generate link, and send notification.
     
     Args:
-        deal: Deal dictionary from AI processor
+        deal: Deal record from the parser
+        pending_rows: Collects the new deal's row for save_deals_bulk instead of
+            saving it right away (the caller already ran filter_unprocessed)
         
     Returns:
-        True if deal was processed successfully, False otherwise
+        True if deal was processed successfully, False if it was skipped,
+        None if it failed with an error (worth retrying on the next run)
     """
     try:
-        # Validate deal
-        if not validate_deal(deal):
-            logger.warning("Invalid deal, skipping")
+        # Validate deal (price, URL and product ID were normalized by the parser)
+        if not deal.is_complete():
+            logger.warning(f"Incomplete deal, skipping: {deal.title or deal.original_url}")
             return False
         
-        # Generate external ID from URL
-        original_url = deal.get('original_url', '')
-        external_id = extract_product_id(original_url)
-        
-        if not external_id:
-            logger.warning("Could not generate external_id, skipping deal")
-            return False
+        original_url = deal.original_url
+        external_id = deal.external_id
         
-        # Check if already processed
-        if is_deal_processed(external_id):
+        # Check if already processed (price drops of posted products are re-posted)
+        if deal.previous_price_cents:
+            logger.info(f"Price drop for {external_id} ({deal.price_flag}): "
+                        f"R$ {deal.previous_price_cents / 100:.2f} -> R$ {deal.new_price:.2f}")
+        elif pending_rows is None and is_deal_processed(external_id):
             logger.info(f"Deal already processed: {external_id}")
             return False
         
         # Generate affiliate link
-        logger.info(f"Generating affiliate link for: {deal.get('title')}")
+        logger.info(f"Generating affiliate link for: {deal.title}")
         affiliate_url = generate_link(original_url)
         
         if not affiliate_url:
@@ -66,19 +93,12 @@ def process_deal(deal: Dict) -> bool:
         
         # Validate HTTPS - Skip products without HTTPS
         if not affiliate_url.startswith('https://'):
-            logger.warning(f"Product link does not use HTTPS, skipping: {deal.get('title')}")
+            logger.warning(f"Product link does not use HTTPS, skipping: {deal.title}")
             logger.warning(f"URL: {affiliate_url}")
             return False
         
-        deal['affiliate_url'] = affiliate_url
-        
-        # Determine store name
-        # Determine store name
-        store_name = 'Outros'
-        if 'mercadolivre.com' in original_url:
-            store_name = 'Mercado Livre'
-        elif 'shopee.com' in original_url:
-            store_name = 'Shopee'
+        deal.affiliate_url = affiliate_url
+        store_name = deal.store
             
         # --- Channel Routing Logic ---
         
@@ -96,7 +116,7 @@ def process_deal(deal: Dict) -> bool:
         send_telegram = routing.get('send_to_telegram', True)
         send_whatsapp = routing.get('send_to_whatsapp', False)
         
-        category = deal.get('category', 'Outros')
+        category = deal.category or 'Outros'
         
         telegram_sent = False
         whatsapp_sent = False
@@ -158,11 +178,11 @@ def process_deal(deal: Dict) -> bool:
                     logger.info(f"Sending to WhatsApp Group: {group_id}")
                     wa_result = send_deal_to_whatsapp(
                         group_id=group_id,
-                        title=deal.get('title', ''),
-                        price=float(deal.get('new_price', 0)),
-                        old_price=float(deal.get('old_price', 0) or 0),
+                        title=deal.title,
+                        price=deal.new_price,
+                        old_price=deal.old_price,
                         url=affiliate_url,
-                        image_url=deal.get('image_url')
+                        image_url=deal.image_url
                     )
                     if wa_result:
                         whatsapp_sent = True
@@ -176,116 +196,152 @@ def process_deal(deal: Dict) -> bool:
 
         # 3. Always save to database so we can see in dashboard
         # But log the delivery status
-        save_deal(
+        row = dict(
             external_id=external_id,
-            title=deal.get('title', ''),
-            price=float(deal.get('new_price', 0)),
+            title=deal.title,
+            price=deal.new_price,
             original_url=original_url,
             affiliate_url=affiliate_url,
-            image_url=deal.get('image_url'),
+            image_url=deal.image_url,
             category=category,
-            store=store_name
+            store=store_name,
+            old_price=deal.old_price if deal.discount_pct else None,
+            discount_pct=deal.discount_pct or None
         )
-        logger.info(f"Deal saved to DB: {deal.get('title')} (TG: {telegram_sent}, WA: {whatsapp_sent})")
+        if deal.previous_price_cents:
+            update_deal_price(external_id, deal.new_price, affiliate_url, row['old_price'], row['discount_pct'])
+        elif pending_rows is not None:
+            pending_rows.append(row)
+        else:
+            save_deal(**row)
+        logger.info(f"Deal saved to DB: {deal.title} (TG: {telegram_sent}, WA: {whatsapp_sent})")
         return True
             
     except Exception as e:
         logger.error(f"Error processing deal: {e}")
-        return False
+        return None
 
 
-def run_job():
+def run_job(url_configs: List[Dict] = None) -> Dict[str, int]:
     """
     Main job: Fetch data, extract deals, process them.
+    
+    Args:
+        url_configs: URLs to crawl (dicts from load_monitored_urls); all monitored URLs if None
+        
+    Returns:
+        Number of deals sent per monitored URL (feeds the adaptive scheduler)
     """
     logger.info("=" * 60)
     logger.info("Starting PromoBot job...")
     logger.info("=" * 60)
     
+    deals_sent_by_url = {}
+    
     try:
-        # Load URLs from config file
-        urls_config_path = os.path.join(os.path.dirname(__file__), '..', 'urls_config.json')
-        urls_to_monitor = []
-        
-        try:
-            if os.path.exists(urls_config_path):
-                with open(urls_config_path, 'r', encoding='utf-8') as f:
-                    urls_config = json.load(f)
-                    urls_to_monitor = urls_config.get('urls_to_monitor', [])
-                    
-                    # Filter out empty strings
-                    urls_to_monitor = [url for url in urls_to_monitor if url and url.strip()]
-                    
-                    if urls_to_monitor:
-                        logger.info(f"Loaded {len(urls_to_monitor)} URLs from config")
-                    else:
-                        logger.warning("Config file exists but has no valid URLs")
-            else:
-                logger.warning("URLs config file not found")
-                
-        except Exception as e:
-            logger.error(f"Error loading URLs config: {e}")
-        
-        # Fallback to default URLs if none loaded
-        if not urls_to_monitor:
-            urls_to_monitor = [
-                "https://lista.mercadolivre.com.br/celulares-telefones/_Orden_sold_quantity",
-                "https://lista.mercadolivre.com.br/computadores/_Orden_sold_quantity",
-                "https://lista.mercadolivre.com.br/saude/suplementos-alimentares/_Orden_sold_quantity",
-                "https://lista.mercadolivre.com.br/animais/_Orden_sold_quantity",
-                "https://lista.mercadolivre.com.br/calcados-roupas-bolsas/_Orden_sold_quantity"
-            ]
-            logger.warning(f"Using fallback URLs: {len(urls_to_monitor)} URLs")
+        # Load URLs (with per-URL settings) from config file
+        if url_configs is None:
+            url_configs = load_monitored_urls()
+        logger.info(f"Crawling {len(url_configs)} URLs")
         
         total_deals_found = 0
         total_deals_sent = 0
+        total_bytes = 0
+        total_fetch_ms = 0
+        pages_skipped = 0
         
-        # Initialize Driver ONCE
-        from .services.simple_scraper_selenium import get_driver
-        logger.info("Initializing Single Chrome Driver...")
-        driver = get_driver()
-        
-        if not driver:
-            logger.error("Failed to initialize driver. Aborting job.")
-            return
+        # 1. Fetch URLs concurrently; results arrive as each page finishes
+        scraper_config = get_scraper_config()
+        logger.info(f"Starting scraper pool with {scraper_config['workers']} Chrome workers...")
 
-        try:
-            for url in urls_to_monitor:
-                logger.info(f"Processing URL: {url}")
+        # Drivers survive between cycles; recycling limits may change in config.json
+        get_browser_manager().configure(
+            max_page_loads=scraper_config['max_page_loads_per_driver'],
+            max_rss_mb=scraper_config['max_driver_rss_mb'],
+            max_idle=scraper_config['workers']
+        )
+        set_parser_backend(scraper_config['parser_backend'])
+        fingerprints = get_fingerprint_store()
+        change_detector = get_change_detector()
+        change_detector.configure(scraper_config['reprice_threshold_pct'], scraper_config['reprice_window_days'])
+
+        # Pipeline mode: pages are parsed in worker processes while the drivers keep fetching
+        parse_pool = None
+        if scraper_config['parse_workers'] > 0:
+            parse_pool = get_parse_pool()
+            parse_pool.configure(scraper_config['parse_workers'], scraper_config['parser_backend'])
+
+        with ScraperPool(workers=scraper_config['workers'],
+                         per_domain_limit=scraper_config['per_domain_limit'],
+                         domain_limits=scraper_config.get('domain_limits'),
+                         parse_pool=parse_pool) as pool:
+            for url, page in pool.crawl_all(url_configs, is_known=is_deal_known):
+                logger.info(f"Processing URL: {page['page_url']} (page {page['page'] + 1}, tier: {page['tier']})")
+                total_bytes += page['metrics'].get('bytes', 0)
+                total_fetch_ms += page['metrics'].get('elapsed_ms', 0)
                 
-                # 1. Fetch raw data (reusing driver)
-                raw_data = fetch_html_selenium(url, driver=driver)
+                if not page['html']:
+                    logger.warning(f"No data fetched from {page['page_url']}, skipping")
+                    continue
                 
-                if not raw_data:
-                    logger.warning(f"No data fetched from {url}, skipping")
+                if page.get('unchanged'):
+                    pages_skipped += 1
                     continue
                 
-                # 2. Extract deals using Parser (No AI)
-                deals = extract_deals_from_html(raw_data, url)
+                # 2. Deals were extracted by the Parser (No AI) as each page arrived
+                deals = page['deals']
                 total_deals_found += len(deals)
                 
                 if not deals:
-                    logger.info(f"No deals found in {url}")
+                    logger.info(f"No deals found in {page['page_url']}")
                     continue
                 
-                # 3. Process each deal
-                for deal in deals:
-                    if process_deal(deal):
-                        total_deals_sent += 1
-                        # Add delay between deals to avoid rate limiting
-                        time.sleep(2)
-        finally:
-            logger.info("Closing Chrome Driver...")
-            if driver:
-                driver.quit()
+                # 3. Process only new products, price drops and all-time lows
+                lows = all_time_lows(deals)
+                record_observations(deals)
+                changed = change_detector.diff(deals, lows)
+                if len(changed) < len(deals):
+                    logger.info(f"{len(deals) - len(changed)} of {len(deals)} deals unchanged since last post")
+                
+                # One query deduplicates the page (re-posts are known products by definition)
+                unprocessed = set(filter_unprocessed([deal.external_id for deal in changed
+                                                      if deal.external_id and not deal.previous_price_cents]))
+                pending_rows = []
+                failed = 0
+                try:
+                    for deal in changed:
+                        if not deal.previous_price_cents and deal.external_id not in unprocessed:
+                            continue
+                        processed = process_deal(deal, pending_rows)
+                        if processed is None:
+                            failed += 1
+                        elif processed:
+                            change_detector.commit(deal)
+                            total_deals_sent += 1
+                            deals_sent_by_url[url] = deals_sent_by_url.get(url, 0) + 1
+                            # Add delay between deals to avoid rate limiting
+                            time.sleep(2)
+                finally:
+                    # 4. Sent deals of the page are saved in one transaction
+                    if pending_rows:
+                        save_deals_bulk(pending_rows)
+                
+                # Only a fully processed page may be skipped as unchanged next time
+                if failed:
+                    logger.warning(f"{failed} deals failed on {page['page_url']}, page will be parsed again next run")
+                else:
+                    fingerprints.commit(page['page_url'], page.get('fingerprint'))
         
         logger.info("=" * 60)
-        logger.info(f"Job completed: {total_deals_found} deals found, {total_deals_sent} sent")
+        logger.info(f"Job completed: {total_deals_found} deals found, {total_deals_sent} sent, {pages_skipped} unchanged pages skipped")
+        logger.info(f"Fetched {total_bytes / (1024 * 1024):.1f} MB in {total_fetch_ms / 1000:.1f}s of page loads")
         logger.info("=" * 60)
         
     except Exception as e:
         logger.error(f"Error in job execution: {e}")
         send_notification(f"⚠️ PromoBot Error: {str(e)}")
+    
+    return deals_sent_by_url
 
 
 def main():
@@ -301,6 +357,8 @@ def main():
     # Initialize database
     logger.info("Initializing database...")
     init_database()
+    processed_index = load_processed_index()
+    logger.info(f"Processed-ID index: {processed_index.size} IDs in {processed_index.memory_bytes / 1024:.0f} KB")
     
     # Check configuration
     debug_mode = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
@@ -315,25 +373,52 @@ def main():
     # Logic removed to avoid port conflict (Address already in use)
 
     # Import config manager
-    from src.utils.config_manager import should_run, update_last_run
+    from src.utils.config_manager import load_config, consume_force_run, update_last_run
     
-    # Run immediately on startup
-    logger.info("Running initial job...")
-    run_job()
-    update_last_run()
+    # Every URL is due on startup, then each one runs on its own interval
+    scheduler = UrlScheduler()
+    last_retention_run = 0
+    last_stats_save = time.time()
     
-    # Keep running
-    logger.info("Entering dynamic main loop. Press Ctrl+C to stop.")
+    logger.info("Entering scheduler loop. Press Ctrl+C to stop.")
     try:
         while True:
-            if should_run():
-                logger.info("Triggering scheduled job...")
-                run_job()
+            config = load_config()
+            
+            if time.time() - last_retention_run >= RETENTION_INTERVAL_SECONDS:
+                last_retention_run = time.time()
+                try:
+                    archive_old_deals(config.get('retention_days', 90))
+                except Exception as e:
+                    logger.error(f"Error archiving old deals: {e}")
+            
+            if time.time() - last_stats_save >= SELECTOR_STATS_SAVE_SECONDS:
+                last_stats_save = time.time()
+                get_selector_stats().save()
+            
+            scheduler.sync(load_monitored_urls(), default_interval_minutes=config.get('interval_minutes', 30))
+            
+            if consume_force_run():
+                logger.info("Force run requested, all URLs are due")
+                scheduler.make_all_due()
+            
+            due = scheduler.pop_due()
+            if due:
+                logger.info(f"Triggering scheduled job for {len(due)} URLs...")
+                deals_sent_by_url = run_job(due)
+                for url_config in due:
+                    scheduler.record_run(url_config['url'], deals_sent_by_url.get(url_config['url'], 0))
                 update_last_run()
+                continue
             
-            time.sleep(5)  # Check every 5 seconds for force_run or timeout
+            # Sleep until the next URL is due (woken early to honor dashboard force runs)
+            wait = scheduler.seconds_until_next()
+            time.sleep(min(wait, FORCE_RUN_CHECK_SECONDS) if wait is not None else FORCE_RUN_CHECK_SECONDS)
     except KeyboardInterrupt:
         logger.info("Shutting down PromoBot...")
+        get_browser_manager().shutdown()
+        get_parse_pool().shutdown()
+        get_selector_stats().save()
 
         send_notification("🛑 PromoBot stopped")
 
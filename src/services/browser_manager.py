@@ -0,0 +1,197 @@
+"""
+Long-lived warm browser service.
+Keeps Chrome drivers alive across job cycles, health-checks them before
+reuse and recycles them after N page loads or when memory grows too much.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .simple_scraper_selenium import get_driver
+from ..utils.logger import logger
+
+try:
+    import psutil
+except ImportError:  # RSS-based recycling is disabled without psutil
+    psutil = None
+
+
+def driver_rss_mb(driver) -> Optional[float]:
+    """Resident memory of chromedriver plus all Chrome processes it spawned, in MB."""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def is_driver_alive(driver) -> bool:
+    """Cheap health check: one JS round trip."""
+    try:
+        return driver.execute_script("return 1") == 1
+    except Exception:
+        return False
+
+
+def quit_quietly(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class DriverLease:
+    """
+    A driver borrowed from the BrowserManager for one fetch.
+    The driver is only started when get() is first called.
+    """
+
+    def __init__(self, manager: 'BrowserManager'):
+        self.manager = manager
+        self.driver = None
+
+    def get(self):
+        if self.driver is None:
+            self.driver = self.manager.acquire()
+        return self.driver
+
+    def replace(self, broken_driver=None):
+        """Swaps a crashed driver for a fresh one mid-fetch and returns it."""
+        self.driver = self.manager.replace(broken_driver or self.driver)
+        return self.driver
+
+    def release(self):
+        if self.driver is not None:
+            self.manager.release(self.driver)
+            self.driver = None
+
+
+class BrowserManager:
+    """
+    Pool of warm Chrome drivers shared by every job cycle.
+
+    Usage:
+        lease = manager.lease()
+        try:
+            driver = lease.get()
+            ...
+        finally:
+            lease.release()
+    """
+
+    def __init__(self, max_page_loads: int = 200, max_rss_mb: float = 1500,
+                 max_idle: int = 3, driver_factory: Callable = get_driver):
+        """
+        Args:
+            max_page_loads: Recycle a driver after this many page loads
+            max_rss_mb: Recycle a driver when its process tree exceeds this RSS (MB)
+            max_idle: Number of idle drivers kept warm between cycles
+            driver_factory: Callable returning a new WebDriver
+        """
+        self.max_page_loads = max_page_loads
+        self.max_rss_mb = max_rss_mb
+        self.max_idle = max_idle
+        self.driver_factory = driver_factory
+
+        self._idle: List = []
+        self._page_loads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, max_page_loads: int = None, max_rss_mb: float = None, max_idle: int = None):
+        """Applies updated settings (config.json may change between cycles)."""
+        with self._lock:
+            if max_page_loads is not None:
+                self.max_page_loads = max_page_loads
+            if max_rss_mb is not None:
+                self.max_rss_mb = max_rss_mb
+            if max_idle is not None:
+                self.max_idle = max_idle
+
+    def lease(self) -> DriverLease:
+        return DriverLease(self)
+
+    def _new_driver(self):
+        driver = self.driver_factory()
+        if driver:
+            with self._lock:
+                self._page_loads[id(driver)] = 0
+        return driver
+
+    def _retire(self, driver, reason: str) -> None:
+        logger.info(f"Recycling Chrome driver: {reason}")
+        with self._lock:
+            self._page_loads.pop(id(driver), None)
+        quit_quietly(driver)
+
+    def _needs_recycle(self, driver) -> Optional[str]:
+        page_loads = self._page_loads.get(id(driver), 0)
+        if page_loads >= self.max_page_loads:
+            return f"{page_loads} page loads"
+        rss = driver_rss_mb(driver)
+        if rss is not None and rss > self.max_rss_mb:
+            return f"RSS {rss:.0f} MB > {self.max_rss_mb} MB"
+        return None
+
+    def acquire(self):
+        """Returns a healthy driver, reusing a warm one when possible."""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                return self._new_driver()
+            if not is_driver_alive(driver):
+                self._retire(driver, "failed health check")
+                continue
+            reason = self._needs_recycle(driver)
+            if reason:
+                self._retire(driver, reason)
+                continue
+            return driver
+
+    def release(self, driver) -> None:
+        """Returns a driver after one page load."""
+        with self._lock:
+            if id(driver) not in self._page_loads:
+                return
+            self._page_loads[id(driver)] += 1
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return
+        self._retire(driver, "idle pool is full")
+
+    def replace(self, driver):
+        """Discards a crashed driver and returns a new one."""
+        if driver is not None:
+            self._retire(driver, "driver crashed")
+        return self._new_driver()
+
+    def shutdown(self) -> None:
+        """Quits every idle driver."""
+        with self._lock:
+            drivers, self._idle = self._idle, []
+            self._page_loads.clear()
+        for driver in drivers:
+            quit_quietly(driver)
+        logger.info(f"Browser manager shut down ({len(drivers)} drivers)")
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_browser_manager() -> BrowserManager:
+    """Returns the process-wide BrowserManager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = BrowserManager()
+        return _manager
@@ -0,0 +1,140 @@
+"""
+Rule-based deal category classifier.
+Rules come from category_rules.json and are compiled once into alternation
+regexes (title keywords with word boundaries, URL slugs as substrings) plus
+a lookup of Mercado Livre category IDs such as MLB1144.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.config_manager import load_category_rules
+from ..utils.logger import logger
+
+ML_CATEGORY_ID_RE = re.compile(r'MLB\d+')
+
+# (priority, -rule order): higher wins, earlier rule breaks ties
+Rank = Tuple[int, int]
+
+
+def _compile_alternation(keywords: Iterable[str], word_boundaries: bool) -> Optional[re.Pattern]:
+    # Longest first so 'smart tv' wins over 'tv' at the same position
+    alternatives = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    if not alternatives:
+        return None
+    if word_boundaries:
+        return re.compile(rf'(?<!\w)(?:{alternatives})(?!\w)')
+    return re.compile(alternatives)
+
+
+class CategoryClassifier:
+    """
+    Classifies deals by product URL, then title keywords, then the listing URL
+    (only for deals nothing else matched).
+    """
+
+    def __init__(self, rules_config: Dict):
+        """
+        Args:
+            rules_config: {"default_category": ..., "rules": [{"category", "priority",
+                "url_keywords", "url_category_ids", "title_keywords"}, ...]}
+        """
+        self.default_category = rules_config.get('default_category', 'Outros')
+        self._title_keywords: Dict[str, Tuple[Rank, str]] = {}
+        self._url_keywords: Dict[str, Tuple[Rank, str]] = {}
+        self._category_ids: Dict[str, Tuple[Rank, str]] = {}
+
+        for order, rule in enumerate(rules_config.get('rules', [])):
+            entry = ((int(rule.get('priority', 0)), -order), rule['category'])
+            for table, values in ((self._title_keywords, rule.get('title_keywords', [])),
+                                  (self._url_keywords, rule.get('url_keywords', [])),
+                                  (self._category_ids, rule.get('url_category_ids', []))):
+                for value in values:
+                    key = value if table is self._category_ids else value.lower()
+                    if key not in table or table[key][0] < entry[0]:
+                        table[key] = entry
+
+        self._title_re = _compile_alternation(self._title_keywords, word_boundaries=True)
+        self._url_re = _compile_alternation(self._url_keywords, word_boundaries=False)
+        logger.debug(f"Category classifier: {len(self._title_keywords)} title keywords, "
+                     f"{len(self._url_keywords)} URL keywords, {len(self._category_ids)} category IDs")
+
+    def url_category(self, url: Optional[str]) -> Optional[str]:
+        """Best category from ML category IDs and URL slugs, or None."""
+        if not url:
+            return None
+        best = None
+        for category_id in ML_CATEGORY_ID_RE.findall(url):
+            entry = self._category_ids.get(category_id)
+            if entry and (best is None or entry[0] > best[0]):
+                best = entry
+        if self._url_re is not None:
+            for match in self._url_re.finditer(url.lower()):
+                entry = self._url_keywords[match.group(0)]
+                if best is None or entry[0] > best[0]:
+                    best = entry
+        return best[1] if best else None
+
+    def classify_many(self, titles: List[str], urls: Optional[List[str]] = None,
+                      listing_url: Optional[str] = None) -> List[str]:
+        """
+        Classifies a batch of deals with a single regex pass over all titles.
+
+        Args:
+            titles: Deal titles
+            urls: Product URLs (same length as titles), optional
+            listing_url: Listing page the deals came from, optional
+
+        Returns:
+            One category per title
+        """
+        categories: List[Optional[str]] = [self.url_category(urls[index]) if urls else None
+                                           for index in range(len(titles))]
+
+        pending = [index for index, category in enumerate(categories) if category is None]
+        if pending and self._title_re is not None:
+            # Titles joined by newlines; match offsets map back to the title index
+            offsets = []
+            parts = []
+            position = 0
+            for index in pending:
+                offsets.append(position)
+                text = (titles[index] or '').lower().replace('\n', ' ')
+                parts.append(text)
+                position += len(text) + 1
+
+            best: Dict[int, Tuple[Rank, str]] = {}
+            for match in self._title_re.finditer('\n'.join(parts)):
+                slot = bisect.bisect_right(offsets, match.start()) - 1
+                entry = self._title_keywords[match.group(0)]
+                if slot not in best or entry[0] > best[slot][0]:
+                    best[slot] = entry
+            for slot, entry in best.items():
+                categories[pending[slot]] = entry[1]
+
+        # The listing's category (e.g. ofertas?cat=MLB1144) replaces only the default
+        default = self.url_category(listing_url) or self.default_category
+        return [category or default for category in categories]
+
+    def classify(self, title: str, url: Optional[str] = None, listing_url: Optional[str] = None) -> str:
+        """Category of a single deal."""
+        return self.classify_many([title], [url] if url else None, listing_url)[0]
+
+
+_classifier = None
+
+
+def get_category_classifier() -> CategoryClassifier:
+    """Classifier compiled from category_rules.json on first use."""
+    global _classifier
+    if _classifier is None:
+        _classifier = CategoryClassifier(load_category_rules())
+    return _classifier
+
+
+def reload_category_rules() -> CategoryClassifier:
+    """Recompiles the classifier after category_rules.json changed."""
+    global _classifier
+    _classifier = CategoryClassifier(load_category_rules())
+    return _classifier
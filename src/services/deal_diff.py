@@ -0,0 +1,133 @@
+"""
+Card-level change detection between parsing and process_deal.
+Keeps the last posted price of recently posted products in memory (warmed
+from the deals table with one query) and lets through only new products and
+price drops beyond 'scraper.reprice_threshold_pct', in O(cards) per page.
+Known products are also re-posted at a new all-time low (price history).
+Products posted before 'scraper.reprice_window_days' are left to the
+processed-ID index.
+"""
+
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .deal_record import DealRecord, price_to_cents
+from ..database.models import get_brazil_time, load_deal_prices
+from ..utils.logger import logger
+
+# The snapshot is reloaded daily so products leave it when they fall out of the window
+SNAPSHOT_MAX_AGE_SECONDS = 24 * 3600
+# A new all-time low must beat the previous one by this much (no re-post per cent)
+ALL_TIME_LOW_MARGIN_PCT = 1.0
+
+
+class DealChangeDetector:
+    """
+    In-memory snapshot of external_id -> reference price in cents.
+
+    The reference is the last posted price, raised when the product is seen
+    more expensive (a drop is measured from the highest price since the last
+    post, so a product that went up and came back down is re-posted).
+    """
+
+    def __init__(self, threshold_pct: float = 10.0, window_days: int = 30,
+                 prices: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            threshold_pct: Minimum drop (%) to re-post a known product; 0 disables re-posts
+            window_days: Only products posted in the last N days are tracked
+            prices: Initial snapshot (loaded from the database on first use if None)
+        """
+        self.threshold_pct = float(threshold_pct)
+        self.window_days = int(window_days)
+        self._prices = prices
+        self._loaded_at = time.time()
+        self._lock = threading.Lock()
+
+    def _snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            if self._prices is None or time.time() - self._loaded_at > SNAPSHOT_MAX_AGE_SECONDS:
+                since = get_brazil_time() - timedelta(days=self.window_days)
+                self._prices = {external_id: price_to_cents(price) for external_id, price in load_deal_prices(since)}
+                self._loaded_at = time.time()
+                logger.info(f"Change detector warmed with {len(self._prices)} products "
+                            f"posted in the last {self.window_days} days")
+            return self._prices
+
+    def _is_drop(self, price_cents: int, reference_cents: int) -> bool:
+        if self.threshold_pct <= 0 or price_cents <= 0:
+            return False
+        return price_cents <= reference_cents * (1 - self.threshold_pct / 100)
+
+    def is_tracked(self, deal: DealRecord) -> bool:
+        """True if the product was posted within the window."""
+        return deal.external_id in self._snapshot()
+
+    def is_unchanged(self, deal: DealRecord) -> bool:
+        """True if the product is known and its price did not drop (used to stop pagination early)."""
+        reference = self._snapshot().get(deal.external_id)
+        return reference is not None and not self._is_drop(deal.price_cents, reference)
+
+    def _is_all_time_low(self, price_cents: int, reference_cents: int, low_cents: Optional[int]) -> bool:
+        if self.threshold_pct <= 0 or price_cents <= 0 or not low_cents or price_cents >= reference_cents:
+            return False
+        return price_cents <= low_cents * (1 - ALL_TIME_LOW_MARGIN_PCT / 100)
+
+    def diff(self, deals: Iterable[DealRecord], all_time_lows: Optional[Dict[str, int]] = None) -> List[DealRecord]:
+        """
+        Filters a parsed page down to the cards worth processing.
+
+        Args:
+            deals: Parsed deal records
+            all_time_lows: Lowest price ever observed per product, before this page
+
+        Returns:
+            New products and repriced ones (once per product); the latter have
+            previous_price_cents and price_flag set
+        """
+        all_time_lows = all_time_lows or {}
+        prices = self._snapshot()
+        changed = []
+        seen = set()
+        with self._lock:
+            for deal in deals:
+                if deal.external_id in seen:
+                    continue
+                seen.add(deal.external_id)
+                reference = prices.get(deal.external_id)
+                if reference is None:
+                    changed.append(deal)
+                elif (self._is_drop(deal.price_cents, reference)
+                      or self._is_all_time_low(deal.price_cents, reference, all_time_lows.get(deal.external_id))):
+                    low = all_time_lows.get(deal.external_id)
+                    deal.price_flag = 'all_time_low' if low and deal.price_cents < low else 'price_drop'
+                    deal.previous_price_cents = reference
+                    changed.append(deal)
+                elif deal.price_cents > reference:
+                    prices[deal.external_id] = deal.price_cents
+        return changed
+
+    def commit(self, deal: DealRecord) -> None:
+        """Makes a posted deal's price the new reference."""
+        prices = self._snapshot()
+        with self._lock:
+            prices[deal.external_id] = deal.price_cents
+
+    def configure(self, threshold_pct: float, window_days: int) -> None:
+        self.threshold_pct = float(threshold_pct)
+        if int(window_days) != self.window_days:
+            with self._lock:
+                self.window_days = int(window_days)
+                self._prices = None
+
+
+_change_detector = None
+
+
+def get_change_detector() -> DealChangeDetector:
+    global _change_detector
+    if _change_detector is None:
+        _change_detector = DealChangeDetector()
+    return _change_detector
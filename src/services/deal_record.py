@@ -0,0 +1,108 @@
+"""
+Typed deal record passed from the parsers to process_deal and the senders.
+Prices are stored once as integer cents; the store and the canonical product
+ID (external_id) are computed when the record is built, not at every hop.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from ..utils.helpers import extract_product_id
+
+STORE_BY_DOMAIN = (
+    ('mercadolivre.com', 'Mercado Livre'),
+    ('shopee.com', 'Shopee'),
+)
+DEFAULT_STORE = 'Outros'
+
+
+def price_to_cents(value) -> int:
+    """Converts a price in reais (float, int or numeric string) to integer cents; 0 if invalid."""
+    try:
+        return max(0, int(round(float(value or 0) * 100)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def store_for_url(url: str) -> str:
+    """Store name shown in the dashboard and used for channel routing."""
+    for domain, store in STORE_BY_DOMAIN:
+        if domain in url:
+            return store
+    return DEFAULT_STORE
+
+
+@dataclass(slots=True)
+class DealRecord:
+    """One product card. Built with DealRecord.create() (or directly with cents and IDs)."""
+
+    title: str
+    price_cents: int
+    original_url: str
+    external_id: str
+    store: str
+    old_price_cents: int = 0
+    image_url: Optional[str] = None
+    category: Optional[str] = None
+    affiliate_url: Optional[str] = None
+    coupon_code: Optional[str] = None
+    coupon_discount: Optional[float] = None
+    # Last posted price when the card is a re-post (see deal_diff)
+    previous_price_cents: int = 0
+    # Why a known product is re-posted: 'price_drop' or 'all_time_low'
+    price_flag: Optional[str] = None
+
+    @classmethod
+    def create(cls, title: str, new_price, original_url: str, old_price=0,
+               image_url: Optional[str] = None, store: Optional[str] = None) -> 'DealRecord':
+        """
+        Builds a record from parsed values, normalizing them once.
+
+        Args:
+            title: Product title
+            new_price: Current price in reais
+            original_url: Absolute product URL
+            old_price: Price before the discount in reais (0 if unknown)
+            image_url: Product image
+            store: Store name (derived from the URL if omitted)
+        """
+        return cls(
+            title=title.strip(),
+            price_cents=price_to_cents(new_price),
+            old_price_cents=price_to_cents(old_price),
+            original_url=original_url,
+            external_id=extract_product_id(original_url) if original_url else '',
+            store=store or store_for_url(original_url),
+            image_url=image_url,
+        )
+
+    @property
+    def new_price(self) -> float:
+        return self.price_cents / 100
+
+    @property
+    def old_price(self) -> float:
+        return self.old_price_cents / 100
+
+    @property
+    def discount_pct(self) -> float:
+        """Discount over the card's old price, in percent (0 if unknown)."""
+        if self.old_price_cents > self.price_cents > 0:
+            return round((self.old_price_cents - self.price_cents) * 100 / self.old_price_cents, 1)
+        return 0.0
+
+    @property
+    def link(self) -> str:
+        """Affiliate link if generated, the product URL otherwise."""
+        return self.affiliate_url or self.original_url
+
+    def is_complete(self) -> bool:
+        """True if the record has what process_deal needs (title, price, URL, product ID)."""
+        return bool(self.title and self.price_cents > 0 and self.original_url and self.external_id)
+
+    def to_dict(self) -> Dict:
+        """Plain dict with prices in reais (JSON reports, golden files)."""
+        data = asdict(self)
+        data['new_price'] = self.new_price
+        data['old_price'] = self.old_price
+        return data
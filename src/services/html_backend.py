@@ -0,0 +1,112 @@
+"""
+Pluggable HTML parser backends for the deal parser.
+Every backend exposes the small BeautifulSoup-like surface the parser uses
+(select / select_one / get_text / get), so the same selector logic runs on
+bs4+html.parser, bs4+lxml or selectolax (lexbor).
+"""
+
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from ..utils.logger import logger
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax backend is optional
+    LexborHTMLParser = None
+
+BACKEND_HTML_PARSER = 'html.parser'
+BACKEND_LXML = 'lxml'
+BACKEND_SELECTOLAX = 'selectolax'
+BACKENDS = (BACKEND_HTML_PARSER, BACKEND_LXML, BACKEND_SELECTOLAX)
+FALLBACK_BACKEND = BACKEND_HTML_PARSER
+
+
+class SelectolaxNode:
+    """Wraps a selectolax node with the BeautifulSoup Tag methods used by the parser."""
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, selector: str) -> List['SelectolaxNode']:
+        return [SelectolaxNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional['SelectolaxNode']:
+        node = self.node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self) -> str:
+        return self.node.text(deep=True)
+
+    def get(self, attribute: str, default=None):
+        value = self.node.attributes.get(attribute)
+        return default if value is None else value
+
+    def __str__(self) -> str:
+        return self.node.html or ''
+
+
+def is_backend_available(name: str) -> bool:
+    """True if the backend's library is installed."""
+    if name == BACKEND_HTML_PARSER:
+        return True
+    if name == BACKEND_LXML:
+        try:
+            import lxml  # noqa: F401
+            return True
+        except ImportError:
+            return False
+    if name == BACKEND_SELECTOLAX:
+        return LexborHTMLParser is not None
+    return False
+
+
+_default_backend = None
+
+
+def set_default_backend(name: Optional[str]) -> str:
+    """
+    Selects the backend used when parse_document() gets no explicit one.
+    Unknown or missing backends fall back to html.parser.
+
+    Returns:
+        The backend actually in use
+    """
+    global _default_backend
+    backend = name or FALLBACK_BACKEND
+    if backend not in BACKENDS or not is_backend_available(backend):
+        logger.warning(f"Parser backend '{backend}' not available, using '{FALLBACK_BACKEND}'")
+        backend = FALLBACK_BACKEND
+    if backend != _default_backend:
+        logger.info(f"HTML parser backend: {backend}")
+    _default_backend = backend
+    return backend
+
+
+def get_default_backend() -> str:
+    """Backend from config.json ('scraper.parser_backend'), resolved once."""
+    if _default_backend is None:
+        from ..utils.config_manager import get_scraper_config
+        set_default_backend(get_scraper_config().get('parser_backend'))
+    return _default_backend
+
+
+def parse_document(html: str, backend: Optional[str] = None):
+    """
+    Parses an HTML document with the given (or configured) backend.
+
+    Returns:
+        Root node supporting select / select_one / get_text / get
+    """
+    backend = backend or get_default_backend()
+    if backend == BACKEND_SELECTOLAX and LexborHTMLParser is not None:
+        return SelectolaxNode(LexborHTMLParser(html).root)
+    if backend == BACKEND_LXML:
+        try:
+            return BeautifulSoup(html, 'lxml')
+        except FeatureNotFound:
+            logger.debug("lxml not installed, falling back to html.parser")
+    return BeautifulSoup(html, 'html.parser')
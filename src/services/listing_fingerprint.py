@@ -0,0 +1,124 @@
+"""
+Listing-level change fingerprinting.
+A cheap regex pre-scan of the raw HTML collects the ordered product IDs and
+prices of a listing page. When the fingerprint matches the last one whose
+deals were stored, the parse/dedup/link pipeline is skipped for that page.
+"""
+
+import hashlib
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.logger import logger
+from ..utils.state_store import JsonStateStore, get_data_path
+
+# Product links only (tracking JSON also mentions item IDs)
+ML_ID_RE = re.compile(r'href="[^"]*?(MLB)-?(\d{6,})')
+ML_PRICE_RE = re.compile(r'andes-money-amount__(?:fraction|cents)[^>]*>([\d.,]+)<')
+SHOPEE_ID_RE = re.compile(r'href="[^"]*?-i\.(\d+)\.(\d+)')
+SHOPEE_PRICE_RE = re.compile(r'R\$\s*(?:<[^>]*>\s*)*([\d.]+(?:,\d{2})?)')
+
+
+def prescan_listing(html: str, url: str) -> Tuple[List[str], List[str]]:
+    """
+    Extracts ordered product IDs and price strings without building a DOM.
+
+    Returns:
+        (ids, prices); ids is empty for unknown sites or pages without cards
+    """
+    if 'mercadolivre.com' in url:
+        id_re, price_re = ML_ID_RE, ML_PRICE_RE
+    elif 'shopee.com' in url:
+        id_re, price_re = SHOPEE_ID_RE, SHOPEE_PRICE_RE
+    else:
+        return [], []
+
+    ids = []
+    seen = set()
+    for match in id_re.finditer(html):
+        product_id = '.'.join(match.groups())
+        if product_id not in seen:
+            seen.add(product_id)
+            ids.append(product_id)
+
+    prices = price_re.findall(html) if ids else []
+    return ids, prices
+
+
+def listing_fingerprint(html: str, url: str) -> Optional[str]:
+    """Hash of the ordered product IDs plus prices, or None if no products were found."""
+    ids, prices = prescan_listing(html, url)
+    if not ids:
+        return None
+    digest = hashlib.sha1()
+    digest.update('|'.join(ids).encode('utf-8'))
+    digest.update(b'#')
+    digest.update('|'.join(prices).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class FingerprintStore:
+    """
+    Last fingerprint per listing page URL plus check/skip counters
+    (persisted in data/listing_fingerprints.json).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.store = JsonStateStore(path or get_data_path('listing_fingerprints.json'))
+
+    def check(self, url: str, fingerprint: Optional[str], count: bool = True) -> bool:
+        """
+        Tells whether the page matches the last committed fingerprint (can be skipped).
+        Pages without a fingerprint are never skipped. The fingerprint itself is
+        only stored by commit(), once the page's deals are saved.
+
+        Args:
+            url: Listing page URL
+            fingerprint: listing_fingerprint() of the fetched HTML
+            count: Update the check/skip counters (once per fetch)
+        """
+        entry = self.store.get(url) or {}
+        unchanged = fingerprint is not None and entry.get('fingerprint') == fingerprint
+        if count:
+            entry = dict(entry)
+            entry['checks'] = entry.get('checks', 0) + 1
+            entry['last_checked_at'] = time.time()
+            if unchanged:
+                entry['skips'] = entry.get('skips', 0) + 1
+            self.store.set(url, entry)
+        if unchanged:
+            logger.info(f"Listing unchanged, skipping parse: {url} ({entry.get('skips', 0)} skips)")
+        return unchanged
+
+    def commit(self, url: str, fingerprint: Optional[str]) -> None:
+        """Stores the fingerprint of a page whose deals were processed and saved."""
+        if fingerprint is None:
+            return
+        entry = dict(self.store.get(url) or {'checks': 0, 'skips': 0})
+        if entry.get('fingerprint') != fingerprint:
+            entry['fingerprint'] = fingerprint
+            entry['changed_at'] = time.time()
+            self.store.set(url, entry)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-URL check/skip counters."""
+        return {
+            url: {
+                'checks': entry.get('checks', 0),
+                'skips': entry.get('skips', 0),
+                'last_checked_at': entry.get('last_checked_at'),
+                'changed_at': entry.get('changed_at'),
+            }
+            for url, entry in self.store.all().items()
+        }
+
+
+_fingerprint_store = None
+
+
+def get_fingerprint_store() -> FingerprintStore:
+    global _fingerprint_store
+    if _fingerprint_store is None:
+        _fingerprint_store = FingerprintStore()
+    return _fingerprint_store
@@ -0,0 +1,168 @@
+"""
+Structured-data extraction for Mercado Livre listings.
+ML pages embed their search results as JSON (__PRELOADED_STATE__ and
+JSON-LD). This extractor finds those blobs with plain string scans and
+json.raw_decode, without building a BeautifulSoup tree, and maps them to
+deal records with real current/previous prices (including cents).
+"""
+
+import json
+import re
+from typing import Dict, Iterator, List, Optional
+
+from .deal_record import DealRecord
+from ..utils.logger import logger
+
+PRELOADED_STATE_MARKER = '__PRELOADED_STATE__'
+JSON_LD_RE = re.compile(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>', re.IGNORECASE)
+IMAGE_URL_TEMPLATE = 'https://http2.mlstatic.com/D_NQ_NP_{}-O.webp'
+
+_decoder = json.JSONDecoder()
+
+
+def _decode_at(html: str, start: int) -> Optional[object]:
+    """Decodes the JSON value starting at the first '{' or '[' after start."""
+    brace = html.find('{', start)
+    bracket = html.find('[', start)
+    candidates = [i for i in (brace, bracket) if i != -1]
+    if not candidates:
+        return None
+    try:
+        value, _ = _decoder.raw_decode(html, min(candidates))
+        return value
+    except ValueError:
+        return None
+
+
+def find_preloaded_state(html: str) -> Optional[Dict]:
+    """
+    Returns the __PRELOADED_STATE__ object, either from
+    'window.__PRELOADED_STATE__ = {...};' or '<script id="__PRELOADED_STATE__">{...}</script>'.
+    """
+    index = html.find(PRELOADED_STATE_MARKER)
+    while index != -1:
+        state = _decode_at(html, index + len(PRELOADED_STATE_MARKER))
+        if isinstance(state, dict):
+            return state
+        index = html.find(PRELOADED_STATE_MARKER, index + 1)
+    return None
+
+
+def find_json_ld(html: str) -> List[object]:
+    """Returns every decoded JSON-LD block of the page."""
+    blocks = []
+    for match in JSON_LD_RE.finditer(html):
+        value = _decode_at(html, match.end())
+        if value is not None:
+            blocks.append(value)
+    return blocks
+
+
+def _iter_dicts(value) -> Iterator[Dict]:
+    """Depth-first walk over every dict nested in a JSON value."""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def _absolute_url(url: str) -> str:
+    if url.startswith('//'):
+        return f"https:{url}"
+    if not url.startswith('http'):
+        return f"https://{url.lstrip('/')}"
+    return url
+
+
+def _deal_from_polycard(polycard: Dict) -> Optional[DealRecord]:
+    metadata = polycard.get('metadata') or {}
+    url = metadata.get('url')
+    if not url:
+        return None
+
+    title = None
+    new_price = 0.0
+    old_price = 0.0
+    for component in polycard.get('components') or []:
+        component_type = component.get('type')
+        if component_type == 'title':
+            title = (component.get('title') or {}).get('text')
+        elif component_type == 'price':
+            price = component.get('price') or {}
+            new_price = float((price.get('current_price') or {}).get('value') or 0)
+            old_price = float((price.get('previous_price') or {}).get('value') or 0)
+
+    if not title or new_price <= 0:
+        return None
+
+    image_url = None
+    pictures = (polycard.get('pictures') or {}).get('pictures') or []
+    if pictures and pictures[0].get('id'):
+        image_url = IMAGE_URL_TEMPLATE.format(pictures[0]['id'])
+
+    return DealRecord.create(title, new_price, _absolute_url(url),
+                             old_price if old_price > new_price else 0.0, image_url)
+
+
+def _deal_from_json_ld(product: Dict) -> Optional[DealRecord]:
+    offers = product.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    url = offers.get('url') or product.get('url')
+    title = product.get('name')
+    try:
+        new_price = float(offers.get('price') or offers.get('lowPrice') or 0)
+    except (TypeError, ValueError):
+        new_price = 0.0
+    if not url or not title or new_price <= 0:
+        return None
+
+    image = product.get('image')
+    if isinstance(image, list):
+        image = image[0] if image else None
+
+    return DealRecord.create(str(title), new_price, _absolute_url(url), image_url=image)
+
+
+def extract_ml_structured_deals(html: str) -> List[DealRecord]:
+    """
+    Extracts ML listing deals from embedded JSON.
+
+    Returns:
+        Deal records without category (empty if the page has no
+        usable structured data, in which case the CSS parser should be used)
+    """
+    deals = []
+    state = find_preloaded_state(html)
+    if state is not None:
+        for node in _iter_dicts(state):
+            polycard = node.get('polycard')
+            if isinstance(polycard, dict):
+                deal = _deal_from_polycard(polycard)
+                if deal:
+                    deals.append(deal)
+
+    if not deals:
+        for block in find_json_ld(html):
+            for node in _iter_dicts(block):
+                if node.get('@type') == 'Product':
+                    deal = _deal_from_json_ld(node)
+                    if deal:
+                        deals.append(deal)
+
+    # Same product can appear in results and in carousels
+    unique = []
+    seen = set()
+    for deal in deals:
+        if deal.original_url in seen:
+            continue
+        seen.add(deal.original_url)
+        unique.append(deal)
+
+    if unique:
+        logger.info(f"Structured data: extracted {len(unique)} deals from Mercado Livre JSON")
+    return unique
@@ -0,0 +1,230 @@
+"""
+Page readiness engine for the Selenium scraper.
+Waits on per-site signals (product cards present, card count settled,
+network idle) instead of fixed sleeps, bounded by a hard timeout.
+"""
+
+import json
+import time
+from typing import Dict, List, Optional
+
+from ..utils.logger import logger
+
+
+# Per-site readiness signals, matched by substring of the URL
+SITE_PROFILES = {
+    'mercadolivre.com': {
+        'card_selectors': [
+            'div[id="POLYCARD"]',
+            'li.ui-search-layout__item',
+            'div.ui-search-result__wrapper',
+            'div.poly-card',
+        ],
+        'min_cards': 1,
+        # Listing pages are server-rendered: settled cards are enough
+        'require_network_idle': False,
+        'scroll_steps': 0,
+    },
+    'shopee.com': {
+        'card_selectors': [
+            'li[data-sqe="item"]',
+            '.shopee-search-item-result__item',
+            'div[class*="item-card"]',
+        ],
+        'min_cards': 1,
+        # Cards are rendered from XHR responses and lazy-load on scroll
+        'require_network_idle': True,
+        'scroll_steps': 3,
+    },
+}
+
+DEFAULT_PROFILE = {
+    'card_selectors': [],
+    'min_cards': 0,
+    'require_network_idle': True,
+    'scroll_steps': 0,
+}
+
+# One round trip per poll: document state, card count and resource count
+_PROBE_SCRIPT = """
+var selectors = arguments[0];
+var cards = 0;
+for (var i = 0; i < selectors.length; i++) {
+    cards = document.querySelectorAll(selectors[i]).length;
+    if (cards > 0) break;
+}
+var resources = window.performance ? performance.getEntriesByType('resource').length : 0;
+return [document.readyState, cards, resources];
+"""
+
+
+def get_site_profile(url: str) -> Dict:
+    """Returns the readiness profile for a URL."""
+    for key, profile in SITE_PROFILES.items():
+        if key in url:
+            return profile
+    return DEFAULT_PROFILE
+
+
+class NetworkMonitor:
+    """
+    Tracks in-flight requests from Chrome performance logs (CDP Network events).
+    Falls back to counting Resource Timing entries when performance logging
+    is not enabled on the driver.
+    """
+
+    # Long-polling / beacon requests that never "finish" should not block idle
+    MAX_INFLIGHT_FOR_IDLE = 2
+
+    def __init__(self, driver, capture_patterns=()):
+        """
+        Args:
+            driver: Selenium WebDriver with performance logging enabled
+            capture_patterns: URL substrings of responses to remember in
+                self.responses (bodies can then be read via Network.getResponseBody)
+        """
+        self.driver = driver
+        self.capture_patterns = tuple(capture_patterns)
+        self.responses: List[Dict] = []
+        self.inflight = set()
+        self.available = True
+        self.last_activity = time.monotonic()
+        self._last_resource_count = -1
+        # Per-navigation traffic counters (see resource_blocking.collect_page_metrics)
+        self.bytes_received = 0
+        self.requests_seen = 0
+        self.requests_blocked = 0
+
+    def reset(self):
+        """Discards buffered log entries (call before navigating)."""
+        self.inflight.clear()
+        self.responses = []
+        self.bytes_received = 0
+        self.requests_seen = 0
+        self.requests_blocked = 0
+        self.last_activity = time.monotonic()
+        self._last_resource_count = -1
+        self._drain()
+
+    def _drain(self) -> List[Dict]:
+        if not self.available:
+            return []
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            self.available = False
+            return []
+
+        events = []
+        for entry in entries:
+            try:
+                events.append(json.loads(entry['message'])['message'])
+            except (KeyError, ValueError, TypeError):
+                continue
+        return events
+
+    def poll(self, resource_count: int) -> None:
+        """Updates in-flight state from new CDP events (or resource count fallback)."""
+        events = self._drain()
+
+        if self.available:
+            for event in events:
+                method = event.get('method', '')
+                params = event.get('params', {})
+                request_id = params.get('requestId')
+                if method == 'Network.requestWillBeSent':
+                    self.inflight.add(request_id)
+                    self.requests_seen += 1
+                    self.last_activity = time.monotonic()
+                elif method == 'Network.responseReceived' and self.capture_patterns:
+                    response_url = params.get('response', {}).get('url', '')
+                    if any(pattern in response_url for pattern in self.capture_patterns):
+                        self.responses.append({'requestId': request_id, 'url': response_url})
+                elif method == 'Network.loadingFinished':
+                    self.inflight.discard(request_id)
+                    self.bytes_received += int(params.get('encodedDataLength') or 0)
+                    self.last_activity = time.monotonic()
+                elif method == 'Network.loadingFailed':
+                    self.inflight.discard(request_id)
+                    if params.get('blockedReason'):
+                        self.requests_blocked += 1
+                    self.last_activity = time.monotonic()
+        elif resource_count != self._last_resource_count:
+            self._last_resource_count = resource_count
+            self.last_activity = time.monotonic()
+
+    def is_idle(self, quiet_time: float) -> bool:
+        """True when the network has been quiet for at least quiet_time seconds."""
+        if len(self.inflight) > self.MAX_INFLIGHT_FOR_IDLE:
+            return False
+        return time.monotonic() - self.last_activity >= quiet_time
+
+
+def wait_until_ready(driver, url: str, timeout: float = 20.0, poll_interval: float = 0.2,
+                     settle_time: float = 0.5, monitor: Optional[NetworkMonitor] = None) -> Dict:
+    """
+    Blocks until the loaded page is usable for parsing or the hard timeout expires.
+
+    A page is ready when the document is interactive, the site's card selector
+    matches at least 'min_cards' elements, the card count has stopped growing
+    for 'settle_time' seconds and, for XHR-driven sites, the network is idle.
+
+    Args:
+        driver: Selenium WebDriver that has already navigated to url
+        url: Page URL (selects the site profile)
+        timeout: Hard limit in seconds
+        poll_interval: Delay between probes
+        settle_time: How long card count / network must stay unchanged
+        monitor: NetworkMonitor reset before navigation (optional)
+
+    Returns:
+        Dict with 'ready', 'reason', 'cards' and 'elapsed' (seconds)
+    """
+    profile = get_site_profile(url)
+    selectors = profile['card_selectors']
+    monitor = monitor or NetworkMonitor(driver)
+
+    start = time.monotonic()
+    deadline = start + timeout
+    scrolls_left = profile['scroll_steps']
+    last_cards = -1
+    cards_changed_at = start
+    cards = 0
+
+    while True:
+        now = time.monotonic()
+        try:
+            ready_state, cards, resources = driver.execute_script(_PROBE_SCRIPT, selectors)
+        except Exception as e:
+            logger.debug(f"Readiness probe failed: {e}")
+            ready_state, resources = 'loading', 0
+
+        monitor.poll(resources)
+
+        if cards != last_cards:
+            last_cards = cards
+            cards_changed_at = now
+
+        cards_settled = cards >= profile['min_cards'] and now - cards_changed_at >= settle_time
+        network_ok = not profile['require_network_idle'] or monitor.is_idle(settle_time)
+
+        if ready_state != 'loading' and cards_settled and network_ok:
+            if scrolls_left > 0:
+                # Trigger lazy-loaded cards, then wait for the count to settle again
+                scrolls_left -= 1
+                try:
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                except Exception:
+                    pass
+                cards_changed_at = time.monotonic()
+            else:
+                elapsed = time.monotonic() - start
+                logger.debug(f"Page ready in {elapsed:.2f}s ({cards} cards)")
+                return {'ready': True, 'reason': 'settled', 'cards': cards, 'elapsed': elapsed}
+
+        if now >= deadline:
+            elapsed = now - start
+            logger.warning(f"Readiness timeout after {elapsed:.1f}s ({cards} cards) for {url}")
+            return {'ready': False, 'reason': 'timeout', 'cards': cards, 'elapsed': elapsed}
+
+        time.sleep(poll_interval)
@@ -0,0 +1,117 @@
+"""
+Pagination for monitored listing URLs.
+Builds the URL of page N (Mercado Livre '_Desde_N' offsets, Shopee 'page=')
+and crawls pages one at a time, stopping early once a page only contains
+products that were already processed. An unchanged page (see
+listing_fingerprint) stops the crawl the same way.
+"""
+
+import re
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .deal_record import DealRecord
+from ..utils.logger import logger
+
+# Cards per ML listing page when page 1 did not tell us
+ML_DEFAULT_PAGE_SIZE = 48
+
+
+def _set_query_param(parts, name: str, value: Optional[str]):
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != name]
+    if value is not None:
+        params.append((name, value))
+    return parts._replace(query=urlencode(params), fragment='')
+
+
+def page_url(url: str, page_index: int, page_size: int = ML_DEFAULT_PAGE_SIZE) -> Optional[str]:
+    """
+    Returns the URL of a listing page.
+
+    Args:
+        url: First page URL as configured
+        page_index: 0-based page number
+        page_size: Cards per page (ML offsets are 1 + page_index * page_size)
+
+    Returns:
+        Page URL, or None if the listing does not paginate
+    """
+    if page_index == 0:
+        return url
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+
+    if 'mercadolivre.com' in host:
+        if host.startswith('lista.'):
+            # Filters live in the last path segment: /celulares/_Orden_sold_quantity
+            offset = f"_Desde_{1 + page_index * page_size}"
+            segments = [s for s in parts.path.split('/') if s]
+            if segments and segments[-1].startswith('_'):
+                filters = re.sub(r'_Desde_\d+', '', segments[-1])
+                segments[-1] = offset + filters
+            else:
+                segments.append(offset)
+            return urlunsplit(parts._replace(path='/' + '/'.join(segments), fragment=''))
+        # www.mercadolivre.com.br/ofertas uses ?page=N (1-based)
+        return urlunsplit(_set_query_param(parts, 'page', str(page_index + 1)))
+
+    if 'shopee.com' in host:
+        if 'flash_sale' in parts.path:
+            return None
+        # Shopee pages are 0-based
+        return urlunsplit(_set_query_param(parts, 'page', str(page_index)))
+
+    return None
+
+
+def iter_listing_pages(url: str, max_pages: int, fetch_page: Callable[[str], Dict],
+                       parse_page: Callable[[str, str], List[DealRecord]],
+                       is_known: Callable[[DealRecord], bool]) -> Iterator[Dict]:
+    """
+    Crawls a listing page by page, yielding each page as soon as it is parsed.
+
+    Stops when max_pages is reached, a page has no deals, or every deal on a
+    page is already known (later runs stay cheap on deep crawls). A page that
+    is unchanged since its deals were saved is all known by definition, so it
+    stops the crawl too.
+
+    Args:
+        url: First page URL
+        max_pages: Maximum number of pages to fetch
+        fetch_page: fetch_page(page_url) -> dict with 'html', 'deals' (or None), ...
+        parse_page: parse_page(html, page_url) -> list of deals
+        is_known: is_known(deal) -> True if the deal was already processed
+
+    Yields:
+        The fetch result dict plus 'page' (0-based) and 'page_url'; 'deals' is always set
+    """
+    page_size = ML_DEFAULT_PAGE_SIZE
+
+    for page_index in range(max(1, max_pages)):
+        current_url = page_url(url, page_index, page_size)
+        if current_url is None:
+            break
+
+        result = fetch_page(current_url)
+        if result.get('deals') is None:
+            result['deals'] = parse_page(result['html'], current_url) if result.get('html') else []
+        result['page'] = page_index
+        result['page_url'] = current_url
+        deals = result['deals']
+
+        # List layouts show 50 cards instead of 48
+        if page_index == 0 and len(deals) > page_size:
+            page_size = len(deals)
+
+        yield result
+
+        if result.get('unchanged'):
+            if page_index + 1 < max_pages:
+                logger.info(f"Page {page_index + 1} of {url} is unchanged, stopping crawl")
+            break
+        if not deals:
+            break
+        if page_index + 1 < max_pages and all(is_known(deal) for deal in deals):
+            logger.info(f"Page {page_index + 1} of {url} only has known products, stopping crawl")
+            break
@@ -0,0 +1,112 @@
+"""
+Process pool for HTML parsing.
+Scraper threads hand the raw HTML of each page to worker processes running
+extract_deals_from_html, so parsing uses other cores instead of competing
+with the fetch threads for the GIL. Selector statistics recorded in the
+workers are merged back into the parent's data/selector_stats.json.
+"""
+
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from .deal_record import DealRecord
+from .html_backend import set_default_backend
+from .parser import extract_deals_from_html
+from .selector_cascade import SelectorStats, get_selector_stats, set_selector_stats
+from ..utils.logger import logger
+
+
+def _init_worker(backend: Optional[str]) -> None:
+    # Workers share stdout but not the rotating log file; only warnings get through
+    logger.remove()
+    logger.add(sys.stdout, level='WARNING', format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | parse-worker - {message}")
+    if backend:
+        set_default_backend(backend)
+    # Winners are read from disk once; outcomes go back to the parent instead of the file
+    set_selector_stats(SelectorStats(persist=False, track_deltas=True))
+
+
+def _parse_in_worker(html: str, url: str) -> Tuple[List[DealRecord], Dict]:
+    deals = extract_deals_from_html(html, url)
+    return deals, get_selector_stats().drain_deltas()
+
+
+class ParsePool:
+    """
+    Long-lived pool of parse worker processes (kept between job cycles,
+    like the warm Chrome drivers).
+    """
+
+    def __init__(self, workers: int = 2, backend: Optional[str] = None):
+        """
+        Args:
+            workers: Number of parse processes
+            backend: HTML parser backend used by the workers
+        """
+        self.workers = max(1, int(workers))
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def configure(self, workers: int, backend: Optional[str] = None) -> None:
+        """Applies new settings; the processes are restarted only if something changed."""
+        workers = max(1, int(workers))
+        with self._lock:
+            if workers == self.workers and backend == self.backend:
+                return
+            self.workers = workers
+            self.backend = backend
+            self._shutdown_locked()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that runs Selenium threads is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.backend,)
+                )
+                logger.info(f"Started {self.workers} parse worker processes")
+            return self._executor
+
+    def parse(self, html: str, url: str) -> List[DealRecord]:
+        """
+        Parses a page in a worker process (blocks the calling thread only).
+        Falls back to parsing in-process if the pool is broken.
+        """
+        try:
+            deals, deltas = self._get_executor().submit(_parse_in_worker, html, url).result()
+        except BrokenProcessPool as e:
+            logger.error(f"Parse pool broken ({e}), restarting it and parsing in-process")
+            with self._lock:
+                self._shutdown_locked()
+            return extract_deals_from_html(html, url, backend=self.backend)
+
+        get_selector_stats().merge(deltas)
+        return deals
+
+    def _shutdown_locked(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self) -> None:
+        """Stops the worker processes."""
+        with self._lock:
+            self._shutdown_locked()
+
+
+_parse_pool = None
+
+
+def get_parse_pool() -> ParsePool:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ParsePool()
+    return _parse_pool
@@ -1,8 +1,101 @@
 
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Optional
 import re
-from ..utils.logger import logger
+from .html_backend import parse_document
+from .category_classifier import get_category_classifier
+from .deal_record import DealRecord
+from .ml_structured_data import extract_ml_structured_deals
+from .selector_cascade import SelectorCascade
+from ..utils.logger import logger, is_debug_enabled
+
+# Selector cascades, in default priority order (newest layout first).
+# The selector that wins on a site/layout is tried first on later pages.
+# Catch-alls go in fallbacks: they match filters and banners too, so they
+# always stay last and never become the winner.
+ML_CARDS = SelectorCascade('mercadolivre', 'cards', (
+    'div[id="POLYCARD"]',  # React component (2024+)
+    'li.ui-search-layout__item',
+    'div.ui-search-result__wrapper',
+    'div.poly-card',
+), fallbacks=(
+    'li[class*="ui-search"]',
+    'div[class*="poly-card"]',
+    'ol.ui-search-layout li',
+    'div.andes-card',
+))
+ML_TITLE = SelectorCascade('mercadolivre', 'title', (
+    '.ui-search-item__title',
+    '.poly-component__title',
+    'h2.ui-search-item__title',
+), fallbacks=(
+    'h2',
+    'a[class*="title"]',
+))
+ML_LINK = SelectorCascade('mercadolivre', 'link', (
+    'a.ui-search-link',
+    'a.poly-component__title',
+    'a[href*="/MLB-"]',  # ML product URLs contain MLB-
+), fallbacks=('a',))
+ML_PRICE = SelectorCascade('mercadolivre', 'price', (
+    '.poly-price__current .andes-money-amount__fraction',
+    '.ui-search-price__second-line .andes-money-amount__fraction',
+    '.price-tag-amount .price-tag-fraction',  # Generic fallback
+))
+ML_OLD_PRICE = SelectorCascade('mercadolivre', 'old_price', (
+    '.poly-price__old .andes-money-amount__fraction',
+    '.ui-search-price__original-value .andes-money-amount__fraction',
+))
+SHOPEE_CARDS = SelectorCascade('shopee', 'cards', (
+    'li[data-sqe="item"]',
+    '.col-xs-2-4',
+    '.shopee-search-item-result__item',
+), fallbacks=('div[class*="item-card"]',))
+SHOPEE_LINK = SelectorCascade('shopee', 'link', ('a[data-sqe="link"]',), fallbacks=('a',))
+SHOPEE_TITLE = SelectorCascade('shopee', 'title', (
+    'div[data-sqe="name"]',
+    '.ie3A+n',
+    '.Cve6sh',
+), fallbacks=('[class*="name"]',))
+SHOPEE_PRICE = SelectorCascade('shopee', 'price', (
+    'span[data-sqe="price"]',
+    '.ZEgDH9',
+), fallbacks=('[class*="price"]',))
+
+# Raw-HTML markers of the results region (start / end). Only this slice is
+# parsed into a tree; headers, footers and carousels around it are skipped.
+RESULTS_REGION_MARKERS = {
+    'mercadolivre': (('ui-search-layout', 'ui-search-results', 'items-with-smart-groups'),
+                     ('ui-search-pagination', '<footer')),
+    'shopee': (('shopee-search-item-result', 'data-sqe="item"'),
+               ('shopee-page-controller', '<footer')),
+}
+
+
+def slice_results_region(html: str, site: str) -> Optional[str]:
+    """
+    Cuts the raw HTML down to the region holding the result cards.
+
+    Returns:
+        The HTML slice, or None if no start marker was found
+    """
+    start_markers, end_markers = RESULTS_REGION_MARKERS[site]
+    positions = [pos for pos in (html.find(marker) for marker in start_markers) if pos != -1]
+    if not positions:
+        return None
+    start = html.rfind('<', 0, min(positions))
+    if start == -1:
+        return None
+
+    end = len(html)
+    for marker in end_markers:
+        pos = html.find(marker, start + 1)
+        if pos != -1:
+            if not marker.startswith('<'):
+                pos = html.rfind('<', start + 1, pos)
+            if pos > start:
+                end = min(end, pos)
+    return html[start:end]
+
 
 def parse_price(price_str: str) -> float:
     """Extrai valor numérico de string de preço (ex: 'R$ 1.200,00' -> 1200.0)"""
@@ -15,58 +108,64 @@ def parse_price(price_str: str) -> float:
     except:
         return 0.0
 
-def extract_deals_from_html(html_content: str, source_url: str) -> List[Dict]:
+def _parse_cards(html_content: str, site: str, parse_fn, backend: Optional[str], partial: bool) -> List[DealRecord]:
+    """Parses only the results region when possible, the whole document otherwise."""
+    region = slice_results_region(html_content, site) if partial else None
+    if region is not None:
+        logger.debug(f"Partial parse: {len(region)} of {len(html_content)} chars")
+        deals = parse_fn(parse_document(region, backend))
+        if deals:
+            return deals
+        logger.debug("Partial parse found no deals, parsing the full document")
+    return parse_fn(parse_document(html_content, backend))
+
+
+def extract_deals_from_html(html_content: str, source_url: str, backend: Optional[str] = None,
+                            partial: bool = True) -> List[DealRecord]:
     """
     Parser determinístico para extrair ofertas do HTML do Mercado Livre e Shopee.
     Substitui a IA, sendo mais rápido e sem custos.
+    'backend' escolhe o parser HTML (html.parser, lxml, selectolax); por padrão
+    usa 'scraper.parser_backend' do config.json. Com 'partial', só a região
+    dos resultados vira árvore.
     """
     deals = []
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
+    logger.debug(f"HTML length: {len(html_content)}")
+
     try:
         if 'mercadolivre.com' in source_url:
-            deals = parse_mercadolivre(soup)
+            # Embedded JSON first (no DOM build); CSS selectors as fallback
+            deals = extract_ml_structured_deals(html_content)
+            if not deals:
+                deals = _parse_cards(html_content, 'mercadolivre', parse_mercadolivre, backend, partial)
         elif 'shopee.com' in source_url:
-            deals = parse_shopee(soup)
-            
+            deals = _parse_cards(html_content, 'shopee', parse_shopee, backend, partial)
+
+        assign_categories(deals, source_url)
         logger.info(f"Parser extracted {len(deals)} deals from {source_url}")
         return deals
     except Exception as e:
         logger.error(f"Error parsing HTML: {e}")
         return []
 
-def parse_mercadolivre(soup: BeautifulSoup) -> List[Dict]:
+def parse_mercadolivre(soup) -> List[DealRecord]:
     items = []
     
-    # Debug: Log HTML snippet to understand structure
-    logger.debug(f"HTML length: {len(str(soup))}")
-    
     # Try multiple selectors - ML uses React components now (POLYCARD)
-    # Priority order: newest -> oldest
-    cards = (soup.select('div[id="POLYCARD"]') or  # React component (2024+)
-             soup.select('li.ui-search-layout__item') or 
-             soup.select('div.ui-search-result__wrapper') or
-             soup.select('div.poly-card') or
-             soup.select('li[class*="ui-search"]') or
-             soup.select('div[class*="poly-card"]') or
-             soup.select('ol.ui-search-layout li') or
-             soup.select('div.andes-card'))
+    cards, layout = ML_CARDS.select(soup)
     
-    logger.info(f"Found {len(cards)} potential product cards in ML HTML")
+    logger.info(f"Found {len(cards)} potential product cards in ML HTML (layout: {layout})")
     
     if len(cards) == 0:
-        # Debug: print first 1000 chars to see what we got
-        html_sample = str(soup)[:1000]
-        logger.warning(f"No cards found. HTML sample: {html_sample}")
+        logger.warning("No cards found in ML HTML")
+        # Serializing the tree is expensive: only for debug logging
+        if is_debug_enabled():
+            logger.debug(f"HTML sample: {str(soup)[:1000]}")
     
     for card in cards:
         try:
             # TITLE - try multiple selectors
-            title_tag = (card.select_one('.ui-search-item__title') or
-                        card.select_one('.poly-component__title') or
-                        card.select_one('h2.ui-search-item__title') or
-                        card.select_one('h2') or
-                        card.select_one('a[class*="title"]'))
+            title_tag = ML_TITLE.select_one(card, layout)
             
             if not title_tag:
                 logger.debug("Skipping card: no title found")
@@ -74,10 +173,7 @@ def parse_mercadolivre(soup: BeautifulSoup) -> List[Dict]:
             title = title_tag.get_text().strip()
             
             # LINK - must have a product link
-            link_tag = (card.select_one('a.ui-search-link') or
-                       card.select_one('a.poly-component__title') or
-                       card.select_one('a[href*="/MLB-"]') or  # ML product URLs contain MLB-
-                       card.select_one('a'))
+            link_tag = ML_LINK.select_one(card, layout)
             
             if not link_tag or not link_tag.get('href'):
                 logger.debug(f"Skipping card '{title}': no valid link")
@@ -98,9 +194,7 @@ def parse_mercadolivre(soup: BeautifulSoup) -> List[Dict]:
             # Strategy: Try to find specific "current price" container first
             
             # 1. Try Specific Current Price Selectors (New Layout)
-            current_price_container = (card.select_one('.poly-price__current .andes-money-amount__fraction') or
-                                     card.select_one('.ui-search-price__second-line .andes-money-amount__fraction') or 
-                                     card.select_one('.price-tag-amount .price-tag-fraction')) # Generic fallback
+            current_price_container = ML_PRICE.select_one(card, layout)
             
             new_price = 0.0
             
@@ -137,22 +231,19 @@ def parse_mercadolivre(soup: BeautifulSoup) -> List[Dict]:
 
             # OLD PRICE EXTRACTION
             old_price = 0.0
-            old_price_container = (card.select_one('.poly-price__old .andes-money-amount__fraction') or
-                                  card.select_one('.ui-search-price__original-value .andes-money-amount__fraction'))
+            old_price_container = ML_OLD_PRICE.select_one(card, layout)
             
             if old_price_container:
                 old_price = parse_price(old_price_container.get_text().strip())
-            elif new_price > 0:
-                old_price = new_price * 1.3 # Fake if not found
 
             # Skip if no valid price
             if new_price == 0:
                 logger.debug(f"Skipping '{title}': no valid price")
                 continue
             
-            # Final sanity check: if old price < new price, swap them or fix
-            if old_price > 0 and old_price < new_price:
-                 old_price = new_price * 1.2 # Fix weird data
+            # No discount shown (or weird data): the old price is not invented
+            if old_price <= new_price:
+                old_price = 0.0
             
             # CENTS Handling (optional - append cents if found separately)
             # Some layouts have cents in a separate superscrit tag
@@ -171,19 +262,9 @@ def parse_mercadolivre(soup: BeautifulSoup) -> List[Dict]:
                     if src and not src.startswith('data:image'):
                         image_url = src
 
-            # CATEGORY DETECTION
-            category = detect_category(title, original_url)
-
-            logger.debug(f"Found deal: {title} - R$ {new_price} (Old: {old_price}) [{category}]")
+            logger.debug(f"Found deal: {title} - R$ {new_price} (Old: {old_price})")
             
-            items.append({
-                'title': title,
-                'new_price': new_price,
-                'old_price': old_price,
-                'original_url': original_url,
-                'image_url': image_url,
-                'category': category
-            })
+            items.append(DealRecord.create(title, new_price, original_url, old_price, image_url))
             
         except Exception as e:
             logger.debug(f"Error parsing card: {e}")
@@ -192,28 +273,22 @@ def parse_mercadolivre(soup: BeautifulSoup) -> List[Dict]:
     logger.info(f"Successfully parsed {len(items)} deals from Mercado Livre")
     return items
 
-def parse_shopee(soup: BeautifulSoup) -> List[Dict]:
+def parse_shopee(soup) -> List[DealRecord]:
     items = []
     # Generic selectors for Shopee item cards
-    cards = soup.select('li[data-sqe="item"]') or \
-            soup.select('.col-xs-2-4') or \
-            soup.select('.shopee-search-item-result__item') or \
-            soup.select('div[class*="item-card"]') # Generic fallback
-            
+    cards, layout = SHOPEE_CARDS.select(soup)
+
     for card in cards:
         try:
             # LINK
-            link_tag = card.select_one('a[data-sqe="link"]') or card.select_one('a')
+            link_tag = SHOPEE_LINK.select_one(card, layout)
             if not link_tag: continue
             url_suffix = link_tag.get('href')
             original_url = f"https://shopee.com.br{url_suffix}" if url_suffix.startswith('/') else url_suffix
             
             # TITLE
-            title_tag = card.select_one('div[data-sqe="name"]') or \
-                        card.select_one('.ie3A+n') or \
-                        card.select_one('.Cve6sh') or \
-                        card.select_one('[class*="name"]') # Generic fallback
-            
+            title_tag = SHOPEE_TITLE.select_one(card, layout)
+
             # Fallback title from image alt
             if not title_tag:
                  imgs = card.select('img')
@@ -223,9 +298,7 @@ def parse_shopee(soup: BeautifulSoup) -> List[Dict]:
                  title = title_tag.get_text().strip()
 
             # PRICE
-            price_tag = card.select_one('span[data-sqe="price"]') or \
-                        card.select_one('.ZEgDH9') or \
-                        card.select_one('[class*="price"]')
+            price_tag = SHOPEE_PRICE.select_one(card, layout)
             new_price = 0.0
             if price_tag:
                 new_price = parse_price(price_tag.get_text())
@@ -234,53 +307,30 @@ def parse_shopee(soup: BeautifulSoup) -> List[Dict]:
             img_tag = card.select_one('img')
             image_url = img_tag.get('src') if img_tag else None
             
-            # CATEGORY
-            category = detect_category(title, original_url)
-            
-            items.append({
-                'title': title,
-                'new_price': new_price,
-                'old_price': 0,
-                'original_url': original_url,
-                'image_url': image_url,
-                'category': category,
-                'store': 'Shopee'
-            })
+            items.append(DealRecord.create(title, new_price, original_url, image_url=image_url, store='Shopee'))
         except:
             continue
             
     return items
 
+def assign_categories(deals: List[DealRecord], listing_url: Optional[str] = None) -> List[DealRecord]:
+    """
+    Sets the category of every deal with one batch call to the classifier
+    (product URL, then listing URL, then title keywords).
+    """
+    if deals:
+        categories = get_category_classifier().classify_many(
+            [deal.title for deal in deals],
+            [deal.original_url for deal in deals],
+            listing_url
+        )
+        for deal, category in zip(deals, categories):
+            deal.category = category
+    return deals
+
 def detect_category(title: str, url: str) -> str:
     """
     Infers category from URL segments and title keywords.
-    Prioritizes URL context.
+    Prioritizes URL context. Rules live in category_rules.json.
     """
-    url_lower = url.lower()
-    title_lower = title.lower()
-    
-    # 1. URL Based Detection (Strongest Signal)
-    if 'celulares-telefones' in url_lower or 'celular' in url_lower:
-        return 'Celulares'
-    if 'informatica' in url_lower or 'notebook' in url_lower or 'computad' in url_lower:
-        return 'Informática'
-    if 'games' in url_lower or 'game' in url_lower or 'console' in url_lower or 'videogame' in url_lower:
-        return 'Games'
-    if 'eletrodomesticos' in url_lower:
-        return 'Casa'
-    if 'tv' in url_lower and 'audio' in url_lower:
-        return 'Eletrônicos'
-        
-    # 2. Title Keyword Fallback
-    if any(k in title_lower for k in ['iphone', 'samsung galaxy', 'motorola', 'xiaomi', 'redmi', 'smartphone']):
-        return 'Celulares'
-    if any(k in title_lower for k in ['notebook', 'laptop', 'macbook', 'dell', 'lenovo', 'acer', 'monitor', 'mouse', 'teclado']):
-        return 'Informática'
-    if any(k in title_lower for k in ['ps5', 'playstation', 'xbox', 'nintendo', 'switch', 'game', 'jogo']):
-        return 'Games'
-    if any(k in title_lower for k in ['tv', 'smart tv', 'som', 'fones', 'bluetooth']):
-        return 'Eletrônicos'
-    if any(k in title_lower for k in ['geladeira', 'fogão', 'microondas', 'aspirador', 'fritadeira', 'air fryer']):
-        return 'Casa'
-        
-    return 'Outros'
+    return get_category_classifier().classify(title, url)
@@ -0,0 +1,38 @@
+"""
+Price history of every parsed card.
+Each page's cards are appended to price_observations (and the daily min/max
+rollup) in one transaction; all-time lows are read back from the rollup with
+one query per page, before the page is recorded.
+"""
+
+from typing import Dict, List
+
+from .deal_record import DealRecord
+from ..database.models import load_all_time_lows, record_price_observations
+from ..utils.logger import logger
+
+
+def all_time_lows(deals: List[DealRecord]) -> Dict[str, int]:
+    """Lowest price ever observed (cents) for the page's products; empty on DB errors."""
+    try:
+        return load_all_time_lows([deal.external_id for deal in deals if deal.external_id])
+    except Exception as e:
+        logger.error(f"Could not load price history: {e}")
+        return {}
+
+
+def record_observations(deals: List[DealRecord]) -> int:
+    """
+    Appends the current price of every card with a product ID and a price.
+
+    Returns:
+        Number of observations written (0 on DB errors, which never stop the cycle)
+    """
+    rows = [{'external_id': deal.external_id, 'price_cents': deal.price_cents,
+             'old_price_cents': deal.old_price_cents}
+            for deal in deals if deal.external_id and deal.price_cents > 0]
+    try:
+        return record_price_observations(rows)
+    except Exception as e:
+        logger.error(f"Could not record price observations: {e}")
+        return 0
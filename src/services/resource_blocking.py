@@ -0,0 +1,119 @@
+"""
+Network resource blocking profiles for the scraper browser.
+Blocks images, fonts, media and analytics beacons through CDP
+(Network.setBlockedURLs): the parsers only read attributes, never bytes.
+"""
+
+from typing import Dict, List, Optional
+
+from ..utils.config_manager import get_scraper_config
+from ..utils.logger import logger
+
+# Applied to every site
+DEFAULT_BLOCKED_PATTERNS = [
+    # Images
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.ico',
+    # Fonts
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    # Media
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+    # Analytics / ads
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*connect.facebook.com*',
+    '*hotjar.com*', '*clarity.ms*', '*tiktok.com/i18n/pixel*',
+]
+
+# Extra patterns per site, matched by substring of the page URL
+SITE_BLOCKED_PATTERNS = {
+    'mercadolivre.com': [
+        '*melidata*',
+        '*mercadolibre.com/tracks*',
+        '*mercadolivre.com.br/gz/webdevice*',
+    ],
+    'shopee.com': [
+        # Image CDN serves files without extension
+        '*susercontent.com/file/*',
+        '*cf.shopee.com.br/file/*',
+        '*shopee.com.br/__t__*',
+        '*apm.shopee.com*',
+    ],
+}
+
+
+def get_blocking_config() -> Dict:
+    """Returns {'enabled': bool, 'patterns': {...}} from the scraper config."""
+    scraper_config = get_scraper_config()
+    return {
+        'enabled': bool(scraper_config.get('block_resources', True)),
+        'patterns': scraper_config.get('blocked_url_patterns', {}) or {},
+    }
+
+
+def get_blocked_patterns(url: str, extra_patterns: Optional[Dict[str, List[str]]] = None) -> List[str]:
+    """
+    Builds the blocked URL pattern list for a page.
+
+    Args:
+        url: Page URL about to be loaded
+        extra_patterns: Config overrides, {"default": [...], "shopee.com": [...]}
+    """
+    extra_patterns = extra_patterns or {}
+    patterns = list(DEFAULT_BLOCKED_PATTERNS) + list(extra_patterns.get('default', []))
+    for site, site_patterns in list(SITE_BLOCKED_PATTERNS.items()) + list(extra_patterns.items()):
+        if site != 'default' and site in url:
+            patterns.extend(site_patterns)
+    return patterns
+
+
+def apply_blocking_profile(driver, url: str, extra_patterns: Optional[Dict[str, List[str]]] = None) -> bool:
+    """
+    Sets the blocked URL patterns for the next navigation.
+    Call before driver.get(url); the profile is per site.
+
+    Returns:
+        True if the CDP commands succeeded
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': get_blocked_patterns(url, extra_patterns)
+        })
+        return True
+    except Exception as e:
+        logger.debug(f"Could not apply blocking profile: {e}")
+        return False
+
+
+# Transfer sizes of the document and every sub-resource, and navigation timings
+_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav ? (nav.transferSize || 0) : 0;
+var resources = performance.getEntriesByType('resource');
+for (var i = 0; i < resources.length; i++) { bytes += resources[i].transferSize || 0; }
+return {
+    bytes: bytes,
+    requests: resources.length + 1,
+    dom_content_loaded_ms: nav ? Math.round(nav.domContentLoadedEventEnd) : null
+};
+"""
+
+
+def collect_page_metrics(driver, monitor=None) -> Dict:
+    """
+    Measures the loaded page: bytes transferred, request count and DOMContentLoaded time.
+
+    CDP byte counts (from a NetworkMonitor) are preferred because Resource Timing
+    reports 0 bytes for cross-origin resources without Timing-Allow-Origin.
+    """
+    metrics = {'bytes': 0, 'requests': 0, 'blocked_requests': 0, 'dom_content_loaded_ms': None}
+    try:
+        metrics.update(driver.execute_script(_METRICS_SCRIPT) or {})
+    except Exception as e:
+        logger.debug(f"Could not read page metrics: {e}")
+
+    if monitor is not None and monitor.available:
+        monitor.poll(0)
+        metrics['bytes'] = monitor.bytes_received
+        metrics['requests'] = monitor.requests_seen
+        metrics['blocked_requests'] = monitor.requests_blocked
+    return metrics
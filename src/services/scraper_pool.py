@@ -0,0 +1,176 @@
+"""
+Parallel scraping worker pool.
+Fetches listing URLs concurrently on N headless Chrome workers,
+throttling each domain independently. Drivers are borrowed from the
+long-lived BrowserManager, so they stay warm between job cycles.
+With a ParsePool, parsing runs in worker processes while the fetch slot
+is already serving the next URL.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from .browser_manager import BrowserManager, get_browser_manager
+from .deal_record import DealRecord
+from .listing_fingerprint import FingerprintStore, get_fingerprint_store
+from .pagination import iter_listing_pages
+from .parse_pool import ParsePool
+from .parser import extract_deals_from_html
+from .simple_scraper_selenium import fetch_html_selenium
+from .tiered_fetcher import TierCache, accept_http_page, fetch_http_tier, fetch_selenium_tier, get_tier_cache
+from ..utils.logger import logger
+
+# Marks the end of one URL's crawl in the results queue
+_CRAWL_DONE = object()
+
+
+def domain_key(url: str) -> str:
+    """
+    Reduces a URL to the domain used for throttling.
+    'lista.mercadolivre.com.br' and 'www.mercadolivre.com.br' share the
+    key 'mercadolivre.com.br'.
+    """
+    host = (urlparse(url).hostname or '').lower()
+    labels = host.split('.')
+    # Country TLDs like .com.br need one extra label
+    keep = 3 if len(labels) >= 3 and len(labels[-2]) <= 3 and len(labels[-1]) == 2 else 2
+    return '.'.join(labels[-keep:])
+
+
+class ScraperPool:
+    """
+    Pool of worker threads that borrow Chrome drivers for each fetch.
+
+    Usage:
+        with ScraperPool(workers=3) as pool:
+            for url, page in pool.crawl_all(url_configs, is_known):
+                ...
+    """
+
+    def __init__(self, workers: int = 3, per_domain_limit: int = 2,
+                 domain_limits: Optional[Dict[str, int]] = None,
+                 browser_manager: Optional[BrowserManager] = None,
+                 parse_pool: Optional[ParsePool] = None,
+                 tier_cache: Optional[TierCache] = None,
+                 fingerprints: Optional[FingerprintStore] = None):
+        """
+        Args:
+            workers: Number of concurrent Chrome workers
+            per_domain_limit: Max concurrent fetches for any single domain
+            domain_limits: Per-domain overrides (e.g. {"shopee.com.br": 1})
+            browser_manager: Source of warm drivers (defaults to the shared one)
+            parse_pool: Parse pages in worker processes (None = parse in the fetch thread)
+            tier_cache: Fetch tier memory (defaults to the shared one)
+            fingerprints: Listing fingerprints (defaults to the shared store)
+        """
+        self.workers = max(1, int(workers))
+        self.per_domain_limit = max(1, int(per_domain_limit))
+        self.domain_limits = domain_limits or {}
+        self.browser_manager = browser_manager or get_browser_manager()
+        self.parse_pool = parse_pool
+        self._parse = parse_pool.parse if parse_pool else extract_deals_from_html
+        self.tier_cache = tier_cache or get_tier_cache()
+        self.fingerprints = fingerprints or get_fingerprint_store()
+
+        # Fetches are capped at 'workers'; extra threads only wait on parse results
+        self._fetch_slots = threading.BoundedSemaphore(self.workers)
+        self._lock = threading.Lock()
+        self._domain_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _domain_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        key = domain_key(url)
+        with self._lock:
+            semaphore = self._domain_semaphores.get(key)
+            if semaphore is None:
+                limit = max(1, int(self.domain_limits.get(key, self.per_domain_limit)))
+                semaphore = threading.BoundedSemaphore(limit)
+                self._domain_semaphores[key] = semaphore
+            return semaphore
+
+    def _fetch(self, url: str) -> Dict:
+        """
+        fetch_listing with the domain permit and fetch slot held only while downloading.
+        The domain permit comes first: URLs queued on a saturated domain wait
+        without a fetch slot, so other domains keep fetching.
+        """
+        tier_cache, fingerprints = self.tier_cache, self.fingerprints
+        try:
+            with self._domain_semaphore(url), self._fetch_slots:
+                result = fetch_http_tier(url, tier_cache, fingerprints)
+            # Parsed after releasing the slot, so the next fetch starts meanwhile
+            if result is not None and (result['unchanged'] or
+                                       accept_http_page(url, result, self._parse, tier_cache)):
+                return result
+
+            with self._domain_semaphore(url), self._fetch_slots:
+                # The driver is only borrowed if the HTTP tier is not enough
+                lease = self.browser_manager.lease()
+                try:
+                    selenium_fetch = partial(fetch_html_selenium, recover_driver=lease.replace)
+                    return fetch_selenium_tier(url, lease.get, tier_cache, selenium_fetch, fingerprints,
+                                               count_check=result is None)
+                finally:
+                    lease.release()
+        except Exception as e:
+            logger.error(f"Worker failed fetching {url}: {e}")
+            return {'html': '', 'tier': None, 'deals': None, 'metrics': {}, 'unchanged': False,
+                    'fingerprint': None}
+
+    def _crawl(self, url_config: Dict, is_known: Callable[[DealRecord], bool], results: queue.Queue) -> None:
+        url = url_config['url']
+        try:
+            for page in iter_listing_pages(url, int(url_config.get('max_pages', 1)),
+                                           fetch_page=self._fetch,
+                                           parse_page=self._parse,
+                                           is_known=is_known):
+                results.put((url, page))
+        except Exception as e:
+            logger.error(f"Worker failed crawling {url}: {e}")
+        finally:
+            results.put(_CRAWL_DONE)
+
+    def crawl_all(self, url_configs: Iterable[Dict], is_known: Callable[[DealRecord], bool]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Crawls every listing concurrently and yields (url, page) as each page is parsed.
+
+        Args:
+            url_configs: Dicts from config_manager.load_monitored_urls ('url', 'max_pages')
+            is_known: is_known(deal) -> True if already processed (stops deep crawls early)
+
+        Yields:
+            (url, page) where page is the fetch result dict with 'deals', 'page',
+            'page_url', 'tier' and 'metrics'
+        """
+        if self._executor is None:
+            threads = self.workers + (self.parse_pool.workers if self.parse_pool else 0)
+            self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='scraper')
+
+        results: queue.Queue = queue.Queue()
+        pending = 0
+        for url_config in url_configs:
+            self._executor.submit(self._crawl, url_config, is_known, results)
+            pending += 1
+
+        while pending:
+            item = results.get()
+            if item is _CRAWL_DONE:
+                pending -= 1
+                continue
+            yield item
+
+    def close(self):
+        """Shuts down the worker threads. Drivers stay warm in the BrowserManager."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
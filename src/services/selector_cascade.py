@@ -0,0 +1,195 @@
+"""
+Self-optimizing CSS selector cascades for the deal parser.
+Each cascade remembers which selector matched, per site and layout, and tries
+the current winner first on later pages. Catch-all fallbacks always stay last. Hit counters are persisted in
+data/selector_stats.json by the scheduler loop (periodically and at shutdown)
+and a winner change is logged as a possible layout change.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..utils.logger import logger
+from ..utils.state_store import JsonStateStore, get_data_path
+
+# Consecutive matches a challenger needs before it replaces the winner
+WINNER_SWITCH_STREAK = 5
+ANY_LAYOUT = '*'
+
+
+def stats_key(site: str, cascade: str, layout: str) -> str:
+    return f"{site}|{cascade}|{layout}"
+
+
+class SelectorStats:
+    """
+    Per-cascade hit counters and current winner, kept in memory and written
+    to disk with save() (by the scheduler loop, never per page or card).
+    """
+
+    def __init__(self, path: Optional[str] = None, persist: bool = True, track_deltas: bool = False):
+        """
+        Args:
+            path: State file (defaults to data/selector_stats.json)
+            persist: False makes save() a no-op (parse worker processes)
+            track_deltas: Keep the outcomes recorded since the last drain_deltas(),
+                so a worker process can hand them to the parent
+        """
+        self.store = JsonStateStore(path or get_data_path('selector_stats.json'))
+        self.persist = persist
+        self.track_deltas = track_deltas
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._deltas: Dict[str, Dict[Tuple[Optional[str], bool], int]] = {}
+
+    def winner(self, key: str) -> Optional[str]:
+        entry = self.store.get(key)
+        return entry.get('winner') if entry else None
+
+    def record(self, key: str, selector: Optional[str], promote: bool = True) -> None:
+        """
+        Records the outcome of one cascade evaluation.
+
+        Args:
+            key: stats_key(site, cascade, layout)
+            selector: Selector that matched, or None if none did
+            promote: False for catch-all fallbacks: the hit is counted but
+                never makes the selector the winner
+        """
+        with self._lock:
+            if self.track_deltas:
+                counts = self._deltas.setdefault(key, {})
+                counts[(selector, promote)] = counts.get((selector, promote), 0) + 1
+            entry = dict(self.store.get(key) or {'hits': {}, 'misses': 0, 'winner': None, 'streak': 0})
+            now = time.time()
+            if selector is None:
+                entry['misses'] = entry.get('misses', 0) + 1
+                entry['last_miss_at'] = now
+            else:
+                hits = dict(entry.get('hits') or {})
+                hits[selector] = hits.get(selector, 0) + 1
+                entry['hits'] = hits
+                entry['last_hit_at'] = now
+
+                if promote:
+                    self._update_winner(key, entry, selector, now)
+            self.store.set(key, entry, persist=False)
+            self._dirty = True
+
+    @staticmethod
+    def _update_winner(key: str, entry: Dict, selector: str, now: float) -> None:
+        winner = entry.get('winner')
+        if selector == winner or winner is None:
+            entry['winner'] = selector
+            entry['streak'] = 0
+            return
+        # Challenger must win several times in a row (mixed layouts do not flap)
+        if entry.get('challenger') == selector:
+            entry['streak'] = entry.get('streak', 0) + 1
+        else:
+            entry['challenger'] = selector
+            entry['streak'] = 1
+        if entry['streak'] >= WINNER_SWITCH_STREAK:
+            logger.warning(f"Selector winner changed for {key}: '{winner}' -> '{selector}' "
+                           f"(possible layout change)")
+            entry['winner'] = selector
+            entry['winner_changed_at'] = now
+            entry['streak'] = 0
+
+    def drain_deltas(self) -> Dict[str, Dict[Tuple[Optional[str], bool], int]]:
+        """Returns and clears the outcomes recorded since the last call."""
+        with self._lock:
+            deltas, self._deltas = self._deltas, {}
+        return deltas
+
+    def merge(self, deltas: Dict[str, Dict[Tuple[Optional[str], bool], int]]) -> None:
+        """Replays outcomes recorded by another process (see drain_deltas)."""
+        for key, counts in deltas.items():
+            for (selector, promote), count in counts.items():
+                for _ in range(count):
+                    self.record(key, selector, promote)
+
+    def save(self) -> None:
+        """Persists the counters if anything changed since the last save."""
+        if not self.persist:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+        self.store.save()
+
+    def all(self) -> Dict[str, Dict]:
+        return self.store.all()
+
+
+_selector_stats = None
+
+
+def get_selector_stats() -> SelectorStats:
+    global _selector_stats
+    if _selector_stats is None:
+        _selector_stats = SelectorStats()
+    return _selector_stats
+
+
+def set_selector_stats(stats: Optional[SelectorStats]) -> Optional[SelectorStats]:
+    """Replaces the shared stats (worker processes, benchmarks); returns the previous ones."""
+    global _selector_stats
+    previous, _selector_stats = _selector_stats, stats
+    return previous
+
+
+class SelectorCascade:
+    """Ordered list of alternative selectors for one element of a site's page."""
+
+    def __init__(self, site: str, name: str, selectors: Sequence[str], fallbacks: Sequence[str] = ()):
+        """
+        Args:
+            site: Site name (e.g. 'mercadolivre')
+            name: Cascade name (e.g. 'cards', 'title')
+            selectors: Specific selectors in their default priority order
+            fallbacks: Catch-all selectors tried after them, in order. They
+                match on almost any page, so they are never promoted to winner
+        """
+        self.site = site
+        self.name = name
+        self.selectors = tuple(selectors)
+        self.fallbacks = tuple(fallbacks)
+
+    def _ordered(self, key: str, stats: SelectorStats) -> Tuple[str, ...]:
+        winner = stats.winner(key)
+        if winner not in self.selectors or winner == self.selectors[0]:
+            return self.selectors + self.fallbacks
+        return (winner,) + tuple(s for s in self.selectors if s != winner) + self.fallbacks
+
+    def select(self, node, layout: str = ANY_LAYOUT,
+               stats: Optional[SelectorStats] = None) -> Tuple[List, Optional[str]]:
+        """
+        Returns the elements of the first selector that matches anything.
+
+        Returns:
+            (elements, matched selector); ([], None) if nothing matched
+        """
+        stats = stats or get_selector_stats()
+        key = stats_key(self.site, self.name, layout)
+        for selector in self._ordered(key, stats):
+            elements = node.select(selector)
+            if elements:
+                stats.record(key, selector, selector not in self.fallbacks)
+                return elements, selector
+        stats.record(key, None)
+        return [], None
+
+    def select_one(self, node, layout: str = ANY_LAYOUT, stats: Optional[SelectorStats] = None):
+        """Returns the first element matched by the cascade, or None."""
+        stats = stats or get_selector_stats()
+        key = stats_key(self.site, self.name, layout)
+        for selector in self._ordered(key, stats):
+            element = node.select_one(selector)
+            if element is not None:
+                stats.record(key, selector, selector not in self.fallbacks)
+                return element
+        stats.record(key, None)
+        return None
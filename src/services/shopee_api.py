@@ -0,0 +1,126 @@
+"""
+Shopee XHR/JSON capture mode.
+Instead of guessing obfuscated DOM class names, captures the page's own
+search / flash-sale API responses (CDP Network.getResponseBody) and builds
+deals straight from the structured item data.
+"""
+
+import base64
+import json
+from typing import Dict, Iterator, List
+
+from .deal_record import DealRecord
+from .parser import assign_categories
+from ..utils.logger import logger
+
+# API responses worth capturing on Shopee listing pages
+CAPTURE_PATTERNS = (
+    '/api/v4/search/search_items',
+    '/api/v4/flash_sale/flash_sale_batch_get_items',
+    '/api/v4/recommend/recommend',
+)
+
+IMAGE_BASE_URL = 'https://down-br.img.susercontent.com/file/'
+
+# Shopee API prices are in units of 1/100000 of a real
+PRICE_UNITS_PER_CENT = 1000
+
+
+def is_capture_url(url: str) -> bool:
+    """True for pages whose deals can be read from captured API responses."""
+    return 'shopee.com' in url
+
+
+def shopee_price_to_cents(value) -> int:
+    """Converts a Shopee API price (e.g. 2990000 -> R$ 29,90) to integer cents."""
+    try:
+        return int(value) // PRICE_UNITS_PER_CENT
+    except (TypeError, ValueError):
+        return 0
+
+
+def collect_json_responses(driver, responses: List[Dict]) -> List[Dict]:
+    """
+    Fetches and decodes the bodies of captured API responses.
+
+    Args:
+        driver: WebDriver still showing the page that issued the requests
+        responses: Dicts with 'requestId' and 'url' (from NetworkMonitor.responses)
+
+    Returns:
+        List of decoded JSON payloads
+    """
+    payloads = []
+    for response in responses:
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': response['requestId']})
+            text = body.get('body', '')
+            if body.get('base64Encoded'):
+                text = base64.b64decode(text).decode('utf-8')
+            payloads.append(json.loads(text))
+        except Exception as e:
+            logger.debug(f"Could not read response body of {response.get('url')}: {e}")
+    logger.info(f"Captured {len(payloads)} Shopee API responses")
+    return payloads
+
+
+def _iter_items(payload: Dict) -> Iterator[Dict]:
+    """Yields raw item dicts from any of the captured response shapes."""
+    if not isinstance(payload, dict):
+        return
+    # search_items: {"items": [{"item_basic": {...}}]}
+    for entry in payload.get('items') or []:
+        if isinstance(entry, dict):
+            yield entry.get('item_basic') or entry
+    data = payload.get('data')
+    if isinstance(data, dict):
+        # flash_sale_batch_get_items: {"data": {"items": [...]}}
+        for entry in data.get('items') or []:
+            if isinstance(entry, dict):
+                yield entry.get('item_basic') or entry
+        # recommend: {"data": {"sections": [{"data": {"item": [...]}}]}}
+        for section in data.get('sections') or []:
+            for entry in (section.get('data') or {}).get('item') or []:
+                if isinstance(entry, dict):
+                    yield entry
+
+
+def deals_from_payloads(payloads: List[Dict]) -> List[DealRecord]:
+    """
+    Builds deal records from captured Shopee API payloads (prices are already in cents).
+    Items are de-duplicated by (shopid, itemid).
+    """
+    deals = []
+    seen = set()
+    for payload in payloads:
+        for item in _iter_items(payload):
+            shop_id = item.get('shopid')
+            item_id = item.get('itemid')
+            title = (item.get('name') or '').strip()
+            if not shop_id or not item_id or not title or (shop_id, item_id) in seen:
+                continue
+            seen.add((shop_id, item_id))
+
+            price_cents = shopee_price_to_cents(item.get('price') or item.get('promotion_price') or item.get('price_min'))
+            if price_cents <= 0:
+                continue
+            old_price_cents = shopee_price_to_cents(item.get('price_before_discount'))
+            if old_price_cents <= price_cents:
+                old_price_cents = 0
+
+            original_url = f"https://shopee.com.br/product/{shop_id}/{item_id}"
+            image = item.get('image')
+
+            deals.append(DealRecord(
+                title=title,
+                price_cents=price_cents,
+                old_price_cents=old_price_cents,
+                original_url=original_url,
+                external_id=f"shp_{shop_id}_{item_id}",
+                store='Shopee',
+                image_url=f"{IMAGE_BASE_URL}{image}" if image else None,
+            ))
+
+    assign_categories(deals)
+    logger.info(f"Built {len(deals)} Shopee deals from API responses")
+    return deals
@@ -7,6 +7,20 @@ from webdriver_manager.chrome import ChromeDriverManager
 import time
 from bs4 import BeautifulSoup
 from ..utils.logger import logger
+from .page_readiness import NetworkMonitor, wait_until_ready
+from .resource_blocking import apply_blocking_profile, collect_page_metrics, get_blocking_config
+from .shopee_api import CAPTURE_PATTERNS, collect_json_responses
+
+# ChromeDriverManager().install() resolves the driver over the network; do it once
+_chromedriver_path = None
+
+def get_chromedriver_path() -> str:
+    global _chromedriver_path
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        return os.environ.get("CHROMEDRIVER_PATH")
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
 
 def get_driver():
     """
@@ -33,12 +47,12 @@ def get_driver():
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-software-rasterizer")
         chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.page_load_strategy = 'normal'
+        # Return at DOMContentLoaded; page_readiness decides when the listing is usable
+        chrome_options.page_load_strategy = 'eager'
+        # CDP Network events feed the network-idle readiness signal
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         
-        if os.environ.get("CHROMEDRIVER_PATH"):
-            service = Service(executable_path=os.environ.get("CHROMEDRIVER_PATH"))
-        else:
-            service = Service(ChromeDriverManager().install())
+        service = Service(executable_path=get_chromedriver_path())
         
         driver = webdriver.Chrome(service=service, options=chrome_options)
         
@@ -54,16 +68,27 @@ def get_driver():
                 })
             """
         })
+
+        # Block images/fonts/media/analytics (per-site patterns are applied on each fetch)
+        if get_blocking_config()['enabled']:
+            apply_blocking_profile(driver, '')
+        
         logger.info("Chrome Driver initialized successfully (headless mode)")
         return driver
     except Exception as e:
         logger.error(f"Failed to initialize Chrome Driver: {e}")
         return None
 
-def fetch_html_selenium(url: str, driver=None) -> str:
+def fetch_html_selenium(url: str, driver=None, recover_driver=None, metrics: dict = None, captured: list = None) -> str:
     """
     Fetches raw HTML using Selenium with retry logic.
     If driver is provided, reuses it. Otherwise creates a new one (legacy mode).
+    recover_driver(broken_driver) -> new_driver lets the owner of a shared
+    driver (BrowserManager lease) replace it when it crashes mid-run.
+    If a metrics dict is given it is filled with bytes transferred, request
+    counts and load time of the successful attempt.
+    If a captured list is given it is filled with the decoded JSON bodies of
+    the page's own API responses (Shopee search / flash sale XHRs).
     """
     should_quit = False
     if driver is None:
@@ -79,23 +104,36 @@ def fetch_html_selenium(url: str, driver=None) -> str:
     while retry_count < max_retries:
         try:
             logger.info(f"Navigating to: {url} (attempt {retry_count + 1}/{max_retries})")
-            driver.get(url)
+            blocking = get_blocking_config()
+            if blocking['enabled']:
+                apply_blocking_profile(driver, url, blocking['patterns'])
             
-            # Wait for JS to load
-            time.sleep(5) 
+            if captured is not None:
+                # getResponseBody needs the Network domain even without blocking
+                driver.execute_cdp_cmd('Network.enable', {})
             
-            # Scroll logic
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 3);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 1.5);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            monitor = NetworkMonitor(driver, capture_patterns=CAPTURE_PATTERNS if captured is not None else ())
+            monitor.reset()
+            started = time.monotonic()
+            driver.get(url)
+            
+            # Wait for per-site readiness signals (hard timeout inside)
+            wait_until_ready(driver, url, monitor=monitor)
             
             html = driver.page_source
             
             if html and len(html) > 100:
-                logger.info(f"Successfully fetched {len(html)} bytes")
+                page_metrics = collect_page_metrics(driver, monitor)
+                page_metrics['elapsed_ms'] = int((time.monotonic() - started) * 1000)
+                if metrics is not None:
+                    metrics.update(page_metrics)
+                if captured is not None:
+                    captured.extend(collect_json_responses(driver, monitor.responses))
+                logger.info(
+                    f"Successfully fetched {len(html)} bytes in {page_metrics['elapsed_ms']} ms "
+                    f"({page_metrics['bytes'] / 1024:.0f} KB transferred, "
+                    f"{page_metrics['requests']} requests, {page_metrics['blocked_requests']} blocked)"
+                )
                 return html
             else:
                 logger.warning(f"Page source too short, retrying...")
@@ -123,6 +161,11 @@ def fetch_html_selenium(url: str, driver=None) -> str:
                         driver = get_driver()
                         if not driver:
                             return ""
+                    elif recover_driver:
+                        logger.warning("Shared driver is unresponsive, asking owner for a new one")
+                        driver = recover_driver(driver)
+                        if not driver:
+                            return ""
             else:
                 logger.error(f"Max retries reached for {url}")
         
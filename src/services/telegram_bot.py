@@ -5,7 +5,9 @@ Supports DEBUG mode for testing without actually sending messages.
 
 import os
 import requests
-from typing import Dict, Optional
+from typing import Optional
+
+from .deal_record import DealRecord
 from ..utils.logger import logger
 
 
@@ -27,14 +29,14 @@ def escape_markdown(text: str) -> str:
 
 from ..utils.helpers import shorten_url
 
-def format_deal_message(deal_data: Dict) -> str:
+def format_deal_message(deal_data: DealRecord) -> str:
     # ... docstring ...
-    title = deal_data.get('title', 'Sem título')
-    old_price = deal_data.get('old_price', 0)
-    new_price = deal_data.get('new_price', 0)
-    affiliate_url = deal_data.get('affiliate_url', deal_data.get('original_url', ''))
-    coupon_code = deal_data.get('coupon_code')
-    coupon_discount = deal_data.get('coupon_discount')
+    title = deal_data.title or 'Sem título'
+    old_price = deal_data.old_price
+    new_price = deal_data.new_price
+    affiliate_url = deal_data.link
+    coupon_code = deal_data.coupon_code
+    coupon_discount = deal_data.coupon_discount
     
     # Shorten URL
     short_url = shorten_url(affiliate_url)
@@ -43,11 +45,17 @@ def format_deal_message(deal_data: Dict) -> str:
     message = f"🔥 *OFERTA IMPERDÍVEL* 🔥\\n\\n"
     message += f"📦 {escape_markdown(title)}\\n\\n"
     
-    if old_price and old_price > new_price:
+    if deal_data.old_price_cents > deal_data.price_cents:
         message += f"~~R$ {escape_markdown(f'{old_price:.2f}')}~~ ➡️ *R$ {escape_markdown(f'{new_price:.2f}')}*\\n\\n"
     else:
         message += f"💵 *R$ {escape_markdown(f'{new_price:.2f}')}*\\n\\n"
     
+    # Re-post of a known product
+    if deal_data.price_flag == 'all_time_low':
+        message += f"📉 *{escape_markdown('Menor preço já registrado!')}*\\n\\n"
+    elif deal_data.price_flag == 'price_drop':
+        message += f"📉 *Baixou de R$ {escape_markdown(f'{deal_data.previous_price_cents / 100:.2f}')}*\\n\\n"
+    
     # Add coupon info if available
     if coupon_code:
         message += f"🎟️ *CUPOM:* `{escape_markdown(coupon_code)}`\\n"
@@ -62,7 +70,7 @@ def format_deal_message(deal_data: Dict) -> str:
     return message
 
 
-def send_deal(deal_data: Dict, target_chat_id: Optional[str] = None) -> bool:
+def send_deal(deal_data: DealRecord, target_chat_id: Optional[str] = None) -> bool:
     """
     Send deal notification to Telegram.
     
@@ -70,7 +78,7 @@ def send_deal(deal_data: Dict, target_chat_id: Optional[str] = None) -> bool:
     In production mode, sends photo with caption to Telegram.
     
     Args:
-        deal_data: Deal dictionary with title, price, image_url, affiliate_url, etc.
+        deal_data: Deal record (title, prices, image_url, affiliate_url, etc.)
         target_chat_id: Optional specific chat_id to send to. If None, uses env var.
         
     Returns:
@@ -82,11 +90,11 @@ def send_deal(deal_data: Dict, target_chat_id: Optional[str] = None) -> bool:
     if debug_mode:
         logger.info("=" * 50)
         logger.info(f"DEBUG MODE: Deal would be sent to Telegram (ChatID: {target_chat_id or 'ENV'})")
-        logger.info(f"Title: {deal_data.get('title')}")
-        logger.info(f"Price: R$ {deal_data.get('new_price', 0):.2f}")
-        logger.info(f"Old Price: R$ {deal_data.get('old_price', 0):.2f}")
-        logger.info(f"URL: {deal_data.get('affiliate_url', deal_data.get('original_url'))}")
-        logger.info(f"Image: {deal_data.get('image_url', 'N/A')}")
+        logger.info(f"Title: {deal_data.title}")
+        logger.info(f"Price: R$ {deal_data.new_price:.2f}")
+        logger.info(f"Old Price: R$ {deal_data.old_price:.2f}")
+        logger.info(f"URL: {deal_data.link}")
+        logger.info(f"Image: {deal_data.image_url or 'N/A'}")
         logger.info("=" * 50)
         return True
     
@@ -101,7 +109,7 @@ def send_deal(deal_data: Dict, target_chat_id: Optional[str] = None) -> bool:
         
         # Format message
         caption = format_deal_message(deal_data)
-        image_url = deal_data.get('image_url')
+        image_url = deal_data.image_url
         
         # Telegram API endpoint
         base_url = f"https://api.telegram.org/bot{bot_token}"
@@ -128,7 +136,7 @@ def send_deal(deal_data: Dict, target_chat_id: Optional[str] = None) -> bool:
         response = requests.post(url, json=payload, timeout=10)
         response.raise_for_status()
         
-        logger.info(f"Deal sent to Telegram successfully: {deal_data.get('title')}")
+        logger.info(f"Deal sent to Telegram successfully: {deal_data.title}")
         return True
         
     except requests.exceptions.RequestException as e:
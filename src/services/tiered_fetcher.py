@@ -0,0 +1,260 @@
+"""
+Tiered page fetcher.
+Tries a pooled plain HTTP GET first and falls back to Selenium only when
+the HTTP response has no product cards or hits a bot wall. The tier that
+worked is remembered per URL so later runs go straight to it.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .deal_record import DealRecord
+from .listing_fingerprint import FingerprintStore, listing_fingerprint
+from .parser import extract_deals_from_html
+from .shopee_api import deals_from_payloads, is_capture_url
+from .simple_scraper_selenium import fetch_html_selenium
+from ..utils.config_manager import get_scraper_config
+from ..utils.logger import logger
+from ..utils.state_store import JsonStateStore, get_data_path
+
+TIER_HTTP = 'http'
+TIER_SELENIUM = 'selenium'
+
+# Re-probe the HTTP tier for URLs pinned to Selenium after this many seconds
+HTTP_RETRY_AFTER = 24 * 60 * 60
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate',
+    'Cache-Control': 'no-cache',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Redirect targets of captcha / verification / login walls
+BOT_WALL_URL_MARKERS = (
+    'account-verification',
+    'suspicious-traffic',
+    'captcha',
+    '/verify/traffic',
+    '/buyer/login',
+)
+
+# Body markers are kept narrow: real listings load recaptcha scripts too
+BOT_WALL_BODY_MARKERS = (
+    'account-verification',
+    'suspicious-traffic',
+    'px-captcha',
+)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Returns the shared keep-alive session (connection pool sized for the worker pool)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=1)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(BROWSER_HEADERS)
+            _session = session
+        return _session
+
+
+def is_bot_wall(status_code: int, final_url: str, html: str) -> bool:
+    """Detects blocked responses: rate limiting, captchas and login redirects."""
+    if status_code in (403, 429, 503):
+        return True
+    final_url = (final_url or '').lower()
+    if any(marker in final_url for marker in BOT_WALL_URL_MARKERS):
+        return True
+    head = (html or '')[:5000].lower()
+    return any(marker in head for marker in BOT_WALL_BODY_MARKERS)
+
+
+def fetch_html_http(url: str, timeout: float = 15.0) -> Dict:
+    """
+    Fetches a page with a plain HTTP GET.
+
+    Returns:
+        Dict with 'html', 'status', 'blocked' and 'metrics'
+    """
+    started = time.monotonic()
+    try:
+        response = get_http_session().get(url, timeout=timeout)
+        html = response.text
+        blocked = is_bot_wall(response.status_code, response.url, html)
+        metrics = {
+            'bytes': len(response.content),
+            'requests': 1,
+            'blocked_requests': 0,
+            'elapsed_ms': int((time.monotonic() - started) * 1000),
+        }
+        logger.info(
+            f"HTTP tier fetched {len(html)} bytes from {url} in {metrics['elapsed_ms']} ms "
+            f"(status {response.status_code})"
+        )
+        return {'html': html, 'status': response.status_code, 'blocked': blocked, 'metrics': metrics}
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"HTTP tier failed for {url}: {e}")
+        return {'html': '', 'status': 0, 'blocked': False, 'metrics': {}}
+
+
+class TierCache:
+    """Remembers which fetch tier worked for each URL (persisted in data/fetch_tiers.json)."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.store = JsonStateStore(path or get_data_path('fetch_tiers.json'))
+
+    def preferred_tier(self, url: str) -> str:
+        entry = self.store.get(url)
+        if not entry:
+            return TIER_HTTP
+        if entry.get('tier') == TIER_SELENIUM and time.time() - entry.get('updated_at', 0) > HTTP_RETRY_AFTER:
+            return TIER_HTTP
+        return entry.get('tier', TIER_HTTP)
+
+    def record(self, url: str, tier: str) -> None:
+        entry = self.store.get(url) or {}
+        if entry.get('tier') != tier:
+            logger.info(f"Fetch tier for {url}: {tier}")
+        self.store.set(url, {'tier': tier, 'updated_at': time.time()})
+
+
+_tier_cache = None
+
+
+def get_tier_cache() -> TierCache:
+    global _tier_cache
+    if _tier_cache is None:
+        _tier_cache = TierCache()
+    return _tier_cache
+
+
+def _check_fingerprint(url: str, html: str, fingerprints: Optional[FingerprintStore],
+                       count: bool = True):
+    """Returns (fingerprint, unchanged) of a fetched page; (None, False) without a store."""
+    if fingerprints is None:
+        return None, False
+    fingerprint = listing_fingerprint(html, url)
+    return fingerprint, fingerprints.check(url, fingerprint, count=count)
+
+
+def fetch_http_tier(url: str, tier_cache: TierCache,
+                    fingerprints: Optional[FingerprintStore] = None) -> Optional[Dict]:
+    """
+    HTTP half of fetch_listing: fetches the page without parsing it.
+
+    Returns:
+        Result dict ('deals' is [] when unchanged, None otherwise), or None
+        when the URL needs the Selenium tier (pinned, bot wall, empty response)
+    """
+    if tier_cache.preferred_tier(url) != TIER_HTTP:
+        return None
+    response = fetch_html_http(url)
+    if response['blocked']:
+        logger.warning(f"Bot wall detected on HTTP tier for {url}, falling back to Selenium")
+        return None
+    if not response['html']:
+        return None
+
+    fingerprint, unchanged = _check_fingerprint(url, response['html'], fingerprints)
+    if unchanged:
+        tier_cache.record(url, TIER_HTTP)
+    return {'html': response['html'], 'tier': TIER_HTTP, 'deals': [] if unchanged else None,
+            'metrics': response['metrics'], 'unchanged': unchanged, 'fingerprint': fingerprint}
+
+
+def accept_http_page(url: str, result: Dict, parse_fn: Callable, tier_cache: TierCache) -> bool:
+    """
+    Parses a page fetched by fetch_http_tier.
+
+    Returns:
+        True if it had cards (result['deals'] is set and the HTTP tier is
+        remembered), False if the Selenium tier is needed
+    """
+    deals: List[DealRecord] = parse_fn(result['html'], url)
+    if not deals:
+        logger.info(f"No cards in HTTP response for {url}, falling back to Selenium")
+        return False
+    tier_cache.record(url, TIER_HTTP)
+    result['deals'] = deals
+    return True
+
+
+def fetch_selenium_tier(url: str, driver_provider: Callable, tier_cache: TierCache,
+                        selenium_fetch: Callable = fetch_html_selenium,
+                        fingerprints: Optional[FingerprintStore] = None, count_check: bool = True) -> Dict:
+    """
+    Selenium half of fetch_listing.
+
+    Args:
+        count_check: False when the HTTP attempt already counted this fetch
+            as one fingerprint check
+    """
+    driver = driver_provider()
+    if not driver:
+        logger.error(f"No driver available for {url}")
+        return {'html': '', 'tier': TIER_SELENIUM, 'deals': None, 'metrics': {}, 'unchanged': False,
+                'fingerprint': None}
+
+    metrics = {}
+    if is_capture_url(url) and get_scraper_config().get('shopee_capture_mode', 'xhr') == 'xhr':
+        # Read deals from the page's own API responses instead of the obfuscated DOM
+        captured = []
+        html = selenium_fetch(url, driver=driver, metrics=metrics, captured=captured)
+        deals = deals_from_payloads(captured) if captured else None
+    else:
+        html = selenium_fetch(url, driver=driver, metrics=metrics)
+        deals = None
+
+    fingerprint = None
+    if html:
+        tier_cache.record(url, TIER_SELENIUM)
+        fingerprint, unchanged = _check_fingerprint(url, html, fingerprints, count=count_check)
+        if unchanged:
+            return {'html': html, 'tier': TIER_SELENIUM, 'deals': [], 'metrics': metrics, 'unchanged': True,
+                    'fingerprint': fingerprint}
+    # Empty capture falls back to DOM parsing (deals=None)
+    return {'html': html, 'tier': TIER_SELENIUM, 'deals': deals or None, 'metrics': metrics, 'unchanged': False,
+            'fingerprint': fingerprint}
+
+
+def fetch_listing(url: str, driver_provider: Callable, tier_cache: Optional[TierCache] = None,
+                  parse_fn: Callable = extract_deals_from_html,
+                  selenium_fetch: Callable = fetch_html_selenium,
+                  fingerprints: Optional[FingerprintStore] = None) -> Dict:
+    """
+    Fetches and parses a listing page using the cheapest tier that works.
+
+    Args:
+        url: Listing URL
+        driver_provider: Callable returning a WebDriver (only called for the Selenium tier)
+        tier_cache: TierCache instance (defaults to the shared one)
+        parse_fn: Parser used to validate the HTTP response, parse_fn(html, url)
+        selenium_fetch: Selenium fetch function, selenium_fetch(url, driver=..., metrics=...)
+        fingerprints: When given, pages whose product IDs/prices match the last
+            committed fingerprint are returned with no deals and 'unchanged' set.
+            The caller commits 'fingerprint' once the page's deals are saved.
+
+    Returns:
+        Dict with 'html', 'tier', 'deals' (None when the HTML was not parsed yet),
+        'metrics' (bytes transferred, requests, elapsed_ms of the winning tier),
+        'unchanged' and 'fingerprint'
+    """
+    tier_cache = tier_cache or get_tier_cache()
+
+    result = fetch_http_tier(url, tier_cache, fingerprints)
+    if result is not None and (result['unchanged'] or accept_http_page(url, result, parse_fn, tier_cache)):
+        return result
+    return fetch_selenium_tier(url, driver_provider, tier_cache, selenium_fetch, fingerprints,
+                               count_check=result is None)
@@ -0,0 +1,138 @@
+"""
+Per-URL adaptive polling scheduler.
+Each monitored URL has its own interval; in adaptive mode the interval
+shrinks when a crawl yields new deals and grows when it yields nothing.
+URLs are kept in a priority queue ordered by their next due time.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional
+
+from ..utils.logger import logger
+from ..utils.state_store import JsonStateStore, get_data_path
+
+# Adaptive mode multipliers
+SPEEDUP_FACTOR = 0.5
+SLOWDOWN_FACTOR = 1.5
+
+
+class UrlScheduler:
+    """
+    Priority queue of monitored URLs keyed by next run time.
+    Adaptive intervals are persisted in data/url_schedule.json.
+    """
+
+    def __init__(self, default_interval_minutes: float = 30, path: Optional[str] = None):
+        """
+        Args:
+            default_interval_minutes: Interval for URLs without 'interval_minutes'
+            path: State file (defaults to data/url_schedule.json)
+        """
+        self.default_interval_minutes = default_interval_minutes
+        self.store = JsonStateStore(path or get_data_path('url_schedule.json'))
+        self._configs: Dict[str, Dict] = {}
+        self._heap: List = []
+        self._next_run: Dict[str, float] = {}
+
+    def _base_interval(self, config: Dict) -> float:
+        interval = config.get('interval_minutes') or self.default_interval_minutes
+        return interval if interval > 0 else 30
+
+    def interval_minutes(self, url: str) -> float:
+        """Current interval of a URL (adaptive value if enabled)."""
+        config = self._configs.get(url, {})
+        base = self._base_interval(config)
+        if not config.get('adaptive'):
+            return base
+        state = self.store.get(url) or {}
+        return state.get('interval_minutes', base)
+
+    def sync(self, url_configs: List[Dict], default_interval_minutes: Optional[float] = None) -> None:
+        """
+        Updates the monitored URL set. New URLs are due immediately,
+        removed URLs are dropped from the queue.
+        """
+        if default_interval_minutes is not None:
+            self.default_interval_minutes = default_interval_minutes
+
+        self._configs = {config['url']: config for config in url_configs}
+        now = time.time()
+        for url in self._configs:
+            if url not in self._next_run:
+                self._schedule(url, now)
+
+        for url in list(self._next_run):
+            if url not in self._configs:
+                del self._next_run[url]
+
+    def _schedule(self, url: str, when: float) -> None:
+        self._next_run[url] = when
+        heapq.heappush(self._heap, (when, url))
+
+    def _peek(self):
+        # Skip stale heap entries (rescheduled or removed URLs)
+        while self._heap:
+            when, url = self._heap[0]
+            if self._next_run.get(url) == when:
+                return when, url
+            heapq.heappop(self._heap)
+        return None
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the next URL is due (0 if one is due now), None if empty."""
+        head = self._peek()
+        if head is None:
+            return None
+        return max(0.0, head[0] - time.time())
+
+    def pop_due(self, now: Optional[float] = None) -> List[Dict]:
+        """Removes and returns the configs of every URL that is due."""
+        now = now or time.time()
+        due = []
+        while True:
+            head = self._peek()
+            if head is None or head[0] > now:
+                break
+            heapq.heappop(self._heap)
+            url = head[1]
+            del self._next_run[url]
+            due.append(self._configs[url])
+        return due
+
+    def make_all_due(self) -> None:
+        """Force run: every URL becomes due now."""
+        now = time.time()
+        for url in self._configs:
+            self._schedule(url, now)
+
+    def record_run(self, url: str, new_deals: int) -> None:
+        """
+        Reschedules a URL after a crawl, adapting its interval to the observed yield.
+
+        Args:
+            url: Monitored URL
+            new_deals: Number of new deals the crawl produced
+        """
+        config = self._configs.get(url)
+        if config is None:
+            return
+
+        state = dict(self.store.get(url) or {'runs': 0, 'total_new_deals': 0})
+        state['runs'] = state.get('runs', 0) + 1
+        state['total_new_deals'] = state.get('total_new_deals', 0) + new_deals
+        state['last_new_deals'] = new_deals
+        state['last_run_at'] = time.time()
+
+        interval = self.interval_minutes(url)
+        if config.get('adaptive'):
+            base = self._base_interval(config)
+            min_interval = config.get('min_interval_minutes') or base / 4
+            max_interval = config.get('max_interval_minutes') or base * 4
+            factor = SPEEDUP_FACTOR if new_deals > 0 else SLOWDOWN_FACTOR
+            interval = min(max_interval, max(min_interval, interval * factor))
+            logger.info(f"Adaptive interval for {url}: {interval:.1f} min ({new_deals} new deals)")
+        state['interval_minutes'] = interval
+
+        self.store.set(url, state)
+        self._schedule(url, time.time() + interval * 60)
@@ -3,12 +3,50 @@ import json
 import os
 import time
 
+from .logger import logger
+
 CONFIG_FILE = 'config.json'
+URLS_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'urls_config.json')
+CATEGORY_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'category_rules.json')
+
+# Per-URL settings; overridden by "url_defaults" and "url_settings" in urls_config.json
+DEFAULT_URL_SETTINGS = {
+    "max_pages": 1,
+    "interval_minutes": None,  # None = global interval_minutes from config.json
+    "adaptive": False,
+    "min_interval_minutes": None,
+    "max_interval_minutes": None
+}
+
+FALLBACK_URLS = [
+    "https://lista.mercadolivre.com.br/celulares-telefones/_Orden_sold_quantity",
+    "https://lista.mercadolivre.com.br/computadores/_Orden_sold_quantity",
+    "https://lista.mercadolivre.com.br/saude/suplementos-alimentares/_Orden_sold_quantity",
+    "https://lista.mercadolivre.com.br/animais/_Orden_sold_quantity",
+    "https://lista.mercadolivre.com.br/calcados-roupas-bolsas/_Orden_sold_quantity"
+]
+
+DEFAULT_SCRAPER_CONFIG = {
+    "workers": 3,
+    "per_domain_limit": 2,
+    "domain_limits": {},
+    "max_page_loads_per_driver": 200,
+    "max_driver_rss_mb": 1500,
+    "block_resources": True,
+    "blocked_url_patterns": {},
+    "shopee_capture_mode": "xhr",
+    "parser_backend": "lxml",
+    "parse_workers": 2,
+    "reprice_threshold_pct": 10,
+    "reprice_window_days": 30
+}
 
 DEFAULT_CONFIG = {
     "interval_minutes": 30,
     "force_run": False,
-    "last_run_timestamp": 0
+    "last_run_timestamp": 0,
+    "retention_days": 90,
+    "scraper": DEFAULT_SCRAPER_CONFIG
 }
 
 def load_config():
@@ -49,6 +87,15 @@ def should_run():
         
     return False
 
+def consume_force_run():
+    """Returns True once if a force run was requested (dashboard /trigger) and clears the flag."""
+    config = load_config()
+    if config.get('force_run'):
+        config['force_run'] = False
+        save_config(config)
+        return True
+    return False
+
 def update_last_run():
     config = load_config()
     config['last_run_timestamp'] = time.time()
@@ -63,3 +110,68 @@ def set_interval(minutes):
     config = load_config()
     config['interval_minutes'] = int(minutes)
     save_config(config)
+
+def get_scraper_config():
+    """
+    Returns scraper settings merged over the defaults.
+    'domain_limits' overrides 'per_domain_limit' for specific domains
+    (e.g. {"shopee.com.br": 1}).
+    """
+    config = load_config()
+    scraper_config = dict(DEFAULT_SCRAPER_CONFIG)
+    scraper_config.update(config.get('scraper', {}))
+    return scraper_config
+
+def load_monitored_urls():
+    """
+    Loads monitored URLs with their per-URL settings from urls_config.json.
+
+    Returns:
+        List of dicts: {"url": ..., "max_pages": ..., "interval_minutes": ..., "adaptive": ...}
+    """
+    urls_config = {}
+    try:
+        if os.path.exists(URLS_CONFIG_FILE):
+            with open(URLS_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                urls_config = json.load(f)
+        else:
+            logger.warning("URLs config file not found")
+    except Exception as e:
+        logger.error(f"Error loading URLs config: {e}")
+
+    # Filter out empty strings
+    urls = [url.strip() for url in urls_config.get('urls_to_monitor', []) if url and url.strip()]
+
+    if urls:
+        logger.debug(f"Loaded {len(urls)} URLs from config")
+    else:
+        urls = list(FALLBACK_URLS)
+        logger.warning(f"Using fallback URLs: {len(urls)} URLs")
+
+    defaults = dict(DEFAULT_URL_SETTINGS)
+    defaults.update(urls_config.get('url_defaults', {}))
+    url_settings = urls_config.get('url_settings', {})
+
+    monitored = []
+    for url in urls:
+        settings = dict(defaults)
+        settings.update(url_settings.get(url, {}))
+        settings['url'] = url
+        monitored.append(settings)
+    return monitored
+
+def load_category_rules():
+    """
+    Loads category classification rules from category_rules.json.
+
+    Returns:
+        Dict with "default_category" and a "rules" list (empty if the file is missing)
+    """
+    try:
+        if os.path.exists(CATEGORY_RULES_FILE):
+            with open(CATEGORY_RULES_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        logger.warning("Category rules file not found, every deal will be 'Outros'")
+    except Exception as e:
+        logger.error(f"Error loading category rules: {e}")
+    return {"default_category": "Outros", "rules": []}
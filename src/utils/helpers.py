@@ -39,8 +39,10 @@ def extract_product_id(url: str) -> str:
             if shopee_match:
                 return f"shp_{shopee_match.group(1)}_{shopee_match.group(2)}"
             
-            # Try finding just numbers at the end
-            # ...
+            # Try /product/shopid/itemid pattern
+            shopee_match = re.search(r'/product/(\d+)/(\d+)', url)
+            if shopee_match:
+                return f"shp_{shopee_match.group(1)}_{shopee_match.group(2)}"
             
         # Fallback to simple split logic but cleaner
         # Remove query params
@@ -1,12 +1,17 @@
 """
 Logger configuration using loguru.
 Outputs to both stdout and rotating log file.
+Level comes from LOG_LEVEL (default DEBUG).
 """
 
 from loguru import logger
+from dotenv import load_dotenv
 import sys
 import os
 
+load_dotenv()
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG').upper()
+
 # Ensure logs directory exists
 os.makedirs('logs', exist_ok=True)
 
@@ -17,7 +22,7 @@ logger.remove()
 logger.add(
     sys.stdout,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="DEBUG",
+    level=LOG_LEVEL,
     colorize=True
 )
 
@@ -25,12 +30,16 @@ logger.add(
 logger.add(
     "logs/bot.log",
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
+    level=LOG_LEVEL,
     rotation="5 MB",  # Rotate when file reaches 5MB
     retention="10 days",  # Keep logs for 10 days
     compression="zip",  # Compress rotated logs
     encoding="utf-8"
 )
 
+def is_debug_enabled() -> bool:
+    """True if DEBUG messages are logged (gate for expensive diagnostics)."""
+    return logger.level(LOG_LEVEL).no <= logger.level("DEBUG").no
+
 # Export configured logger
-__all__ = ['logger']
+__all__ = ['logger', 'is_debug_enabled']
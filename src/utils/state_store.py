@@ -0,0 +1,67 @@
+"""
+Small JSON-backed key/value store for per-URL runtime state
+(fetch tiers, fingerprints, scheduler stats...).
+Files live in the project's data/ directory next to deals.db.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+data_dir = os.path.join(base_dir, 'data')
+
+
+def get_data_path(filename: str) -> str:
+    """Returns the absolute path of a file inside data/, creating the directory."""
+    os.makedirs(data_dir, exist_ok=True)
+    return os.path.join(data_dir, filename)
+
+
+class JsonStateStore:
+    """Thread-safe dict persisted as a JSON file. Writes are atomic (temp file + rename)."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: JSON file path
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._data: Dict[str, Any] = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any, persist: bool = True) -> None:
+        with self._lock:
+            self._data[key] = value
+            if persist:
+                self.save()
+
+    def all(self) -> Dict[str, Any]:
+        """Returns a shallow copy of the whole store."""
+        with self._lock:
+            return dict(self._data)
+
+    def save(self) -> None:
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,111 @@
+"""
+Test script for the warm browser service (fake drivers, no Chrome)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services import browser_manager
+from src.services.browser_manager import BrowserManager
+
+
+class FakeDriver:
+    def __init__(self, rss_mb=100):
+        self.alive = True
+        self.quit_called = False
+        self.rss_mb = rss_mb
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError('chrome not reachable')
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self):
+        self.drivers.append(FakeDriver())
+        return self.drivers[-1]
+
+
+def load_pages(manager, count):
+    """Runs count single-page leases and returns the drivers they used."""
+    used = []
+    for _ in range(count):
+        lease = manager.lease()
+        used.append(lease.get())
+        lease.release()
+    return used
+
+
+def test_driver_reused_then_recycled_after_page_loads():
+    factory = FakeFactory()
+    manager = BrowserManager(max_page_loads=3, max_rss_mb=10_000, driver_factory=factory)
+
+    used = load_pages(manager, 4)
+    assert used[:3] == [factory.drivers[0]] * 3
+    assert used[3] is factory.drivers[1]
+    assert factory.drivers[0].quit_called and not factory.drivers[1].quit_called
+
+
+def test_driver_recycled_when_rss_grows():
+    factory = FakeFactory()
+    manager = BrowserManager(max_page_loads=100, max_rss_mb=500, driver_factory=factory)
+    original = browser_manager.driver_rss_mb
+    browser_manager.driver_rss_mb = lambda driver: driver.rss_mb
+    try:
+        first = load_pages(manager, 1)[0]
+        first.rss_mb = 800
+        second = load_pages(manager, 1)[0]
+    finally:
+        browser_manager.driver_rss_mb = original
+    assert second is not first
+    assert first.quit_called
+
+
+def test_dead_driver_replaced_after_health_check():
+    factory = FakeFactory()
+    manager = BrowserManager(driver_factory=factory)
+
+    first = load_pages(manager, 1)[0]
+    first.alive = False
+    second = load_pages(manager, 1)[0]
+    assert second is factory.drivers[1]
+    assert first.quit_called
+
+    # Crash mid-fetch: the lease swaps in a fresh driver and releases that one
+    lease = manager.lease()
+    assert lease.get() is second
+    third = lease.replace()
+    lease.release()
+    assert third is factory.drivers[2] and second.quit_called
+    assert load_pages(manager, 1)[0] is third
+
+
+def test_idle_pool_size_and_shutdown():
+    factory = FakeFactory()
+    manager = BrowserManager(max_idle=1, driver_factory=factory)
+    leases = [manager.lease() for _ in range(2)]
+    drivers = [lease.get() for lease in leases]
+    for lease in leases:
+        lease.release()
+    # Only one driver stays warm
+    assert not drivers[0].quit_called and drivers[1].quit_called
+
+    manager.shutdown()
+    assert drivers[0].quit_called
+
+
+if __name__ == "__main__":
+    test_driver_reused_then_recycled_after_page_loads()
+    test_driver_recycled_when_rss_grows()
+    test_dead_driver_replaced_after_health_check()
+    test_idle_pool_size_and_shutdown()
+    print("✅ Browser manager tests passed!")
@@ -0,0 +1,88 @@
+"""
+Test script for the compiled category classifier (category_rules.json)
+"""
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.category_classifier import CategoryClassifier, get_category_classifier
+from src.services.parser import detect_category
+
+RULES = {
+    "default_category": "Outros",
+    "rules": [
+        {"category": "Celulares", "priority": 50, "url_keywords": ["celulares-telefones"],
+         "url_category_ids": ["MLB1051"], "title_keywords": ["iphone", "smartphone"]},
+        {"category": "Games", "priority": 30, "url_keywords": ["games"],
+         "url_category_ids": ["MLB1144"], "title_keywords": ["jogo", "ps5"]},
+        {"category": "Eletrônicos", "priority": 10, "title_keywords": ["tv", "smart tv", "som"]},
+    ]
+}
+
+
+def test_word_boundaries_and_priorities():
+    classifier = CategoryClassifier(RULES)
+    assert classifier.classify('Smart TV 50 polegadas') == 'Eletrônicos'
+    # 'som' must not match inside 'somente'
+    assert classifier.classify('Camiseta somente hoje') == 'Outros'
+    # Higher priority wins when several rules match
+    assert classifier.classify('Jogo para PS5 + Smartphone') == 'Celulares'
+
+
+def test_url_rules_and_ml_category_ids():
+    classifier = CategoryClassifier(RULES)
+    ofertas = 'https://www.mercadolivre.com.br/ofertas?cat=MLB1144&category=MLB1144'
+    assert classifier.classify('Controle sem fio', listing_url=ofertas) == 'Games'
+    # Longer IDs are different categories
+    assert classifier.classify('Controle sem fio', listing_url='https://x/ofertas?cat=MLB11440') == 'Outros'
+    product = 'https://produto.mercadolivre.com.br/MLB-123-capa/celulares-telefones'
+    assert classifier.classify('Capa', product, listing_url=ofertas) == 'Celulares'
+
+
+def test_title_keywords_win_over_listing_url():
+    # Same order as the original detect_category: product URL, title, and only then the listing
+    classifier = CategoryClassifier(RULES)
+    ofertas = 'https://www.mercadolivre.com.br/ofertas?cat=MLB1144'
+    assert classifier.classify('Smart TV 50 polegadas', listing_url=ofertas) == 'Eletrônicos'
+    assert classifier.classify_many(['Smart TV', 'Controle'], listing_url=ofertas) == ['Eletrônicos', 'Games']
+
+
+def test_batch_matches_single_calls():
+    classifier = CategoryClassifier(RULES)
+    titles = ['iPhone 15', 'TV Box', 'Cadeira', 'Jogo de panelas\ncom tampa', '']
+    assert classifier.classify_many(titles) == [classifier.classify(t) for t in titles]
+    assert classifier.classify_many(titles) == ['Celulares', 'Eletrônicos', 'Outros', 'Games', 'Outros']
+
+
+def test_hundreds_of_keywords_stay_fast():
+    rules = {"rules": [
+        {"category": f"Cat{i}", "priority": i, "title_keywords": [f"produto{i}x{k}" for k in range(20)]}
+        for i in range(50)
+    ]}
+    classifier = CategoryClassifier(rules)
+    titles = [f"Oferta produto{i % 50}x{i % 20} imperdível" for i in range(2000)]
+    started = time.perf_counter()
+    categories = classifier.classify_many(titles)
+    assert time.perf_counter() - started < 1.0
+    assert categories[:3] == ['Cat0', 'Cat1', 'Cat2']
+
+
+def test_shipped_rules():
+    assert get_category_classifier().default_category == 'Outros'
+    assert detect_category('Console PlayStation 5', 'https://www.mercadolivre.com.br/p/MLB1') == 'Games'
+    assert detect_category('Fritadeira Air Fryer 4L', 'https://shopee.com.br/product/1/2') == 'Casa'
+    # Eletrônicos keywords were checked before Casa in the original detect_category
+    assert detect_category('Air Fryer com Bluetooth', 'https://shopee.com.br/product/1/2') == 'Eletrônicos'
+
+
+if __name__ == "__main__":
+    test_word_boundaries_and_priorities()
+    test_url_rules_and_ml_category_ids()
+    test_title_keywords_win_over_listing_url()
+    test_batch_matches_single_calls()
+    test_hundreds_of_keywords_stay_fast()
+    test_shipped_rules()
+    print("✅ Category classifier tests passed!")
@@ -0,0 +1,41 @@
+"""
+Test script for batch deduplication and bulk insert (temporary database)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database import models
+from src.database.migrations import migrate
+from src.database.models import ARCHIVE_MIGRATIONS, MIGRATIONS, Deal, archive_db, db, filter_unprocessed, get_processed_index, save_deal, save_deals_bulk
+from testing_utils import deal_row, temp_databases
+
+
+def test_filter_unprocessed_and_bulk_insert():
+    with temp_databases():
+        # Migrated schema: the deal_stats triggers must not inflate the count
+        migrate(db, MIGRATIONS)
+        migrate(archive_db, ARCHIVE_MIGRATIONS)
+        save_deal(**deal_row('MLB1'))
+
+        # Duplicates and saved IDs removed, order kept; more IDs than one IN chunk
+        ids = ['MLB3', 'MLB1', 'MLB2', 'MLB3'] + [f"MLB{i}" for i in range(1000, 1000 + models.MAX_SQL_VARIABLES)]
+        unprocessed = filter_unprocessed(ids)
+        assert unprocessed[:2] == ['MLB3', 'MLB2']
+        assert len(unprocessed) == 2 + models.MAX_SQL_VARIABLES
+
+        inserted = save_deals_bulk([deal_row(external_id) for external_id in unprocessed] + [deal_row('MLB1', 5.0)])
+        assert inserted == len(unprocessed)
+        assert Deal.select().count() == len(unprocessed) + 1
+        # Conflicting row ignored, not overwritten
+        assert float(Deal.get(Deal.external_id == 'MLB1').price) == 10.0
+
+        assert filter_unprocessed(ids + ['MLB9']) == ['MLB9']
+        assert get_processed_index().contains('MLB2')
+
+
+if __name__ == "__main__":
+    test_filter_unprocessed_and_bulk_insert()
+    print("✅ Database bulk tests passed!")
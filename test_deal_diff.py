@@ -0,0 +1,45 @@
+"""
+Test script for card-level change detection (new products and price drops)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.deal_diff import DealChangeDetector
+from testing_utils import deal_card
+
+
+def test_only_new_and_dropped_cards_pass():
+    detector = DealChangeDetector(threshold_pct=10, prices={'MLB1': 10000, 'MLB2': 10000, 'MLB3': 10000})
+    page = [deal_card('1', 100.0), deal_card('2', 95.0), deal_card('3', 60.0), deal_card('4', 50.0)]
+
+    changed = detector.diff(page)
+    assert [deal.external_id for deal in changed] == ['MLB3', 'MLB4']
+    assert changed[0].previous_price_cents == 10000
+    assert changed[1].previous_price_cents == 0
+
+    # Posted drop becomes the new reference
+    detector.commit(changed[0])
+    assert detector.is_unchanged(deal_card('3', 60.0))
+    assert not detector.is_unchanged(deal_card('5', 10.0))
+
+
+def test_reference_follows_price_increases():
+    detector = DealChangeDetector(threshold_pct=10, prices={'MLB1': 10000})
+    assert detector.diff([deal_card('1', 150.0)]) == []
+    # 20% below the highest price seen since the post
+    assert len(detector.diff([deal_card('1', 120.0)])) == 1
+
+
+def test_zero_threshold_disables_reposts():
+    detector = DealChangeDetector(threshold_pct=0, prices={'MLB1': 10000})
+    assert detector.diff([deal_card('1', 10.0)]) == []
+
+
+if __name__ == "__main__":
+    test_only_new_and_dropped_cards_pass()
+    test_reference_follows_price_increases()
+    test_zero_threshold_disables_reposts()
+    print("✅ Deal diff tests passed!")
@@ -0,0 +1,59 @@
+"""
+Test script for the deal_stats summary row maintained by triggers (temporary database)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database.migrations import migrate
+from src.database.models import MIGRATIONS, Deal, db, load_deal_stats, save_deal, save_deals_bulk, update_deal_price
+from src.services.deal_record import DealRecord
+from testing_utils import deal_row, temp_databases
+
+
+def full_scan_stats():
+    deals = list(Deal.select())
+    discounted = [deal for deal in deals if deal.discount_pct]
+    return {
+        'total_deals': len(deals),
+        'deals_with_discount': len(discounted),
+        'total_savings': round(sum(float(deal.old_price - deal.price) for deal in discounted), 2),
+        'avg_discount': int(sum(deal.discount_pct for deal in discounted) / len(discounted)) if discounted else 0,
+    }
+
+
+def test_discount_pct():
+    assert DealRecord.create('A', 75, 'https://produto.mercadolivre.com.br/MLB-1', 100).discount_pct == 25.0
+    assert DealRecord.create('A', 75, 'https://produto.mercadolivre.com.br/MLB-1').discount_pct == 0.0
+    assert DealRecord.create('A', 120, 'https://produto.mercadolivre.com.br/MLB-1', 100).discount_pct == 0.0
+
+
+def test_stats_row_follows_writes():
+    with temp_databases():
+        migrate(db, MIGRATIONS)
+        assert load_deal_stats(read_only=False)['total_deals'] == 0
+
+        save_deal(**deal_row('MLB1', 80, 100))
+        save_deal(**deal_row('MLB2', 50))
+        save_deals_bulk([deal_row('MLB3', 30, 60), deal_row('MLB4', 90, 100), deal_row('MLB1', 10, 100)])
+        stats = load_deal_stats(read_only=False)
+        assert stats == full_scan_stats()
+        assert stats['total_deals'] == 4 and stats['total_savings'] == 60.0
+
+        # Re-post at a lower price, then deletes (retention, /clear-deals)
+        repost = deal_row('MLB2', 40, 50)
+        update_deal_price('MLB2', repost['price'], None, repost['old_price'], repost['discount_pct'])
+        assert load_deal_stats(read_only=False) == full_scan_stats()
+        Deal.delete().where(Deal.external_id == 'MLB3').execute()
+        assert load_deal_stats(read_only=False) == full_scan_stats()
+        Deal.delete().execute()
+        assert load_deal_stats(read_only=False) == {'total_deals': 0, 'deals_with_discount': 0,
+                                                    'total_savings': 0.0, 'avg_discount': 0}
+
+
+if __name__ == "__main__":
+    test_discount_pct()
+    test_stats_row_follows_writes()
+    print("✅ Deal stats tests passed!")
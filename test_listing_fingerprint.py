@@ -0,0 +1,53 @@
+"""
+Test script for listing fingerprints (check/commit) and stopping the crawl on unchanged pages
+"""
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.listing_fingerprint import FingerprintStore
+from src.services.pagination import iter_listing_pages
+
+URL = 'https://lista.mercadolivre.com.br/celulares'
+
+
+def test_fingerprint_only_skips_after_commit():
+    store = FingerprintStore(os.path.join(tempfile.mkdtemp(), 'fingerprints.json'))
+
+    # Fetched but never stored (processing failed): next run parses again
+    assert not store.check(URL, 'abc')
+    assert not store.check(URL, 'abc')
+
+    store.commit(URL, 'abc')
+    assert store.check(URL, 'abc')
+    assert not store.check(URL, 'def')
+    assert not store.check(URL, None)
+    assert store.check(URL, 'abc', count=False)
+
+    stats = store.stats()[URL]
+    assert stats['checks'] == 5 and stats['skips'] == 1
+
+
+def test_crawl_stops_after_unchanged_page():
+    fetched = []
+
+    def fetch_page(page_url):
+        fetched.append(page_url)
+        if len(fetched) == 2:
+            return {'html': '<html></html>', 'deals': [], 'unchanged': True}
+        return {'html': '<html></html>', 'deals': ['new deal'], 'unchanged': False}
+
+    pages = list(iter_listing_pages(URL, 5, fetch_page, parse_page=lambda html, url: [],
+                                    is_known=lambda deal: False))
+    # Like a page of known products: the deeper pages are not fetched
+    assert [page['page'] for page in pages] == [0, 1]
+    assert pages[1]['unchanged'] and len(fetched) == 2
+
+
+if __name__ == "__main__":
+    test_fingerprint_only_skips_after_commit()
+    test_crawl_stops_after_unchanged_page()
+    print("✅ Listing fingerprint tests passed!")
@@ -0,0 +1,72 @@
+"""
+Test script for the versioned schema migration runner (temporary database)
+"""
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from peewee import SqliteDatabase
+
+from src.database.migrations import Migration, current_version, migrate
+from src.database.models import MIGRATIONS, Deal
+
+
+class CountingDatabase(SqliteDatabase):
+    queries = 0
+
+    def execute_sql(self, sql, params=None, *args, **kwargs):
+        self.queries += 1
+        return super().execute_sql(sql, params, *args, **kwargs)
+
+
+def test_legacy_database_is_upgraded_once():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = CountingDatabase(os.path.join(tmp_dir, 'deals.db'))
+        # Schema of the first release
+        database.execute_sql('CREATE TABLE deals (id INTEGER PRIMARY KEY, external_id VARCHAR(255) NOT NULL UNIQUE, '
+                             'title VARCHAR(255) NOT NULL, price DECIMAL(10, 2) NOT NULL, original_url TEXT NOT NULL, '
+                             'affiliate_url TEXT, sent_at DATETIME NOT NULL)')
+        for i in range(1500):
+            url = f"https://produto.mercadolivre.com.br/MLB-{i}" if i % 2 else f"https://shopee.com.br/item-{i}"
+            database.execute_sql("INSERT INTO deals (external_id, title, price, original_url, sent_at) "
+                                 "VALUES (?, 'Produto', 10, ?, '2025-01-01 00:00:00')", (f"ID{i}", url))
+
+        assert current_version(database) == 0
+        assert migrate(database, MIGRATIONS) == [1, 2, 3]
+        assert current_version(database) == len(MIGRATIONS)
+
+        columns = {column.name for column in database.get_columns('deals')}
+        assert {'image_url', 'category', 'store'} <= columns
+        assert any(index.columns == ['sent_at'] for index in database.get_indexes('deals'))
+        with Deal.bind_ctx(database):
+            assert Deal.select().where(Deal.store == 'Mercado Livre').count() == 750
+            assert Deal.select().where(Deal.store == 'Shopee').count() == 750
+            assert Deal.get(Deal.external_id == 'ID1').category == 'Outros'
+        # Summary row seeded from the existing rows
+        assert database.execute_sql('SELECT deal_count FROM deal_stats').fetchone()[0] == 1500
+
+        # Up-to-date startup is a single query
+        database.queries = 0
+        assert migrate(database, MIGRATIONS) == []
+        assert database.queries == 1
+        database.close()
+
+
+def test_only_new_steps_run():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = SqliteDatabase(os.path.join(tmp_dir, 'test.db'))
+        calls = []
+        steps = [Migration(1, 'one', lambda d: calls.append(1)), Migration(2, 'two', lambda d: calls.append(2))]
+        assert migrate(database, steps[:1]) == [1]
+        assert migrate(database, steps) == [2]
+        assert calls == [1, 2]
+        database.close()
+
+
+if __name__ == "__main__":
+    test_legacy_database_is_upgraded_once()
+    test_only_new_steps_run()
+    print("✅ Migration tests passed!")
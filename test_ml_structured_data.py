@@ -0,0 +1,64 @@
+"""
+Test script for the Mercado Livre structured-data (embedded JSON) extractor
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.ml_structured_data import extract_ml_structured_deals, find_preloaded_state
+from src.services.parser import extract_deals_from_html
+from testing_utils import temp_selector_stats
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+LISTING_URL = 'https://lista.mercadolivre.com.br/celulares-telefones/celulares-smartphones/'
+
+
+def load_fixture(*parts):
+    with open(os.path.join(FIXTURES_DIR, *parts), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_preloaded_state_polycards():
+    html = load_fixture('ml_structured', 'listing_preloaded_state.html')
+    assert find_preloaded_state(html)['note'] == '</script> inside a string'
+
+    deals = extract_ml_structured_deals(html)
+    # Duplicate and price-less cards are dropped
+    assert len(deals) == 2
+    first = deals[0]
+    assert first.title == 'Samsung Galaxy A15 128GB'
+    assert first.new_price == 899.90
+    assert first.price_cents == 89990
+    assert first.external_id == 'MLB3456789012'
+    assert first.store == 'Mercado Livre'
+    assert first.old_price == 1299.0
+    assert first.original_url.startswith('https://produto.mercadolivre.com.br/MLB-3456789012')
+    assert first.image_url == 'https://http2.mlstatic.com/D_NQ_NP_654321-MLA74123456789_012024-O.webp'
+    # No previous price: old price is not invented
+    assert deals[1].old_price == 0
+
+
+def test_json_ld_fallback():
+    deals = extract_ml_structured_deals(load_fixture('ml_structured', 'listing_json_ld.html'))
+    assert len(deals) == 1
+    assert deals[0].new_price == 3599.0
+    assert deals[0].image_url.endswith('-O.webp')
+
+
+@temp_selector_stats()
+def test_parser_prefers_structured_data_and_falls_back_to_css():
+    deals = extract_deals_from_html(load_fixture('ml_structured', 'listing_preloaded_state.html'), LISTING_URL)
+    assert [d.category for d in deals] == ['Celulares', 'Celulares']
+
+    # Page without embedded JSON goes through the CSS selectors
+    css_deals = extract_deals_from_html(load_fixture('http_tier', 'ml_listing.html'), LISTING_URL)
+    assert len(css_deals) == 2
+
+
+if __name__ == "__main__":
+    test_preloaded_state_polycards()
+    test_json_ld_fallback()
+    test_parser_prefers_structured_data_and_falls_back_to_css()
+    print("✅ ML structured data tests passed!")
@@ -0,0 +1,91 @@
+"""
+Test script for the page readiness engine (fake driver, no Chrome)
+"""
+import sys
+import os
+import json
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.page_readiness import DEFAULT_PROFILE, SITE_PROFILES, get_site_profile, wait_until_ready
+
+ML_URL = 'https://lista.mercadolivre.com.br/celulares'
+SHOPEE_URL = 'https://shopee.com.br/search?keyword=fone'
+FAST = dict(poll_interval=0.01, settle_time=0.05)
+
+
+class FakeDriver:
+    """Answers the readiness probe from a card count script; optional endless network traffic."""
+
+    def __init__(self, card_counts, busy_network=False):
+        self.card_counts = list(card_counts)
+        self.busy_network = busy_network
+        self.probes = 0
+        self.scrolls = 0
+        self.selectors = None
+
+    def execute_script(self, script, *args):
+        if 'scrollTo' in script:
+            self.scrolls += 1
+            return None
+        self.selectors = args[0]
+        cards = self.card_counts[min(self.probes, len(self.card_counts) - 1)]
+        self.probes += 1
+        return ['complete' if self.probes > 1 else 'loading', cards, self.probes]
+
+    def get_log(self, log_type):
+        if not self.busy_network:
+            return []
+        # A new request every poll: the network never goes idle
+        event = {'method': 'Network.requestWillBeSent', 'params': {'requestId': f"req{self.probes}"}}
+        return [{'message': json.dumps({'message': event})}]
+
+
+def test_site_profiles():
+    assert get_site_profile(ML_URL) is SITE_PROFILES['mercadolivre.com']
+    assert get_site_profile(SHOPEE_URL) is SITE_PROFILES['shopee.com']
+    assert get_site_profile('https://example.com/') is DEFAULT_PROFILE
+
+
+def test_ml_ready_once_cards_settle():
+    driver = FakeDriver([0, 0, 12, 24, 48])
+    result = wait_until_ready(driver, ML_URL, timeout=5, **FAST)
+    assert result['ready'] and result['reason'] == 'settled'
+    assert result['cards'] == 48
+    assert driver.selectors == SITE_PROFILES['mercadolivre.com']['card_selectors']
+    # Server-rendered: no scrolling
+    assert driver.scrolls == 0
+
+
+def test_ml_times_out_without_cards():
+    result = wait_until_ready(FakeDriver([0]), ML_URL, timeout=0.2, **FAST)
+    assert not result['ready'] and result['reason'] == 'timeout'
+    assert result['cards'] == 0 and 0.2 <= result['elapsed'] < 2
+
+
+def test_shopee_scrolls_and_waits_for_network_idle():
+    driver = FakeDriver([0, 20])
+    result = wait_until_ready(driver, SHOPEE_URL, timeout=5, **FAST)
+    assert result['ready'] and result['cards'] == 20
+    assert driver.scrolls == SITE_PROFILES['shopee.com']['scroll_steps']
+
+    # Cards are there, but XHRs keep coming
+    busy = FakeDriver([20], busy_network=True)
+    result = wait_until_ready(busy, SHOPEE_URL, timeout=0.3, **FAST)
+    assert not result['ready'] and result['reason'] == 'timeout' and result['cards'] == 20
+    assert busy.scrolls == 0
+
+
+def test_unknown_site_only_needs_idle_network():
+    result = wait_until_ready(FakeDriver([0]), 'https://example.com/', timeout=5, **FAST)
+    assert result['ready'] and result['cards'] == 0
+
+
+if __name__ == "__main__":
+    test_site_profiles()
+    test_ml_ready_once_cards_settle()
+    test_ml_times_out_without_cards()
+    test_shopee_scrolls_and_waits_for_network_idle()
+    test_unknown_site_only_needs_idle_network()
+    print("✅ Page readiness tests passed!")
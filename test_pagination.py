@@ -0,0 +1,82 @@
+"""
+Test script for listing pagination (page URLs and early stop on known products)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.pagination import iter_listing_pages, page_url
+
+ML_LISTING = 'https://lista.mercadolivre.com.br/celulares-telefones/_Orden_sold_quantity'
+
+
+def test_ml_offsets():
+    assert page_url(ML_LISTING, 0) == ML_LISTING
+    assert page_url(ML_LISTING, 1) == 'https://lista.mercadolivre.com.br/celulares-telefones/_Desde_49_Orden_sold_quantity'
+    assert page_url(ML_LISTING, 2, page_size=50) == \
+        'https://lista.mercadolivre.com.br/celulares-telefones/_Desde_101_Orden_sold_quantity'
+    # No filter segment yet; an existing offset is replaced
+    assert page_url('https://lista.mercadolivre.com.br/celulares', 1) == \
+        'https://lista.mercadolivre.com.br/celulares/_Desde_49'
+    assert page_url('https://lista.mercadolivre.com.br/celulares/_Desde_49_Orden_price_asc', 2) == \
+        'https://lista.mercadolivre.com.br/celulares/_Desde_97_Orden_price_asc'
+
+
+def test_ml_fragments_are_dropped():
+    url = ('https://lista.mercadolivre.com.br/_TempoFrete_DiaSeguinte_Container_necessaire-de-verao'
+           '#applied_filter_id%3Dshipping_time_highlighted_nextday')
+    assert page_url(url, 1) == 'https://lista.mercadolivre.com.br/_Desde_49_TempoFrete_DiaSeguinte_Container_necessaire-de-verao'
+
+    ofertas = 'https://www.mercadolivre.com.br/ofertas?cat=MLB1144&category=MLB1144#c_container_id=MLB779362-1'
+    # /ofertas pages are 1-based ?page=N
+    assert page_url(ofertas, 1) == 'https://www.mercadolivre.com.br/ofertas?cat=MLB1144&category=MLB1144&page=2'
+
+
+def test_shopee_pages():
+    assert page_url('https://shopee.com.br/search?category=11036030', 1) == \
+        'https://shopee.com.br/search?category=11036030&page=1'
+    assert page_url('https://shopee.com.br/search?keyword=fone&page=3', 2) == \
+        'https://shopee.com.br/search?keyword=fone&page=2'
+    assert page_url('https://shopee.com.br/flash_sale', 1) is None
+    assert page_url('https://example.com/listing', 1) is None
+
+
+def crawl(pages, max_pages, known=()):
+    fetched = []
+
+    def fetch_page(url):
+        fetched.append(url)
+        return {'html': '<html></html>', 'deals': list(pages[len(fetched) - 1])}
+
+    results = list(iter_listing_pages(ML_LISTING, max_pages, fetch_page, parse_page=lambda html, url: [],
+                                      is_known=lambda deal: deal in known))
+    return results, fetched
+
+
+def test_stops_on_page_of_known_products():
+    pages = [['MLB1', 'MLB2'], ['MLB3', 'MLB4'], ['MLB5']]
+    results, fetched = crawl(pages, 5, known={'MLB3', 'MLB4'})
+    assert [result['page'] for result in results] == [0, 1]
+    assert len(fetched) == 2
+
+    # One new product keeps the crawl going; an empty page ends it
+    results, fetched = crawl(pages + [[]], 5, known={'MLB3'})
+    assert [len(result['deals']) for result in results] == [2, 2, 1, 0]
+
+
+def test_first_page_size_sets_offsets():
+    pages = [[f"MLB{i}" for i in range(50)], ['MLB100']]
+    results, fetched = crawl(pages, 2)
+    assert fetched[1] == 'https://lista.mercadolivre.com.br/celulares-telefones/_Desde_51_Orden_sold_quantity'
+    assert results[1]['page_url'] == fetched[1]
+
+
+if __name__ == "__main__":
+    test_ml_offsets()
+    test_ml_fragments_are_dropped()
+    test_shopee_pages()
+    test_stops_on_page_of_known_products()
+    test_first_page_size_sets_offsets()
+    print("✅ Pagination tests passed!")
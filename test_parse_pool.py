@@ -0,0 +1,44 @@
+"""
+Test script for the process-pool parse offload (offline, saved pages)
+"""
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.parse_pool import ParsePool
+from src.services.parser import extract_deals_from_html
+from src.services.selector_cascade import SelectorStats, set_selector_stats, stats_key
+
+PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                    'benchmarks', 'corpus', 'v1', 'pages', 'ml_search_layout_item.html')
+URL = 'https://lista.mercadolivre.com.br/computadores/_Orden_sold_quantity'
+
+
+def test_pool_matches_inline_parse_and_merges_selector_stats():
+    with open(PAGE, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        parent_stats = SelectorStats(os.path.join(tmp_dir, 'selector_stats.json'))
+        previous = set_selector_stats(parent_stats)
+        pool = ParsePool(workers=2, backend='html.parser')
+        try:
+            deals = pool.parse(html, URL)
+            assert len(deals) == 8
+            assert deals == extract_deals_from_html(html, URL, backend='html.parser')
+
+            # Worker outcomes were replayed into the parent's stats, saved by the scheduler loop
+            parent_stats.save()
+            hits = SelectorStats(os.path.join(tmp_dir, 'selector_stats.json')).all()
+            assert hits[stats_key('mercadolivre', 'cards', '*')]['hits'] == {'li.ui-search-layout__item': 2}
+        finally:
+            pool.shutdown()
+            set_selector_stats(previous)
+
+
+if __name__ == "__main__":
+    test_pool_matches_inline_parse_and_merges_selector_stats()
+    print("✅ Parse pool tests passed!")
@@ -0,0 +1,74 @@
+"""
+Test script for the pluggable HTML parser backends (same deals on every backend)
+and the results-region partial parse
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.html_backend import (
+    BACKENDS, FALLBACK_BACKEND, is_backend_available, parse_document, set_default_backend
+)
+from src.services.parser import extract_deals_from_html, slice_results_region
+from testing_utils import temp_selector_stats
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'http_tier', 'ml_listing.html')
+LISTING_URL = 'https://lista.mercadolivre.com.br/ofertas'
+
+
+def load_fixture():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@temp_selector_stats()
+def test_backends_extract_same_deals():
+    html = load_fixture()
+    reference = extract_deals_from_html(html, LISTING_URL, backend=FALLBACK_BACKEND)
+    assert len(reference) == 2
+
+    for backend in BACKENDS:
+        if is_backend_available(backend):
+            assert extract_deals_from_html(html, LISTING_URL, backend=backend) == reference, backend
+
+
+def test_node_interface():
+    for backend in BACKENDS:
+        if not is_backend_available(backend):
+            continue
+        root = parse_document('<div><a class="x" href="/p">Produto <b>1</b></a></div>', backend)
+        link = root.select_one('a.x')
+        assert link.get('href') == '/p'
+        assert link.get('data-src') is None
+        assert link.get_text().strip() == 'Produto 1'
+        assert root.select_one('a.missing') is None
+        assert len(root.select('a')) == 1
+
+
+def test_unknown_backend_falls_back():
+    assert set_default_backend('does-not-exist') == FALLBACK_BACKEND
+
+
+@temp_selector_stats()
+def test_partial_parse_slices_results_region():
+    html = load_fixture()
+    region = slice_results_region(html, 'mercadolivre')
+    assert region.startswith('<ol class="ui-search-layout">')
+    assert '<head>' not in region
+    assert extract_deals_from_html(html, LISTING_URL, partial=True) == \
+        extract_deals_from_html(html, LISTING_URL, partial=False)
+
+    # Marker only in an inline style: the slice has no cards, full parse is used
+    decoy = html.replace('<head>', '<head><style>.ui-search-layout{} .ui-search-pagination{}</style>')
+    assert len(extract_deals_from_html(decoy, LISTING_URL)) == 2
+    assert slice_results_region('<html></html>', 'shopee') is None
+
+
+if __name__ == "__main__":
+    test_backends_extract_same_deals()
+    test_node_interface()
+    test_unknown_backend_falls_back()
+    test_partial_parse_slices_results_region()
+    print("✅ Parser backend tests passed!")
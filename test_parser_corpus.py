@@ -0,0 +1,46 @@
+"""
+Regression test: parser field accuracy over the saved page corpus
+(benchmarks/corpus/v1) must not fall below the recorded baseline
+"""
+import sys
+import os
+import json
+
+# Add parent directory to path
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+from parser_corpus import CORPUS_DIR, load_corpus, run_corpus, score_deals
+
+
+def test_score_deals():
+    expected = [{'title': 'A', 'new_price': 10.0, 'old_price': 0, 'original_url': 'u1', 'image_url': None, 'category': 'Casa'}]
+    score = score_deals([{'title': 'A', 'new_price': 10, 'old_price': 13.0, 'original_url': 'u1', 'category': 'Casa'},
+                         {'title': 'B', 'original_url': 'u2'}], expected)
+    assert score['correct'] == {'title': 1, 'new_price': 1, 'old_price': 0, 'original_url': 1, 'image_url': 1, 'category': 1}
+    assert score['unexpected'] == ['u2'] and score['missing'] == []
+
+
+def test_corpus_covers_layouts():
+    layouts = {page['layout'] for page in load_corpus('v1')['pages']}
+    assert {'POLYCARD', 'ui-search-layout__item', 'shopee data-sqe'} <= layouts
+
+
+def test_accuracy_not_below_baseline():
+    with open(os.path.join(CORPUS_DIR, 'v1', 'baseline.json'), 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['min_accuracy']
+
+    report = run_corpus('v1', repeat=1)
+    for page in report['pages']:
+        assert not page['missing'], (page['id'], page['missing'])
+        assert not page['unexpected'], (page['id'], page['unexpected'])
+    for field, minimum in baseline.items():
+        assert report['summary']['accuracy'][field] >= minimum, (field, report['summary']['accuracy'][field])
+
+
+if __name__ == "__main__":
+    test_score_deals()
+    test_corpus_covers_layouts()
+    test_accuracy_not_below_baseline()
+    print("✅ Parser corpus regression tests passed!")
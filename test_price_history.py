@@ -0,0 +1,62 @@
+"""
+Test script for the price history tables and all-time-low re-posts (temporary database)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database.models import PriceDaily, PriceObservation, db, load_all_time_lows, record_price_observations
+from src.services.deal_diff import DealChangeDetector
+from src.services.telegram_bot import format_deal_message
+from testing_utils import deal_card, temp_databases
+
+DAY = 86400
+
+
+def test_observations_and_daily_rollup():
+    with temp_databases():
+        db.create_tables([PriceObservation, PriceDaily])
+        start = 1_760_000_000
+        record_price_observations([{'external_id': 'MLB1', 'price_cents': 10000, 'old_price_cents': 0, 'observed_at': start},
+                                   {'external_id': 'MLB2', 'price_cents': 5000, 'old_price_cents': 6000, 'observed_at': start}])
+        record_price_observations([{'external_id': 'MLB1', 'price_cents': 9000, 'old_price_cents': 0, 'observed_at': start + 60}])
+        record_price_observations([{'external_id': 'MLB1', 'price_cents': 12000, 'old_price_cents': 0, 'observed_at': start + DAY}])
+
+        assert PriceObservation.select().count() == 4
+        first_day = PriceDaily.get((PriceDaily.external_id == 'MLB1') & (PriceDaily.observations == 2))
+        assert (first_day.min_cents, first_day.max_cents, first_day.last_cents) == (9000, 10000, 9000)
+        assert PriceDaily.select().where(PriceDaily.external_id == 'MLB1').count() == 2
+        assert load_all_time_lows(['MLB1', 'MLB2', 'MLB3']) == {'MLB1': 9000, 'MLB2': 5000}
+
+
+def test_all_time_low_is_reposted_below_threshold():
+    detector = DealChangeDetector(threshold_pct=10, prices={'MLB1': 10000, 'MLB2': 10000})
+    lows = {'MLB1': 9500, 'MLB2': 9000}
+
+    changed = detector.diff([deal_card('1', 93.0), deal_card('2', 92.0)], lows)
+    # 7% drop, below the previous low of 95.00; 8% drop but above the low of 90.00
+    assert [deal.external_id for deal in changed] == ['MLB1']
+    assert changed[0].price_flag == 'all_time_low'
+    assert changed[0].previous_price_cents == 10000
+
+    # Threshold drop that is not a record low
+    detector = DealChangeDetector(threshold_pct=10, prices={'MLB3': 10000})
+    drop = detector.diff([deal_card('3', 85.0)], {'MLB3': 5000})[0]
+    assert drop.price_flag == 'price_drop'
+
+
+def test_repost_line_uses_message_line_breaks():
+    drop = deal_card('4', 85.0)
+    drop.price_flag, drop.previous_price_cents = 'price_drop', 10000
+    message = format_deal_message(drop)
+    assert 'Baixou de R$ 100\\.00*\\n\\n' in message
+    assert '\n' not in message
+
+
+if __name__ == "__main__":
+    test_observations_and_daily_rollup()
+    test_all_time_low_is_reposted_below_threshold()
+    test_repost_line_uses_message_line_breaks()
+    print("✅ Price history tests passed!")
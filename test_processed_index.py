@@ -0,0 +1,62 @@
+"""
+Test script for the in-memory processed-ID index (Bloom filter + SQL confirmation)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database.id_index import BloomFilter, ProcessedIdIndex
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(10_000, 0.01)
+    ids = [f"MLB{i}" for i in range(10_000)]
+    for external_id in ids:
+        bloom.add(external_id)
+
+    assert all(external_id in bloom for external_id in ids)
+    false_positives = sum(f"shp_{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+    # ~9.6 bits per item at 1%
+    assert bloom.memory_bytes < 13_000
+
+
+def test_index_confirms_only_possible_hits():
+    table = {'MLB1', 'MLB2'}
+    confirmed = []
+
+    def confirm(external_id):
+        confirmed.append(external_id)
+        return external_id in table
+
+    index = ProcessedIdIndex(load_ids=lambda: iter(table), confirm=confirm, count_ids=lambda: len(table))
+    assert index.contains('MLB1')
+    assert not index.contains('MLB3')
+    assert 'MLB3' not in confirmed
+
+    table.add('MLB3')
+    index.add('MLB3')
+    assert index.contains('MLB3')
+    assert index.size == 3
+
+
+def test_index_grows_when_full():
+    table = set()
+    index = ProcessedIdIndex(load_ids=lambda: iter(list(table)), confirm=table.__contains__,
+                             count_ids=lambda: len(table))
+    bloom = index.load()
+    for i in range(bloom.capacity + 1):
+        table.add(f"MLB{i}")
+        index.add(f"MLB{i}")
+
+    assert index.size == bloom.capacity + 1
+    assert index.memory_bytes > bloom.memory_bytes
+
+
+if __name__ == "__main__":
+    test_bloom_filter_has_no_false_negatives()
+    test_index_confirms_only_possible_hits()
+    test_index_grows_when_full()
+    print("✅ Processed-ID index tests passed!")
@@ -0,0 +1,62 @@
+"""
+Test script for the CDP resource blocking profiles (fake driver, no Chrome)
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.resource_blocking import (
+    DEFAULT_BLOCKED_PATTERNS, SITE_BLOCKED_PATTERNS, apply_blocking_profile
+)
+
+ML_URL = 'https://lista.mercadolivre.com.br/celulares'
+SHOPEE_URL = 'https://shopee.com.br/search?keyword=fone'
+CONFIG_PATTERNS = {
+    'default': ['*ads.example.com*'],
+    'shopee.com': ['*shopee.com.br/api/v4/recommend*'],
+    'mercadolivre.com': ['*mlstatic.com/frontend-assets*'],
+}
+
+
+class FakeDriver:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.fail:
+            raise RuntimeError('CDP not available')
+        self.commands.append((cmd, params))
+        return {}
+
+
+def blocked_urls(driver):
+    assert [cmd for cmd, _ in driver.commands] == ['Network.enable', 'Network.setBlockedURLs']
+    return driver.commands[1][1]['urls']
+
+
+def test_default_and_site_patterns():
+    driver = FakeDriver()
+    assert apply_blocking_profile(driver, ML_URL)
+    assert blocked_urls(driver) == DEFAULT_BLOCKED_PATTERNS + SITE_BLOCKED_PATTERNS['mercadolivre.com']
+    assert not set(SITE_BLOCKED_PATTERNS['shopee.com']) & set(blocked_urls(driver))
+
+
+def test_config_patterns_are_added_per_site():
+    driver = FakeDriver()
+    assert apply_blocking_profile(driver, SHOPEE_URL, CONFIG_PATTERNS)
+    assert blocked_urls(driver) == (DEFAULT_BLOCKED_PATTERNS + CONFIG_PATTERNS['default']
+                                    + SITE_BLOCKED_PATTERNS['shopee.com'] + CONFIG_PATTERNS['shopee.com'])
+
+
+def test_cdp_failure_is_reported():
+    assert not apply_blocking_profile(FakeDriver(fail=True), ML_URL)
+
+
+if __name__ == "__main__":
+    test_default_and_site_patterns()
+    test_config_patterns_are_added_per_site()
+    test_cdp_failure_is_reported()
+    print("✅ Resource blocking tests passed!")
@@ -0,0 +1,62 @@
+"""
+Test script for hot/cold retention of the deals table (temporary databases)
+"""
+import sys
+import os
+from datetime import timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database.models import (ArchivedDeal, Deal, archive_db, archive_read_db, db, filter_unprocessed,
+                                 archive_summary, get_brazil_time, get_processed_index, is_deal_processed,
+                                 load_archived_deals, save_deals_bulk)
+from src.database.retention import archive_old_deals
+from testing_utils import deal_row, temp_databases
+
+
+def test_old_deals_move_to_archive():
+    with temp_databases():
+        db.create_tables([Deal])
+        archive_db.create_tables([ArchivedDeal])
+        save_deals_bulk([deal_row(f"MLB{i}", days_ago=200) for i in range(1200)] + [deal_row('MLB_NEW', days_ago=1)])
+
+        assert archive_old_deals(90) == 1200
+        assert Deal.select().count() == 1
+        assert ArchivedDeal.select().count() == 1200
+        assert db.execute_sql('PRAGMA auto_vacuum').fetchone()[0] == 2
+        # Nothing left to archive; 0 disables retention
+        assert archive_old_deals(90) == 0
+        assert archive_old_deals(0) == 0
+
+        # Archived IDs are still deduplicated
+        get_processed_index().clear()
+        assert is_deal_processed('MLB5')
+        assert filter_unprocessed(['MLB5', 'MLB_NEW', 'MLB_OTHER']) == ['MLB_OTHER']
+
+        with archive_read_db.connection_context():
+            summary = archive_summary()
+            rows = load_archived_deals(get_brazil_time() - timedelta(days=365), limit=10)
+        assert summary['archived_deals'] == 1200
+        assert len(rows) == 10 and rows[0]['external_id'].startswith('MLB')
+
+
+def test_reused_hot_ids_are_archived():
+    with temp_databases():
+        db.create_tables([Deal])
+        archive_db.create_tables([ArchivedDeal])
+        save_deals_bulk([deal_row('A', days_ago=200), deal_row('B', days_ago=200)])
+        assert archive_old_deals(90) == 2
+
+        # deals.db is empty again, so SQLite hands out ids 1 and 2 once more
+        save_deals_bulk([deal_row('C', days_ago=200), deal_row('D', days_ago=200)])
+        assert sorted(deal.id for deal in Deal.select()) == [1, 2]
+        assert archive_old_deals(90) == 2
+        assert sorted(deal.external_id for deal in ArchivedDeal.select()) == ['A', 'B', 'C', 'D']
+        assert filter_unprocessed(['C', 'D', 'E']) == ['E']
+
+
+if __name__ == "__main__":
+    test_old_deals_move_to_archive()
+    test_reused_hot_ids_are_archived()
+    print("✅ Retention tests passed!")
@@ -0,0 +1,157 @@
+"""
+Test script for the scraper pool: per-domain caps, fetch slots, and HTTP-tier
+pages parsed outside the fetch slot
+"""
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services import scraper_pool
+from src.services.listing_fingerprint import FingerprintStore
+from src.services.scraper_pool import ScraperPool, domain_key
+from src.services.tiered_fetcher import TierCache
+from test_tiered_fetcher import parse_as_ml, start_fixture_server
+
+
+class BlockingParsePool:
+    """Holds the first page's parse until a second page has been fetched."""
+    workers = 2
+
+    def __init__(self):
+        self.second_page_fetched = threading.Event()
+        self.parsed = []
+        self._lock = threading.Lock()
+
+    def parse(self, html, url):
+        with self._lock:
+            first = not self.parsed
+            self.parsed.append(url)
+        if first:
+            # With the fetch slot still held, the other fetch could never start
+            assert self.second_page_fetched.wait(timeout=5), 'fetch slot held during parse'
+        else:
+            self.second_page_fetched.set()
+        return parse_as_ml(html, url)
+
+
+def test_parse_does_not_hold_fetch_slot():
+    server = start_fixture_server()
+    tmp_dir = tempfile.mkdtemp()
+    parse_pool = BlockingParsePool()
+    base = f"http://127.0.0.1:{server.server_port}/ml_listing.html"
+    try:
+        with ScraperPool(workers=1, per_domain_limit=1, browser_manager=object(), parse_pool=parse_pool,
+                         tier_cache=TierCache(os.path.join(tmp_dir, 'tiers.json')),
+                         fingerprints=FingerprintStore(os.path.join(tmp_dir, 'fingerprints.json'))) as pool:
+            pages = list(pool.crawl_all([{'url': f"{base}?a=1"}, {'url': f"{base}?a=2"}],
+                                        is_known=lambda deal: False))
+        assert len(pages) == 2
+        assert all(page['tier'] == 'http' and page['deals'] for _, page in pages)
+    finally:
+        server.shutdown()
+
+
+class FakeHttpTier:
+    """Stands in for fetch_http_tier: records concurrent fetches per domain."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.hooks = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url, tier_cache, fingerprints):
+        key = domain_key(url)
+        with self._lock:
+            self.active[key] = self.active.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+        try:
+            if url in self.hooks:
+                self.hooks[url]()
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.active[key] -= 1
+        # Unchanged pages skip parsing and end the crawl
+        return {'html': '<html></html>', 'tier': 'http', 'deals': [], 'metrics': {}, 'unchanged': True,
+                'fingerprint': None}
+
+
+def make_pool(workers, **kwargs):
+    tmp_dir = tempfile.mkdtemp()
+    return ScraperPool(workers=workers, browser_manager=object(),
+                       tier_cache=TierCache(os.path.join(tmp_dir, 'tiers.json')),
+                       fingerprints=FingerprintStore(os.path.join(tmp_dir, 'fingerprints.json')), **kwargs)
+
+
+def with_fake_http_tier(fake, test):
+    original = scraper_pool.fetch_http_tier
+    scraper_pool.fetch_http_tier = fake
+    try:
+        test()
+    finally:
+        scraper_pool.fetch_http_tier = original
+
+
+def test_domain_key():
+    assert domain_key('https://lista.mercadolivre.com.br/celulares') == 'mercadolivre.com.br'
+    assert domain_key('https://www.mercadolivre.com.br/ofertas') == 'mercadolivre.com.br'
+    assert domain_key('https://shopee.com.br/flash_sale') == 'shopee.com.br'
+    assert domain_key('https://api.example.com/x') == 'example.com'
+
+
+def test_per_domain_limits():
+    fake = FakeHttpTier(delay=0.1)
+    urls = ['https://lista.mercadolivre.com.br/a', 'https://www.mercadolivre.com.br/ofertas',
+            'https://shopee.com.br/search?keyword=a', 'https://shopee.com.br/search?keyword=b',
+            'https://lista.mercadolivre.com.br/b', 'https://shopee.com.br/search?keyword=c']
+
+    def crawl():
+        with make_pool(3, per_domain_limit=2, domain_limits={'shopee.com.br': 1}) as pool:
+            pages = list(pool.crawl_all([{'url': url} for url in urls], is_known=lambda deal: False))
+        assert len(pages) == len(urls)
+
+    with_fake_http_tier(fake, crawl)
+    # lista. and www. share the Mercado Livre cap
+    assert fake.peak == {'mercadolivre.com.br': 2, 'shopee.com.br': 1}
+
+
+def test_saturated_domain_does_not_hold_fetch_slots():
+    fake = FakeHttpTier()
+    ml_fetched = threading.Event()
+    first_shopee = 'https://shopee.com.br/search?keyword=a'
+    ml_url = 'https://lista.mercadolivre.com.br/a'
+    fake.hooks[first_shopee] = lambda: ml_fetched.wait(timeout=5)
+    fake.hooks[ml_url] = ml_fetched.set
+
+    def fetch_all():
+        pool = make_pool(2, domain_limits={'shopee.com.br': 1})
+        first = threading.Thread(target=pool._fetch, args=(first_shopee,))
+        first.start()
+        time.sleep(0.1)
+        # Queued behind the Shopee permit; must not take the second fetch slot
+        second = threading.Thread(target=pool._fetch, args=('https://shopee.com.br/search?keyword=b',))
+        second.start()
+        time.sleep(0.1)
+        pool._fetch(ml_url)
+        assert ml_fetched.is_set()
+        first.join()
+        second.join()
+
+    started = time.monotonic()
+    with_fake_http_tier(fake, fetch_all)
+    assert time.monotonic() - started < 4
+
+
+if __name__ == "__main__":
+    test_parse_does_not_hold_fetch_slot()
+    test_domain_key()
+    test_per_domain_limits()
+    test_saturated_domain_does_not_hold_fetch_slots()
+    print("✅ Scraper pool tests passed!")
@@ -0,0 +1,125 @@
+"""
+Test script for the self-optimizing parser selector cascades
+"""
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from src.services.parser import ML_CARDS, parse_mercadolivre
+from src.services.selector_cascade import (
+    WINNER_SWITCH_STREAK, SelectorCascade, SelectorStats, get_selector_stats, stats_key
+)
+from testing_utils import temp_selector_stats
+
+OLD_LAYOUT = '<ol><li class="old"><h2>Produto</h2></li><li class="old"><h2>Outro</h2></li></ol>'
+NEW_LAYOUT = '<div><div class="new"><h3>Produto</h3></div></div>'
+
+ML_PRICE_HTML = '<div class="poly-price__current"><span class="andes-money-amount__fraction">{}</span></div>'
+# Only the catch-all li[class*="ui-search"] matches these cards
+ML_STACK_PAGE = ('<ol class="ui-search-layout"><li class="ui-search-result__stack">'
+                 '<h2 class="ui-search-item__title">Produto A</h2>'
+                 '<a class="ui-search-link" href="https://produto.mercadolivre.com.br/MLB-111-a">A</a>'
+                 + ML_PRICE_HTML.format(100) + '</li></ol>')
+ML_ITEM_PAGE = ML_STACK_PAGE.replace('ui-search-result__stack', 'ui-search-layout__item')
+# Search filters come before the cards and also match the catch-all
+ML_POLYCARD_PAGE = ('<ul><li class="ui-search-filter-dl">Frete grátis</li></ul>'
+                    '<div id="POLYCARD"><a class="poly-component__title" '
+                    'href="https://produto.mercadolivre.com.br/MLB-222-b">Produto B</a>'
+                    + ML_PRICE_HTML.format(50) + '</div>')
+
+
+def make_stats(tmp_dir):
+    return SelectorStats(os.path.join(tmp_dir, 'selector_stats.json'))
+
+
+def test_winner_is_tried_first_and_persisted():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats = make_stats(tmp_dir)
+        cascade = SelectorCascade('site', 'cards', ('div.new', 'li.old'))
+        key = stats_key('site', 'cards', '*')
+
+        cards, layout = cascade.select(BeautifulSoup(OLD_LAYOUT, 'html.parser'), stats=stats)
+        assert layout == 'li.old' and len(cards) == 2
+        assert cascade._ordered(key, stats) == ('li.old', 'div.new')
+
+        stats.save()
+        reloaded = make_stats(tmp_dir)
+        assert reloaded.winner(key) == 'li.old'
+        assert reloaded.all()[key]['hits'] == {'li.old': 1}
+
+
+def test_layout_change_switches_winner_after_streak():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats = make_stats(tmp_dir)
+        cascade = SelectorCascade('site', 'cards', ('div.new', 'li.old'))
+        key = stats_key('site', 'cards', '*')
+        for _ in range(10):
+            cascade.select(BeautifulSoup(OLD_LAYOUT, 'html.parser'), stats=stats)
+
+        new_page = BeautifulSoup(NEW_LAYOUT, 'html.parser')
+        for _ in range(WINNER_SWITCH_STREAK - 1):
+            cascade.select(new_page, stats=stats)
+        assert stats.winner(key) == 'li.old'
+        cascade.select(new_page, stats=stats)
+        assert stats.winner(key) == 'div.new'
+        assert 'winner_changed_at' in stats.all()[key]
+
+
+def test_misses_and_field_layouts():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats = make_stats(tmp_dir)
+        title = SelectorCascade('site', 'title', ('h3', 'h2'))
+        soup = BeautifulSoup(OLD_LAYOUT, 'html.parser')
+
+        assert title.select_one(soup.select_one('li'), 'li.old', stats=stats).get_text() == 'Produto'
+        assert title.select_one(BeautifulSoup('<p></p>', 'html.parser'), 'li.old', stats=stats) is None
+        entry = stats.all()[stats_key('site', 'title', 'li.old')]
+        assert entry['hits'] == {'h2': 1} and entry['misses'] == 1
+
+
+@temp_selector_stats()
+def test_catch_all_fallbacks_are_never_promoted():
+    stats = get_selector_stats()
+    key = stats_key('mercadolivre', 'cards', '*')
+
+    for _ in range(WINNER_SWITCH_STREAK + 1):
+        assert len(parse_mercadolivre(BeautifulSoup(ML_STACK_PAGE, 'html.parser'))) == 1
+    assert stats.winner(key) is None
+    assert stats.all()[key]['hits'] == {'li[class*="ui-search"]': WINNER_SWITCH_STREAK + 1}
+    assert ML_CARDS._ordered(key, stats)[-len(ML_CARDS.fallbacks):] == ML_CARDS.fallbacks
+
+    # Layout switch after a streak on a specific selector
+    for _ in range(WINNER_SWITCH_STREAK + 1):
+        parse_mercadolivre(BeautifulSoup(ML_ITEM_PAGE, 'html.parser'))
+    assert stats.winner(key) == 'li.ui-search-layout__item'
+    for _ in range(WINNER_SWITCH_STREAK):
+        deals = parse_mercadolivre(BeautifulSoup(ML_POLYCARD_PAGE, 'html.parser'))
+        assert [deal.title for deal in deals] == ['Produto B']
+    assert stats.winner(key) == 'div[id="POLYCARD"]'
+
+
+def test_fallback_deltas_merge_without_promotion():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        worker = SelectorStats(persist=False, track_deltas=True)
+        cascade = SelectorCascade('site', 'cards', ('div.new',), fallbacks=('li',))
+        cascade.select(BeautifulSoup(OLD_LAYOUT, 'html.parser'), stats=worker)
+
+        parent = make_stats(tmp_dir)
+        parent.merge(worker.drain_deltas())
+        key = stats_key('site', 'cards', '*')
+        assert parent.winner(key) is None
+        assert parent.all()[key]['hits'] == {'li': 1}
+
+
+if __name__ == "__main__":
+    test_winner_is_tried_first_and_persisted()
+    test_layout_change_switches_winner_after_streak()
+    test_misses_and_field_layouts()
+    test_catch_all_fallbacks_are_never_promoted()
+    test_fallback_deltas_merge_without_promotion()
+    print("✅ Selector cascade tests passed!")
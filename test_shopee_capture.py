@@ -0,0 +1,81 @@
+"""
+Test script for the Shopee XHR/JSON capture mode (offline, recorded responses)
+"""
+import sys
+import os
+import json
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.page_readiness import NetworkMonitor
+from src.services.shopee_api import (
+    CAPTURE_PATTERNS, collect_json_responses, deals_from_payloads, shopee_price_to_cents
+)
+from src.utils.helpers import extract_product_id
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'shopee_api')
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ReplayDriver:
+    """Replays a recorded CDP performance log and response bodies."""
+
+    def __init__(self):
+        session = load_fixture('recorded_session.json')
+        self.log = session['performance_log']
+        self.bodies = session['response_bodies']
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        assert cmd == 'Network.getResponseBody'
+        with open(os.path.join(FIXTURES_DIR, self.bodies[params['requestId']]), 'r', encoding='utf-8') as f:
+            return {'body': f.read(), 'base64Encoded': False}
+
+
+def test_price_conversion():
+    assert shopee_price_to_cents(2990000) == 2990
+    assert shopee_price_to_cents(None) == 0
+
+
+def test_deals_from_search_payload():
+    deals = deals_from_payloads([load_fixture('search_items.json')])
+
+    assert len(deals) == 3
+    first = deals[0]
+    assert first.new_price == 29.90
+    assert first.old_price == 59.90
+    assert first.image_url.endswith('br-11134207-7r98o-lq1x2y3z4a5b6c')
+    assert extract_product_id(first.original_url) == first.external_id == 'shp_1047271380_22650311071'
+    assert first.old_price_cents == 5990
+    # No discount: old price is not invented
+    assert deals[1].old_price == 0
+
+
+def test_capture_from_recorded_session():
+    driver = ReplayDriver()
+    monitor = NetworkMonitor(driver, capture_patterns=CAPTURE_PATTERNS)
+    monitor.poll(0)
+
+    assert [r['requestId'] for r in monitor.responses] == ['1000.7', '1000.9']
+    assert monitor.requests_blocked == 1
+
+    deals = deals_from_payloads(collect_json_responses(driver, monitor.responses))
+    # 3 search items + 1 new flash sale item (duplicate and zero-price items dropped)
+    assert len(deals) == 4
+    assert deals[-1].title == 'Air Fryer Fritadeira Elétrica 4L'
+    assert deals[-1].new_price == 189.90
+
+
+if __name__ == "__main__":
+    test_price_conversion()
+    test_deals_from_search_payload()
+    test_capture_from_recorded_session()
+    print("✅ Shopee capture tests passed!")
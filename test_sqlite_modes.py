@@ -0,0 +1,62 @@
+"""
+Test script for the SQLite connection modes (WAL writer, read-only pool)
+"""
+import sys
+import os
+import tempfile
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from peewee import OperationalError
+
+from src.database.models import Deal, ReadOnlyDeal, open_database, open_read_pool
+
+
+def test_wal_writer_and_read_only_pool():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'deals.db')
+        writer_db = open_database(path)
+        reader_db = open_read_pool(path, max_connections=2)
+        with Deal.bind_ctx(writer_db), ReadOnlyDeal.bind_ctx(reader_db):
+            try:
+                writer_db.create_tables([Deal])
+                assert writer_db.execute_sql('PRAGMA journal_mode').fetchone()[0] == 'wal'
+                Deal.create(external_id='MLB1', title='Produto', price=10, original_url='u')
+
+                counts = []
+
+                def read():
+                    reader_db.connect(reuse_if_open=True)
+                    try:
+                        counts.append(ReadOnlyDeal.select().count())
+                    finally:
+                        reader_db.close()
+
+                # A reader holding a transaction open does not block the writer
+                with reader_db.connection_context(), reader_db.atomic():
+                    assert ReadOnlyDeal.select().count() == 1
+                    Deal.create(external_id='MLB2', title='Produto', price=10, original_url='u')
+
+                threads = [threading.Thread(target=read) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert counts == [2, 2, 2, 2]
+
+                with reader_db.connection_context():
+                    try:
+                        ReadOnlyDeal.create(external_id='MLB3', title='Produto', price=10, original_url='u')
+                        assert False, 'read pool accepted a write'
+                    except OperationalError:
+                        pass
+            finally:
+                writer_db.close()
+                reader_db.close_all()
+
+
+if __name__ == "__main__":
+    test_wal_writer_and_read_only_pool()
+    print("✅ SQLite mode tests passed!")
@@ -0,0 +1,107 @@
+"""
+Test script for the HTTP-first fetch tier (offline, local fixture server)
+"""
+import sys
+import os
+import tempfile
+import threading
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.parser import extract_deals_from_html
+from testing_utils import temp_selector_stats
+from src.services.tiered_fetcher import (
+    TierCache, fetch_listing, TIER_HTTP, TIER_SELENIUM
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'http_tier')
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_server():
+    handler = partial(QuietHandler, directory=FIXTURES_DIR)
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@temp_selector_stats()
+def parse_as_ml(html, url):
+    # Fixture server URLs are not mercadolivre.com, parse them as ML listings
+    return extract_deals_from_html(html, 'https://lista.mercadolivre.com.br/fixture')
+
+
+class FakeSelenium:
+    def __init__(self):
+        self.calls = []
+
+    def fetch(self, url, driver=None, metrics=None):
+        self.calls.append(url)
+        return '<html>' + 'x' * 200 + '</html>'
+
+
+def run_scenario(page):
+    server = start_fixture_server()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/{page}"
+        cache = TierCache(os.path.join(tempfile.mkdtemp(), 'tiers.json'))
+        selenium = FakeSelenium()
+        drivers = []
+
+        def driver_provider():
+            drivers.append(object())
+            return drivers[-1]
+
+        result = fetch_listing(url, driver_provider, tier_cache=cache,
+                               parse_fn=parse_as_ml, selenium_fetch=selenium.fetch)
+        second = fetch_listing(url, driver_provider, tier_cache=cache,
+                               parse_fn=parse_as_ml, selenium_fetch=selenium.fetch)
+        return result, second, selenium, drivers, cache, url
+    finally:
+        server.shutdown()
+
+
+def test_http_tier_serves_server_rendered_listing():
+    """Cards in the initial HTML: no browser is started"""
+    result, second, selenium, drivers, cache, url = run_scenario('ml_listing.html')
+
+    assert result['tier'] == TIER_HTTP
+    assert len(result['deals']) == 2
+    assert result['deals'][0].new_price == 899.0
+    assert not drivers and not selenium.calls
+    assert cache.preferred_tier(url) == TIER_HTTP
+    assert second['tier'] == TIER_HTTP
+
+
+def test_falls_back_to_selenium_when_no_cards():
+    """Empty JS shell: Selenium is used and remembered for the next run"""
+    result, second, selenium, drivers, cache, url = run_scenario('empty_shell.html')
+
+    assert result['tier'] == TIER_SELENIUM
+    assert result['deals'] is None
+    assert cache.preferred_tier(url) == TIER_SELENIUM
+    # Second run goes straight to Selenium
+    assert second['tier'] == TIER_SELENIUM
+    assert len(selenium.calls) == 2
+
+
+def test_falls_back_to_selenium_on_bot_wall():
+    """Captcha page: treated as blocked even though it returned 200"""
+    result, second, selenium, drivers, cache, url = run_scenario('bot_wall.html')
+
+    assert result['tier'] == TIER_SELENIUM
+    assert selenium.calls[0] == url
+
+
+if __name__ == "__main__":
+    test_http_tier_serves_server_rendered_listing()
+    test_falls_back_to_selenium_when_no_cards()
+    test_falls_back_to_selenium_on_bot_wall()
+    print("✅ Tiered fetcher tests passed!")
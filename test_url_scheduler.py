@@ -0,0 +1,105 @@
+"""
+Test script for the per-URL adaptive polling scheduler (temporary state file)
+"""
+import sys
+import os
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.url_scheduler import UrlScheduler
+
+ML = 'https://lista.mercadolivre.com.br/celulares'
+SHOPEE = 'https://shopee.com.br/flash_sale'
+
+
+def make_scheduler(tmp_dir, url_configs, default_interval_minutes=30):
+    scheduler = UrlScheduler(default_interval_minutes, path=os.path.join(tmp_dir, 'url_schedule.json'))
+    scheduler.sync(url_configs)
+    return scheduler
+
+
+def test_adaptive_interval_halves_and_grows():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        scheduler = make_scheduler(tmp_dir, [{'url': ML, 'interval_minutes': 20, 'adaptive': True}])
+        scheduler.record_run(ML, new_deals=3)
+        assert scheduler.interval_minutes(ML) == 10
+        scheduler.record_run(ML, new_deals=0)
+        assert scheduler.interval_minutes(ML) == 15
+        assert 14 * 60 < scheduler.seconds_until_next() <= 15 * 60
+
+        # Learned interval and yield survive a restart
+        reloaded = make_scheduler(tmp_dir, [{'url': ML, 'interval_minutes': 20, 'adaptive': True}])
+        assert reloaded.interval_minutes(ML) == 15
+        state = reloaded.store.get(ML)
+        assert state['runs'] == 2 and state['total_new_deals'] == 3 and state['last_new_deals'] == 0
+
+
+def test_adaptive_interval_clamps():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Defaults: base / 4 and base * 4
+        scheduler = make_scheduler(tmp_dir, [{'url': ML, 'interval_minutes': 20, 'adaptive': True}])
+        for _ in range(5):
+            scheduler.record_run(ML, new_deals=1)
+        assert scheduler.interval_minutes(ML) == 5
+        for _ in range(10):
+            scheduler.record_run(ML, new_deals=0)
+        assert scheduler.interval_minutes(ML) == 80
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        scheduler = make_scheduler(tmp_dir, [{'url': ML, 'interval_minutes': 20, 'adaptive': True,
+                                              'min_interval_minutes': 8, 'max_interval_minutes': 30}])
+        for _ in range(3):
+            scheduler.record_run(ML, new_deals=1)
+        assert scheduler.interval_minutes(ML) == 8
+        for _ in range(5):
+            scheduler.record_run(ML, new_deals=0)
+        assert scheduler.interval_minutes(ML) == 30
+
+
+def test_fixed_interval_urls_keep_base():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        scheduler = make_scheduler(tmp_dir, [{'url': ML, 'interval_minutes': 20}, {'url': SHOPEE}],
+                                   default_interval_minutes=45)
+        scheduler.record_run(ML, new_deals=5)
+        scheduler.record_run(SHOPEE, new_deals=0)
+        assert scheduler.interval_minutes(ML) == 20
+        assert scheduler.interval_minutes(SHOPEE) == 45
+
+
+def test_make_all_due_skips_stale_entries():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        scheduler = make_scheduler(tmp_dir, [{'url': ML}, {'url': SHOPEE}])
+        # New URLs are due immediately
+        assert {config['url'] for config in scheduler.pop_due()} == {ML, SHOPEE}
+        scheduler.record_run(ML, new_deals=0)
+        scheduler.record_run(SHOPEE, new_deals=0)
+        assert scheduler.pop_due() == []
+
+        scheduler.make_all_due()
+        assert sorted(config['url'] for config in scheduler.pop_due()) == sorted([ML, SHOPEE])
+        # The entries pushed by record_run are stale now
+        assert scheduler.pop_due(time.time() + 24 * 3600) == []
+        assert scheduler.seconds_until_next() is None
+
+
+def test_sync_drops_removed_urls():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        scheduler = make_scheduler(tmp_dir, [{'url': ML}, {'url': SHOPEE}])
+        scheduler.sync([{'url': ML}])
+        assert [config['url'] for config in scheduler.pop_due()] == [ML]
+
+        # A removed URL is not rescheduled by a late record_run
+        scheduler.record_run(SHOPEE, new_deals=2)
+        assert scheduler.pop_due(time.time() + 24 * 3600) == []
+
+
+if __name__ == "__main__":
+    test_adaptive_interval_halves_and_grows()
+    test_adaptive_interval_clamps()
+    test_fixed_interval_urls_keep_base()
+    test_make_all_due_skips_stale_entries()
+    test_sync_drops_removed_urls()
+    print("✅ URL scheduler tests passed!")
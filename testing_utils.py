@@ -0,0 +1,76 @@
+"""
+Shared helpers for the test scripts.
+State files and databases live in temporary directories so no test writes under data/.
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database import models
+from src.database.models import (archive_db, archive_read_db, db, get_brazil_time, get_processed_index,
+                                 open_read_pool, read_db)
+from src.services.deal_record import DealRecord
+from src.services.selector_cascade import SelectorStats, set_selector_stats
+
+
+@contextmanager
+def temp_selector_stats():
+    """Points the shared selector stats at a temporary file (also usable as a test decorator)."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats = SelectorStats(os.path.join(tmp_dir, 'selector_stats.json'))
+        previous = set_selector_stats(stats)
+        try:
+            yield stats
+        finally:
+            set_selector_stats(previous)
+
+
+def _init_databases(hot_path: str, archive_path: str):
+    db.init(hot_path)
+    read_db.init(open_read_pool(hot_path).database)
+    archive_db.init(archive_path)
+    archive_read_db.init(open_read_pool(archive_path).database)
+    get_processed_index().clear()
+
+
+@contextmanager
+def temp_databases():
+    """
+    Points the hot and archive databases (and their read pools) at a temporary directory.
+
+    Tables are not created; tests call create_tables or migrate themselves.
+    The data/ paths and an empty processed-ID index are restored on exit.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _init_databases(os.path.join(tmp_dir, 'deals.db'), os.path.join(tmp_dir, 'deals_archive.db'))
+        try:
+            yield tmp_dir
+        finally:
+            db.close()
+            archive_db.close()
+            read_db.close_all()
+            archive_read_db.close_all()
+            _init_databases(models.db_path, models.archive_db_path)
+
+
+def deal_row(external_id: str, price: float = 10.0, old_price: float = 0, days_ago: int = None) -> dict:
+    """Keyword arguments for save_deal / save_deals_bulk; days_ago backdates sent_at."""
+    deal = DealRecord.create(f"Produto {external_id}", price, f"https://produto.mercadolivre.com.br/{external_id}",
+                             old_price)
+    row = {'external_id': external_id, 'title': deal.title, 'price': deal.new_price,
+           'original_url': deal.original_url, 'old_price': deal.old_price if deal.discount_pct else None,
+           'discount_pct': deal.discount_pct or None}
+    if days_ago is not None:
+        row['sent_at'] = get_brazil_time() - timedelta(days=days_ago)
+    return row
+
+
+def deal_card(product_id: str, price: float) -> DealRecord:
+    """Listing card for MLB-<product_id>."""
+    return DealRecord.create(f"Produto {product_id}", price,
+                             f"https://produto.mercadolivre.com.br/MLB-{product_id}-produto")